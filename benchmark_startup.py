@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Cold-start cost of the sfanalytics CLI (python benchmark_startup.py). Each
+# case runs in a fresh interpreter under -X importtime; the report shows wall
+# time, modules imported, and which heavy dependencies got loaded. --help and
+# --no-charts runs must not import matplotlib or seaborn (exit status 1 if
+# they do). The last row is the eager import block the scripts used to have.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HEAVY = ["pandas", "numpy", "pyarrow", "matplotlib", "seaborn", "yfinance", "kagglehub", "requests", "lxml"]
+FORBIDDEN = {"matplotlib", "seaborn"}
+
+
+def import_profile(args):
+    """(wall seconds, total import seconds, set of top-level packages imported) for one run."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + args, cwd=ROOT, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{proc.stderr[-2000:]}")
+    total, packages = 0, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        packages.add(name.strip().split(".")[0])
+        # Nested imports are indented under their parent; count outermost ones only
+        if len(name) - len(name.lstrip()) == 1:
+            total += int(cumulative)
+    return elapsed, total / 1e6, packages
+
+
+if __name__ == "__main__":
+    output_dir = tempfile.mkdtemp()
+    cases = [
+        ("--help", ["-m", "sfanalytics", "--help"], True),
+        ("stocks --help", ["-m", "sfanalytics", "stocks", "--help"], True),
+        ("cbb-eligible --help", ["-m", "sfanalytics", "cbb-eligible", "--help"], True),
+        ("nfl --no-charts", ["-m", "sfanalytics", "nfl", "--no-charts", "--output-dir", output_dir], True),
+        ("eager imports", ["-c", "import pandas, matplotlib.pyplot, requests"], False),
+    ]
+    failed = False
+    print(f"{'case':<22} {'wall (s)':>8} {'imports (s)':>11} {'packages':>8}  heavy")
+    for label, args, checked in cases:
+        elapsed, total, packages = import_profile(args)
+        heavy = [name for name in HEAVY if name in packages]
+        print(f"{label:<22} {elapsed:>8.2f} {total:>11.2f} {len(packages):>8}  "
+              f"{', '.join(heavy) or '-'}")
+        if checked and FORBIDDEN & set(heavy):
+            print(f"  FAIL: {label} imported {', '.join(sorted(FORBIDDEN & set(heavy)))}")
+            failed = True
+    sys.exit(1 if failed else 0)
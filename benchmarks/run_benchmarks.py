@@ -0,0 +1,405 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for folder in ("nfl_outcomes", "ncaa_basketball", os.path.join("ncaa_basketball", "tournament_prediction", "kenpom"),
+               "stock_trends"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+sys.path.insert(0, HERE)
+
+import numpy as np
+
+import synthetic
+
+# Offline benchmark suite: every analysis path on deterministic synthetic
+# inputs at 1x, 10x and 100x the size of the repo's real data, timed (best of
+# --repeat runs, a single run once one takes over 5 s) and traced for peak
+# Python/numpy memory (one tracemalloc run; Arrow buffers are not counted).
+# Results are compared with baselines.json; a case more than --time-tolerance
+# slower or --memory-tolerance larger than its baseline is measured again up to
+# --confirm times (a busy machine slows one batch of runs, not every batch) and
+# fails the run only if the best of all its runs is still over.
+#
+#   python benchmarks/run_benchmarks.py                      # all cases, 1x 10x 100x
+#   python benchmarks/run_benchmarks.py nfl_elo --scales 1   # one case
+#   python benchmarks/run_benchmarks.py --update-baselines   # record this machine's numbers
+#
+# Baselines are machine-specific: record them on the machine that runs the check.
+
+BASELINES = os.path.join(HERE, "baselines.json")
+SCALES = [1, 10, 100]
+# Differences below these are noise, whatever the relative change
+MIN_TIME_DELTA_S = 0.05
+MIN_MEMORY_DELTA_MB = 2.0
+SINGLE_RUN_S = 5.0
+
+
+# Each case is prepare(scale, workdir) -> data, built outside the measurement,
+# and run(data, tmpdir), measured; tmpdir is a fresh empty directory per run
+# so caches are always built from scratch.
+
+def _nfl_files(scale, workdir):
+    teams_csv = os.path.join(workdir, "nfl_teams.csv")
+    scores_csv = os.path.join(workdir, "spreadspoke_scores.csv")
+    synthetic.nfl_teams(32 * scale).to_csv(teams_csv, index=False)
+    synthetic.nfl_scores(32 * scale).to_csv(scores_csv, index=False)
+    return teams_csv, scores_csv
+
+
+def _loaded_nfl(scale, workdir):
+    from nfl_franchises import franchise_index
+    from nfl_score_cache import read_scores_csv
+
+    teams_csv, scores_csv = _nfl_files(scale, workdir)
+    return franchise_index(teams_csv, scores_csv, cache_dir=workdir), read_scores_csv(scores_csv)
+
+
+def prepare_nfl_load(scale, workdir):
+    return _nfl_files(scale, workdir)[1]
+
+
+def run_nfl_load(scores_csv, tmpdir):
+    from nfl_score_cache import load_scores
+
+    return load_scores(scores_csv, min_season=2018, cache_dir=os.path.join(tmpdir, "cache"))
+
+
+def prepare_nfl_outcomes(scale, workdir):
+    return _loaded_nfl(scale, workdir)[1]
+
+
+def run_nfl_outcomes(df, tmpdir):
+    from nfl_game_outcomes import compute_outcomes, home_field_summary, team_win_table
+
+    outcomes = compute_outcomes(df)
+    return home_field_summary(outcomes, include_neutral=True), team_win_table(outcomes)
+
+
+def prepare_nfl_franchises(scale, workdir):
+    from nfl_score_cache import read_scores_csv
+
+    teams_csv, scores_csv = _nfl_files(scale, workdir)
+    return teams_csv, scores_csv, read_scores_csv(scores_csv)
+
+
+def run_nfl_franchises(data, tmpdir):
+    from nfl_franchises import franchise_index
+
+    teams_csv, scores_csv, df = data
+    # Build and persist the index, then map both team columns through it
+    index = franchise_index(teams_csv, scores_csv, cache_dir=tmpdir)
+    return index.categorical(df["team_home"]), index.categorical(df["team_away"])
+
+
+def prepare_nfl_run(scale, workdir):
+    return _nfl_files(scale, workdir)
+
+
+def run_nfl_run(files, tmpdir):
+    from nfl_analysis import run
+
+    # Linked into the fresh directory so the score cache and team index are built from scratch
+    teams_csv, scores_csv = [os.path.join(tmpdir, os.path.basename(path)) for path in files]
+    for source, link in zip(files, (teams_csv, scores_csv)):
+        os.link(source, link)
+    return run(charts=False, output_dir=tmpdir, csv_path=scores_csv, teams_csv=teams_csv)
+
+
+def prepare_nfl_run_cached(scale, workdir):
+    from nfl_analysis import run
+
+    files = _nfl_files(scale, workdir)
+    with contextlib.redirect_stdout(io.StringIO()):
+        run(charts=False, output_dir=workdir, csv_path=files[1], teams_csv=files[0])
+    return files
+
+
+def run_nfl_run_cached(files, tmpdir):
+    from nfl_analysis import run
+
+    teams_csv, scores_csv = files
+    return run(charts=False, output_dir=tmpdir, csv_path=scores_csv, teams_csv=teams_csv)
+
+
+def prepare_nfl_backtest(scale, workdir):
+    from nfl_backtest import grid_rules
+
+    team_index, df = _loaded_nfl(scale, workdir)
+    rules = grid_rules(["under", "over", "home_ats"], mins={"wind_mph": range(0, 20, 2)},
+                       maxs={"temperature": range(20, 100, 10)})
+    return team_index, df, rules
+
+
+def run_nfl_backtest(data, tmpdir):
+    from nfl_backtest import backtest, settle_games
+
+    team_index, df, rules = data
+    return backtest(settle_games(df, team_index), rules, workers=1)
+
+
+def prepare_nfl_elo(scale, workdir):
+    return _loaded_nfl(scale, workdir)
+
+
+def run_nfl_elo(data, tmpdir):
+    from nfl_elo import prepare_games, run_elo
+
+    team_index, df = data
+    return run_elo(prepare_games(df, team_index))
+
+
+def prepare_cbb_datasets(scale, workdir):
+    return synthetic.write_kaggle_dataset(os.path.join(workdir, "kaggle"), n_seasons=scale)
+
+
+def run_cbb_datasets(source, tmpdir):
+    from cbb_datasets import KENPOM_SUMMARY_FILE, MARCH_MADNESS_FILE, load_table
+
+    kwargs = {"cache_dir": tmpdir, "downloader": lambda handle: source}
+    return load_table(MARCH_MADNESS_FILE, **kwargs), load_table(KENPOM_SUMMARY_FILE, **kwargs)
+
+
+def prepare_cbb_upsets(scale, workdir):
+    mm = synthetic.march_madness_table(n_seasons=scale)
+    return mm[mm["Post-Season Tournament"] == "March Madness"].rename(columns={"Mapped ESPN Team Name": "School"})
+
+
+def run_cbb_upsets(field, tmpdir):
+    from cbb_upset_rules import evaluate_upsets
+
+    return evaluate_upsets(field)
+
+
+def prepare_cbb_eligible(scale, workdir):
+    return synthetic.kenpom_summary(n_seasons=scale)
+
+
+def run_cbb_eligible(df, tmpdir):
+    from cbb_kenpom_prediction import eligible_teams, prepare_ratings
+
+    return eligible_teams(prepare_ratings(df))
+
+
+def prepare_cbb_screener(scale, workdir):
+    df = synthetic.kenpom_summary(n_seasons=scale)
+    # Stand-in champions: the best AdjEM team of each season
+    champions = df[df["RankAdjEM"] == 1].set_index("Season")["TeamName"].to_dict()
+    return df, champions
+
+
+def run_cbb_screener(data, tmpdir):
+    from cbb_kenpom_screener import RankIndex, summarize
+
+    df, champions = data
+    return summarize(*RankIndex(df).sweep(champions))
+
+
+def prepare_cbb_stats_page(scale, workdir):
+    return synthetic.stats_page(synthetic.D1_TEAMS * scale).encode("utf-8")
+
+
+def run_cbb_stats_page(html, tmpdir):
+    from cbb_stats_table import OFFENSIVE_STATS, parse_stats_table, stats_frame
+
+    return stats_frame(parse_stats_table(html, stats=list(OFFENSIVE_STATS)), OFFENSIVE_STATS)
+
+
+def prepare_cbb_bracket(scale, workdir):
+    mm = synthetic.march_madness_table(n_seasons=1)
+    field = mm[mm["Post-Season Tournament"] == "March Madness"]
+    return field.rename(columns={"Mapped ESPN Team Name": "School"}), 10_000 * scale
+
+
+def run_cbb_bracket(data, tmpdir):
+    from cbb_bracket_simulator import simulate_tournament
+
+    field, n_sims = data
+    return simulate_tournament(field, synthetic.REGIONS, n_sims=n_sims, seed=0, workers=1)
+
+
+def prepare_stock_store(scale, workdir):
+    # 1x is one ticker over the 2023-2025 window stock_analysis.py uses
+    return synthetic.ohlcv(scale, 540, start="2023-01-02")
+
+
+def run_stock_store(frame, tmpdir):
+    from price_store import PriceStore
+
+    def downloader(tickers, start, end):
+        return frame.loc[start:end, (slice(None), list(tickers))]
+
+    tickers = list(frame["Close"].columns)
+    store = PriceStore(os.path.join(tmpdir, "prices"))
+    store.refresh(tickers, "2023-01-01", "2025-02-23", downloader=downloader)
+    return store.frame("Close", tickers)
+
+
+def prepare_stock_engine(scale, workdir):
+    return synthetic.ohlcv(scale, 540, start="2023-01-02")["Close"]
+
+
+def run_stock_engine(prices, tmpdir):
+    from stock_engine import analyze
+
+    return analyze(prices)
+
+
+def prepare_stock_streaming(scale, workdir):
+    prices = synthetic.ohlcv(scale, 540, start="2023-01-02")["Close"]
+    n_days, n_symbols = prices.shape
+    symbols = np.tile(np.arange(n_symbols), n_days)
+    return list(prices.columns), symbols, prices.to_numpy().ravel()
+
+
+def run_stock_streaming(data, tmpdir):
+    from stock_streaming import OnlineIndicators
+
+    columns, symbols, ticks = data
+    online = OnlineIndicators(columns)
+    for i in range(0, len(ticks), 1000):
+        online.update(symbols[i:i + 1000], ticks[i:i + 1000])
+    return online.snapshot()
+
+
+CASES = {
+    "nfl_load": (prepare_nfl_load, run_nfl_load),
+    "nfl_run": (prepare_nfl_run, run_nfl_run),
+    "nfl_run_cached": (prepare_nfl_run_cached, run_nfl_run_cached),
+    "nfl_outcomes": (prepare_nfl_outcomes, run_nfl_outcomes),
+    "nfl_franchises": (prepare_nfl_franchises, run_nfl_franchises),
+    "nfl_backtest": (prepare_nfl_backtest, run_nfl_backtest),
+    "nfl_elo": (prepare_nfl_elo, run_nfl_elo),
+    "cbb_datasets": (prepare_cbb_datasets, run_cbb_datasets),
+    "cbb_upsets": (prepare_cbb_upsets, run_cbb_upsets),
+    "cbb_eligible": (prepare_cbb_eligible, run_cbb_eligible),
+    "cbb_screener": (prepare_cbb_screener, run_cbb_screener),
+    "cbb_stats_page": (prepare_cbb_stats_page, run_cbb_stats_page),
+    "cbb_bracket": (prepare_cbb_bracket, run_cbb_bracket),
+    "stock_store": (prepare_stock_store, run_stock_store),
+    "stock_engine": (prepare_stock_engine, run_stock_engine),
+    "stock_streaming": (prepare_stock_streaming, run_stock_streaming),
+}
+
+
+def _fresh_dir(workdir):
+    return tempfile.mkdtemp(dir=workdir)
+
+
+def measure(name, scale, repeat=3):
+    """{"time_s": best wall time, "peak_mb": tracemalloc peak} for one case at one scale."""
+    prepare, run = CASES[name]
+    workdir = tempfile.mkdtemp(prefix=f"bench-{name}-")
+    try:
+        data = prepare(scale, workdir)
+        times = []
+        # Scripts print progress; keep the benchmark table readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                tmpdir = _fresh_dir(workdir)
+                start = time.perf_counter()
+                run(data, tmpdir)
+                times.append(time.perf_counter() - start)
+                shutil.rmtree(tmpdir, ignore_errors=True)
+                # Long runs are stable enough to time once
+                if times[-1] > SINGLE_RUN_S:
+                    break
+
+            tmpdir = _fresh_dir(workdir)
+            tracemalloc.start()
+            try:
+                run(data, tmpdir)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {"time_s": round(min(times), 4), "peak_mb": round(peak / 1e6, 2)}
+
+
+def best_of(first, second):
+    return {key: min(first[key], second[key]) for key in first}
+
+
+def check(result, baseline, time_tolerance, memory_tolerance):
+    """Regression messages for one measurement against its baseline."""
+    problems = []
+    limit = baseline["time_s"] * (1 + time_tolerance)
+    if result["time_s"] > limit and result["time_s"] - baseline["time_s"] > MIN_TIME_DELTA_S:
+        problems.append(f"time {result['time_s']:.3f} s > {limit:.3f} s")
+    limit = baseline["peak_mb"] * (1 + memory_tolerance)
+    if result["peak_mb"] > limit and result["peak_mb"] - baseline["peak_mb"] > MIN_MEMORY_DELTA_MB:
+        problems.append(f"peak {result['peak_mb']:.1f} MB > {limit:.1f} MB")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmark suite on synthetic data.")
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="allowed slowdown (0.5 = 50%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="allowed peak memory growth")
+    parser.add_argument("--confirm", type=int, default=2, help="re-measurements before a regression counts")
+    parser.add_argument("--baselines", default=BASELINES)
+    parser.add_argument("--update-baselines", action="store_true", help="store these results as the baselines")
+    parser.add_argument("--output", help="also write the results as JSON")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    try:
+        with open(args.baselines) as f:
+            baselines = json.load(f)
+    except OSError:
+        baselines = {}
+
+    results, failures = {}, []
+    print(f"{'case':<16} {'scale':>5} {'time (s)':>9} {'base (s)':>9} {'peak MB':>9} {'base MB':>9}  status")
+    for name in args.cases or list(CASES):
+        for scale in args.scales:
+            key = f"{name}@{scale}x"
+            result = results[key] = measure(name, scale, args.repeat)
+            baseline = baselines.get(key)
+            if baseline is None:
+                status = "new"
+            else:
+                problems = check(result, baseline, args.time_tolerance, args.memory_tolerance)
+                for _ in range(args.confirm if problems else 0):
+                    result = results[key] = best_of(result, measure(name, scale, args.repeat))
+                    problems = check(result, baseline, args.time_tolerance, args.memory_tolerance)
+                    if not problems:
+                        break
+                failures += [f"{key}: {problem}" for problem in problems]
+                status = "REGRESSION" if problems else "ok"
+            base_time = f"{baseline['time_s']:.3f}" if baseline else "-"
+            base_peak = f"{baseline['peak_mb']:.1f}" if baseline else "-"
+            print(f"{name:<16} {scale:>4}x {result['time_s']:>9.3f} {base_time:>9} "
+                  f"{result['peak_mb']:>9.1f} {base_peak:>9}  {status}", flush=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baselines:
+        baselines.update(results)
+        with open(args.baselines, "w") as f:
+            json.dump(dict(sorted(baselines.items())), f, indent=2)
+            f.write("\n")
+        print(f"Baselines updated: {args.baselines}")
+        return 0
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
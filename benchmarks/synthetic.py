@@ -0,0 +1,218 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Deterministic synthetic inputs shaped like the repo's real data files, for
+# benchmarks that must run offline. Every generator takes a seed and returns
+# the same output for the same arguments.
+#
+#   nfl_scores / nfl_teams     spreadspoke_scores.csv / nfl_teams.csv
+#   march_madness_table        DEV _ March Madness.csv
+#   kenpom_summary             INT _ KenPom _ Summary.csv
+#   stats_page                 a sports-reference advanced school stats page
+#   ohlcv                      a yfinance download, (field, ticker) columns
+
+FIRST_SEASON, LAST_SEASON = 1966, 2025
+REGULAR_WEEKS = 17
+PLAYOFF_WEEKS = ["Wildcard", "Division", "Conference", "Superbowl"]
+REGIONS = ["South", "West", "East", "Midwest"]
+D1_TEAMS = 364
+
+
+def nfl_teams(n_teams):
+    """nfl_teams.csv-shaped franchise table with team_id T0000, T0001, ..."""
+    ids = [f"T{i:04d}" for i in range(n_teams)]
+    return pd.DataFrame({
+        "team_name": [f"City{i} Team{i}" for i in range(n_teams)],
+        "team_name_short": [f"Team{i}" for i in range(n_teams)],
+        "team_id": ids,
+        "team_id_pfr": ids,
+        "team_conference": np.where(np.arange(n_teams) % 2, "NFC", "AFC"),
+        "team_division": [f"Division {i % 8}" for i in range(n_teams)],
+        "team_conference_pre2002": np.where(np.arange(n_teams) % 2, "NFC", "AFC"),
+        "team_division_pre2002": [f"Division {i % 6}" for i in range(n_teams)],
+    })
+
+
+def nfl_scores(n_teams=32, seed=0, first_season=FIRST_SEASON, last_season=LAST_SEASON):
+    """spreadspoke_scores.csv-shaped games: every team plays once a week for
+    17 weeks, then a shrinking playoff bracket. Lines start in 1979, like the
+    real file. 32 teams give about 16k games; rows grow linearly with n_teams.
+    """
+    rng = np.random.default_rng(seed)
+    teams = nfl_teams(n_teams)
+    names, ids = teams["team_name"].to_numpy(), teams["team_id"].to_numpy()
+    frames = []
+    for season in range(first_season, last_season + 1):
+        kickoff = np.datetime64(f"{season}-09-07")
+        weeks = [(str(w), False, n_teams // 2) for w in range(1, REGULAR_WEEKS + 1)]
+        weeks += [(w, True, max(1, n_teams // 2 >> (i + 2))) for i, w in enumerate(PLAYOFF_WEEKS)]
+        for w, (week, playoff, n_games) in enumerate(weeks):
+            order = rng.permutation(n_teams)[:2 * n_games]
+            frames.append(pd.DataFrame({
+                "date": kickoff + np.int64(7 * w) + rng.integers(0, 3, n_games),
+                "schedule_season": season,
+                "schedule_week": week,
+                "schedule_playoff": playoff,
+                "home": order[:n_games],
+                "away": order[n_games:],
+            }))
+    games = pd.concat(frames, ignore_index=True)
+    n = len(games)
+
+    strength = rng.normal(0, 4, n_teams)
+    expected = strength[games["home"]] - strength[games["away"]] + 2.5
+    margin = np.round(expected + rng.normal(0, 13, n)).astype(int)
+    total = np.clip(np.round(rng.normal(43, 10, n)), 3, 90).astype(int)
+    score_home = np.clip((total + margin) // 2, 0, None)
+    score_away = np.clip(total - score_home, 0, None)
+
+    has_line = games["schedule_season"].to_numpy() >= 1979
+    spread = np.round(np.abs(expected + rng.normal(0, 2, n)) * 2) / 2
+    favorite = np.where(expected >= 0, ids[games["home"]], ids[games["away"]]).astype(object)
+    favorite[spread == 0] = "PICK"
+    dome = games["home"].to_numpy() % 5 == 0
+    dates = pd.DatetimeIndex(games["date"])
+
+    return pd.DataFrame({
+        "schedule_date": [f"{m}/{d}/{y}" for m, d, y in zip(dates.month, dates.day, dates.year)],
+        "schedule_season": games["schedule_season"],
+        "schedule_week": games["schedule_week"],
+        "schedule_playoff": np.where(games["schedule_playoff"], "TRUE", "FALSE"),
+        "team_home": names[games["home"]],
+        "score_home": score_home,
+        "score_away": score_away,
+        "team_away": names[games["away"]],
+        "team_favorite_id": np.where(has_line, favorite, None),
+        "spread_favorite": np.where(has_line, -spread, np.nan),
+        "over_under_line": np.where(has_line, np.round(rng.normal(44, 5, n) * 2) / 2, np.nan),
+        "stadium": [f"Stadium {h}" for h in games["home"]],
+        "stadium_neutral": np.where(games["schedule_week"] == "Superbowl", "TRUE", "FALSE"),
+        "weather_temperature": np.where(dome, 72, np.round(rng.normal(55, 18, n))),
+        "weather_wind_mph": np.where(dome, 0, np.round(np.abs(rng.normal(8, 6, n)))),
+        "weather_humidity": np.where(dome, np.nan, np.round(rng.uniform(20, 100, n))),
+        "weather_detail": np.where(dome, "DOME", np.where(rng.random(n) < 0.1, "Rain", None)),
+    })
+
+
+def _ranks(rng, n):
+    return rng.permutation(n) + 1
+
+
+def march_madness_table(n_seasons, n_teams=D1_TEAMS, seed=0, last_season=LAST_SEASON):
+    """DEV _ March Madness.csv-shaped table: every D1 team per season, 68 of
+    them in the tournament (four regions of seeds 1-16 plus four First Four
+    teams on the 11 and 16 lines), seeded by AdjEM rank."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for season in range(last_season - n_seasons + 1, last_season + 1):
+        em_rank = _ranks(rng, n_teams)
+        adj_em = np.sort(rng.normal(0, 11, n_teams))[::-1][em_rank - 1]
+        oe_rank = np.argsort(np.argsort(em_rank + rng.normal(0, 30, n_teams))) + 1
+        de_rank = np.argsort(np.argsort(em_rank + rng.normal(0, 30, n_teams))) + 1
+
+        seed_line = np.full(n_teams, np.nan)
+        region = np.full(n_teams, None, dtype=object)
+        # The top 64 by AdjEM fill the s-curve; the next four are First Four duplicates
+        by_em = np.argsort(em_rank)
+        for i, team in enumerate(by_em[:64]):
+            seed_line[team] = i // 4 + 1
+            region[team] = REGIONS[i % 4 if (i // 4) % 2 == 0 else 3 - i % 4]
+        for i, team in enumerate(by_em[64:68]):
+            seed_line[team] = 11 if i < 2 else 16
+            region[team] = REGIONS[i]
+        in_field = ~np.isnan(seed_line)
+        post_season = np.where(in_field, "March Madness",
+                               np.where(em_rank <= 100, "NIT", None)).astype(object)
+
+        frames.append(pd.DataFrame({
+            "Season": season,
+            "Mapped ESPN Team Name": [f"School {i}" for i in range(n_teams)],
+            "Mapped Conference Name": [f"Conference {i % 32}" for i in range(n_teams)],
+            "Post-Season Tournament": post_season,
+            "Seed": seed_line,
+            "Region": region,
+            "AdjEM": np.round(adj_em, 2),
+            "RankAdjEM": em_rank,
+            "AdjOE": np.round(105 + adj_em / 2 + rng.normal(0, 2, n_teams), 1),
+            "RankAdjOE": oe_rank,
+            "AdjDE": np.round(105 - adj_em / 2 + rng.normal(0, 2, n_teams), 1),
+            "RankAdjDE": de_rank,
+            "AdjTempo": np.round(rng.normal(68, 3, n_teams), 1),
+            "RankAdjTempo": _ranks(rng, n_teams),
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def kenpom_summary(n_seasons, n_teams=D1_TEAMS, seed=0, last_season=LAST_SEASON):
+    """INT _ KenPom _ Summary.csv-shaped table (one row per team and season)."""
+    mm = march_madness_table(n_seasons, n_teams, seed, last_season)
+    return mm.rename(columns={"Mapped ESPN Team Name": "TeamName"})[
+        ["Season", "TeamName", "AdjTempo", "RankAdjTempo", "AdjOE", "RankAdjOE",
+         "AdjDE", "RankAdjDE", "AdjEM", "RankAdjEM"]]
+
+
+def write_kaggle_dataset(directory, n_seasons, n_teams=D1_TEAMS, seed=0):
+    """Write both CBB dataset files into directory, as a downloader(handle) stand-in would."""
+    from cbb_datasets import KENPOM_SUMMARY_FILE, MARCH_MADNESS_FILE
+
+    os.makedirs(directory, exist_ok=True)
+    march_madness_table(n_seasons, n_teams, seed).to_csv(os.path.join(directory, MARCH_MADNESS_FILE), index=False)
+    kenpom_summary(n_seasons, n_teams, seed).to_csv(os.path.join(directory, KENPOM_SUMMARY_FILE), index=False)
+    return directory
+
+
+# Advanced school stats columns after school_name, as on sports-reference
+STAT_COLUMNS = ["g", "wins", "losses", "win_loss_pct", "srs", "sos", "wins_conf", "losses_conf", "pace",
+                "off_rtg", "fta_per_fga_pct", "fg3a_per_fga_pct", "ts_pct", "trb_pct", "ast_pct", "stl_pct",
+                "blk_pct", "efg_pct", "tov_pct", "orb_pct", "ft_rate"]
+
+
+def stats_page(n_rows, table_id="adv_school_stats", seed=0, header_every=20, commented=False):
+    """HTML of a sports-reference stats page with n_rows team rows, an
+    over_header row, a repeated thead row every header_every rows and page
+    chrome around the table. commented=True hides the table in an HTML
+    comment, as sports-reference does for secondary tables."""
+    rng = np.random.default_rng(seed)
+    values = rng.uniform(0, 1, size=(n_rows, len(STAT_COLUMNS)))
+    header = "".join(f'<th aria-label="{c}" data-stat="{c}" scope="col">{c}</th>' for c in STAT_COLUMNS)
+    thead_row = f'<tr class="thead"><th data-stat="ranker">Rk</th><th data-stat="school_name">School</th>{header}</tr>'
+    rows = []
+    for i in range(n_rows):
+        if i and i % header_every == 0:
+            rows.append(thead_row)
+        cells = "".join(f'<td class="right " data-stat="{c}">{v:.3f}</td>' for c, v in zip(STAT_COLUMNS, values[i]))
+        rows.append(f'<tr><th scope="row" class="right " data-stat="ranker">{i + 1}</th>'
+                    f'<td class="left " data-stat="school_name"><a href="/cbb/schools/school-{i}/">School {i}</a>'
+                    f'&nbsp;<strong>NCAA</strong></td>{cells}</tr>')
+    table = (f'<table class="sortable stats_table" id="{table_id}"><caption>Advanced School Stats</caption>'
+             f'<thead><tr class="over_header"><th colspan="2"></th><th colspan="{len(STAT_COLUMNS)}">Totals</th></tr>'
+             f'<tr><th data-stat="ranker">Rk</th><th data-stat="school_name">School</th>{header}</tr></thead>'
+             f'<tbody>{"".join(rows)}</tbody></table>')
+    if commented:
+        table = f'<div class="placeholder"></div><!--\n{table}\n-->'
+    nav = "".join(f'<li><a href="/cbb/seasons/{y}.html">{y}</a></li>' for y in range(1950, 2026))
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>Advanced School Stats</title>'
+            f'<script>var sr = {{}};</script></head><body><div id="nav"><ul>{nav}</ul></div>'
+            f'<div id="content"><div class="table_container" id="div_{table_id}">{table}</div></div>'
+            f'<div id="footer">{nav}</div></body></html>')
+
+
+def ohlcv(n_tickers, n_days, seed=0, start="2015-01-01"):
+    """yfinance-shaped OHLCV frame: (field, ticker) column MultiIndex over business days."""
+    from stock_engine import synthetic_prices
+
+    close = synthetic_prices(n_tickers, n_days, seed=seed, start=start)
+    rng = np.random.default_rng(seed + 1)
+    spread = np.abs(rng.normal(0, 0.01, close.shape))
+    fields = {
+        "Open": close.shift(1).fillna(close) * (1 + rng.normal(0, 0.003, close.shape)),
+        "High": close * (1 + spread),
+        "Low": close * (1 - spread),
+        "Close": close,
+        "Adj Close": close,
+        "Volume": pd.DataFrame(rng.integers(10_000, 5_000_000, close.shape).astype(float),
+                               index=close.index, columns=close.columns),
+    }
+    return pd.concat(fields, axis=1)
@@ -0,0 +1,93 @@
+import hashlib
+import inspect
+import marshal
+import os
+import pickle
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+# Shared headless chart rendering for the analysis scripts. Charts are drawn
+# on the non-interactive Agg backend through the object-oriented Figure API
+# (no pyplot state machine, nothing to show()), so any number of them can be
+# rendered side by side in worker processes.
+#
+# A chart is a draw function plus the data it plots. The PNG is tagged with a
+# hash of both (the function by its source, so editing a drawer redraws its
+# charts), and a chart whose file already carries the same hash is not drawn
+# again.
+
+matplotlib.use("Agg")
+
+HASH_KEY = "DataHash"
+
+# draw(fig, data, **options) fills in a fresh Figure; it must be an importable
+# module-level function so it can be sent to a worker process
+Chart = namedtuple("Chart", ["path", "draw", "data", "options", "figsize"], defaults=({}, None))
+
+
+def _draw_code(draw):
+    """The draw function's source, or its compiled code when no source is available."""
+    try:
+        return inspect.getsource(draw)
+    except (OSError, TypeError):
+        return marshal.dumps(draw.__code__)
+
+
+def chart_hash(chart):
+    """sha256 of the draw function (name and code), its data, options and figure size."""
+    key = (chart.draw.__module__, chart.draw.__qualname__, _draw_code(chart.draw), chart.data,
+           sorted(chart.options.items()), chart.figsize)
+    return hashlib.sha256(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def cached_hash(path):
+    """The data hash stored in an existing PNG, or None."""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            return image.info.get(HASH_KEY)
+    except (OSError, ValueError):
+        return None
+
+
+def render(chart, digest=None):
+    """Draw one chart on a new Agg Figure and save it as a hash-tagged PNG."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=chart.figsize)
+    chart.draw(fig, chart.data, **chart.options)
+    directory = os.path.dirname(os.path.abspath(chart.path))
+    os.makedirs(directory, exist_ok=True)
+    fig.savefig(chart.path, metadata={HASH_KEY: digest or chart_hash(chart)})
+    return chart.path
+
+
+def _render_job(job):
+    return render(*job)
+
+
+def render_charts(charts, workers=None, force=False, parallel_threshold=4):
+    """Render every chart whose PNG is missing or was drawn from different data.
+
+    Batches of at least parallel_threshold charts are spread over a process
+    pool (workers defaults to os.cpu_count()). Returns the list of paths that
+    were actually drawn.
+    """
+    pending = []
+    for chart in charts:
+        digest = chart_hash(chart)
+        if force or cached_hash(chart.path) != digest:
+            pending.append((chart, digest))
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers > 1 and len(pending) >= parallel_threshold:
+        with ProcessPoolExecutor(workers) as pool:
+            rendered = list(pool.map(_render_job, pending))
+    else:
+        rendered = [render(*job) for job in pending]
+    if len(rendered) < len(charts):
+        print(f"Rendered {len(rendered)} chart(s), {len(charts) - len(rendered)} unchanged")
+    return rendered
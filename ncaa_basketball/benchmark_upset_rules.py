@@ -0,0 +1,97 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cbb_upset_rules import UPSET_COLUMNS, evaluate_upsets
+
+# Compare the table-driven evaluator with the original per-region loop from
+# cbb_2025_kenpom_upsets.py on synthetic multi-season tournament fields.
+SEASON_COUNTS = [int(s) for s in sys.argv[1:]] or [1, 20, 200]
+REGIONS = ["South", "West", "East", "Midwest"]
+
+
+def synthetic_field(n_seasons, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for season in range(2025 - n_seasons + 1, 2026):
+        for region in REGIONS:
+            for seed_line in range(1, 17):
+                # Two First Four teams on the 11 and 16 lines in half the regions
+                copies = 2 if seed_line in (11, 16) and region in ("South", "East") else 1
+                for copy in range(copies):
+                    base = seed_line * 20
+                    rows.append({
+                        "Season": season,
+                        "Region": region,
+                        "School": f"{region} {seed_line}{'ab'[copy]} {season}",
+                        "Seed": seed_line,
+                        "RankAdjOE": int(rng.integers(max(1, base - 40), base + 40)),
+                        "RankAdjDE": int(rng.integers(max(1, base - 40), base + 40)),
+                        "RankAdjEM": int(rng.integers(max(1, base - 30), base + 30)),
+                    })
+    return pd.DataFrame(rows)
+
+
+def _seed(region_df, n):
+    rows = region_df[region_df["Seed"] == n]
+    return rows.iloc[0] if not rows.empty else None
+
+
+def legacy_identify_upsets(df, region):
+    # The original identify_upsets() loop, minus its debug prints
+    upsets = []
+    region_df = df[df["Region"] == region].dropna(subset=["Seed", "RankAdjOE", "RankAdjDE", "RankAdjEM"])
+    single = region_df.sort_values("RankAdjOE").drop_duplicates(subset=["Seed"], keep="first")
+
+    def add(hi, lo, hs, ls, criteria):
+        upsets.append((f"{hi.School} ({hs}) vs {lo.School} ({ls})", f"{hs} vs {ls}", hi.School, lo.School, criteria,
+                       hi.RankAdjOE, hi.RankAdjDE, hi.RankAdjEM, lo.RankAdjOE, lo.RankAdjDE, lo.RankAdjEM))
+
+    two, fifteen = _seed(single, 2), _seed(single, 15)
+    if two is not None and fifteen is not None and (two.RankAdjOE > 50 or two.RankAdjDE > 50):
+        add(two, fifteen, 2, 15, f"2-seed RankAdjOE ({two.RankAdjOE}) or RankAdjDE ({two.RankAdjDE}) > 50")
+    three, fourteen = _seed(single, 3), _seed(single, 14)
+    if three is not None and fourteen is not None and abs(fourteen.RankAdjOE - fourteen.RankAdjDE) <= 40:
+        add(three, fourteen, 3, 14, f"14-seed RankAdjOE ({fourteen.RankAdjOE}) - RankAdjDE ({fourteen.RankAdjDE}) ≤ 40")
+    four, thirteen = _seed(single, 4), _seed(single, 13)
+    if four is not None and thirteen is not None and (four.RankAdjOE > 40 or four.RankAdjDE > 40) and (thirteen.RankAdjOE <= 50 or thirteen.RankAdjDE <= 50):
+        add(four, thirteen, 4, 13, f"4-seed RankAdjOE ({four.RankAdjOE}) or RankAdjDE ({four.RankAdjDE}) > 40 AND 13-seed RankAdjOE ({thirteen.RankAdjOE}) or RankAdjDE ({thirteen.RankAdjDE}) ≤ 50")
+    five, twelve = _seed(single, 5), _seed(single, 12)
+    if five is not None and twelve is not None and ((five.RankAdjOE >= 60 or five.RankAdjDE >= 60) or (twelve.RankAdjEM <= 60 and five.RankAdjEM <= 20)):
+        add(five, twelve, 5, 12, f"5-seed RankAdjOE ({five.RankAdjOE}) or RankAdjDE ({five.RankAdjDE}) ≥ 60 OR (12-seed RankAdjEM ({twelve.RankAdjEM}) ≤ 60 AND 5-seed RankAdjEM ({five.RankAdjEM}) ≤ 20)")
+    six = _seed(single, 6)
+    elevens = region_df[region_df["Seed"] == 11].sort_values("RankAdjEM")
+    if six is not None and not elevens.empty:
+        for eleven in elevens.itertuples():
+            if eleven.RankAdjEM < six.RankAdjEM or abs(eleven.RankAdjEM - six.RankAdjEM) <= 5:
+                add(six, eleven, 6, 11, f"11-seed RankAdjEM ({eleven.RankAdjEM}) < 6-seed RankAdjEM ({six.RankAdjEM}) OR within 5 spots")
+    seven, ten = _seed(single, 7), _seed(single, 10)
+    if seven is not None and ten is not None and ten.RankAdjEM < seven.RankAdjEM:
+        add(seven, ten, 7, 10, f"10-seed RankAdjEM ({ten.RankAdjEM}) < 7-seed RankAdjEM ({seven.RankAdjEM})")
+    return pd.DataFrame(upsets, columns=UPSET_COLUMNS)
+
+
+def legacy_path(df):
+    frames = []
+    for season, season_df in df.groupby("Season", sort=False):
+        for region in season_df["Region"].unique():
+            frames.append(legacy_identify_upsets(season_df, region).assign(Season=season, Region=region))
+    return pd.concat(frames, ignore_index=True)
+
+
+def timed(fn, df):
+    start = time.perf_counter()
+    result = fn(df)
+    return result, time.perf_counter() - start
+
+
+print(f"{'seasons':>8} {'regions':>8} {'loop (s)':>10} {'table (s)':>10} {'speedup':>8}")
+for n_seasons in SEASON_COUNTS:
+    df = synthetic_field(n_seasons)
+    legacy, t_legacy = timed(legacy_path, df)
+    table, t_table = timed(evaluate_upsets, df)
+    # Both paths must flag the same upsets
+    pd.testing.assert_frame_equal(legacy[UPSET_COLUMNS], table[UPSET_COLUMNS], check_dtype=False)
+    print(f"{n_seasons:>8} {n_seasons * len(REGIONS):>8} {t_legacy:>10.3f} {t_table:>10.3f} {t_legacy / t_table:>7.1f}x")
@@ -0,0 +1,156 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from cbb_datasets import MARCH_MADNESS_FILE, load_table
+
+# Monte Carlo March Madness simulator. Every simulated tournament is a row of
+# team indices by bracket slot; a round pairs adjacent slots, draws all games
+# for all simulations at once and keeps the winners, halving the row.
+
+# Seed order of the 16 slots in a region, top of the bracket to the bottom
+BRACKET_SEEDS = [1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15]
+ROUNDS = ["R64", "R32", "S16", "E8", "F4", "Final", "Champion"]
+
+# Spread (in points) of a single game's margin around its KenPom expectation
+GAME_SIGMA = 11.0
+AVERAGE_TEMPO = 67.5
+
+# Final Four pairing by season (first vs second, third vs fourth). The dataset
+# only says which region a team is in, not which regions meet in the national
+# semifinals, so seasons missing here need an explicit region_order.
+FINAL_FOUR_REGIONS = {
+    2021: ["South", "Midwest", "West", "East"],
+    2022: ["South", "Midwest", "West", "East"],
+    2023: ["East", "South", "Midwest", "West"],
+    2024: ["East", "West", "South", "Midwest"],
+    2025: ["South", "West", "East", "Midwest"],
+}
+
+
+def win_probability_matrix(adj_em, adj_tempo, sigma=GAME_SIGMA):
+    """P[i, j] = probability team i beats team j on a neutral floor.
+
+    The expected margin is the AdjEM gap (points per 100 possessions) scaled
+    to the average tempo of the two teams; the game margin is taken as normal
+    around it.
+    """
+    adj_em = np.asarray(adj_em, dtype=float)
+    adj_tempo = np.nan_to_num(np.asarray(adj_tempo, dtype=float), nan=AVERAGE_TEMPO)
+    possessions = (adj_tempo[:, None] + adj_tempo[None, :]) / 2
+    margin = (adj_em[:, None] - adj_em[None, :]) * possessions / 100
+    erf = np.vectorize(math.erf, otypes=[float])
+    return 0.5 * (1 + erf(margin / (sigma * math.sqrt(2))))
+
+
+def final_four_regions(season):
+    """The official Final Four region pairing for a season."""
+    if season not in FINAL_FOUR_REGIONS:
+        raise KeyError(f"No Final Four pairing for {season}; pass region_order explicitly")
+    return list(FINAL_FOUR_REGIONS[season])
+
+
+def build_bracket(field, region_order):
+    """Lay a tournament field out in bracket order.
+
+    field needs School, Seed, Region, AdjEM and AdjTempo columns. Regions are
+    paired for the Final Four in region_order (first vs second, third vs
+    fourth; see final_four_regions()). Returns the field in team-index order and a (64, 2) slot array
+    holding the team index for each slot, with a second team for First Four
+    play-in slots (-1 otherwise).
+    """
+    field = field.dropna(subset=["Seed", "Region", "AdjEM"]).reset_index(drop=True)
+    field["Seed"] = field["Seed"].astype(int)
+    if region_order is None:
+        raise ValueError("region_order is required: the field does not say which regions meet in the Final Four")
+    regions = list(region_order)
+    found = set(pd.unique(field["Region"]))
+    if len(regions) != 4 or set(regions) != found:
+        raise ValueError(f"region_order {regions} does not match the field's regions {sorted(found)}")
+
+    slots = np.full((64, 2), -1, dtype=np.int16)
+    for r, region in enumerate(regions):
+        region_df = field[field["Region"] == region]
+        for s, seed in enumerate(BRACKET_SEEDS):
+            teams = region_df.index[region_df["Seed"] == seed].tolist()
+            if not 1 <= len(teams) <= 2:
+                raise ValueError(f"{region} region has {len(teams)} teams on the {seed} seed line")
+            slots[r * 16 + s, :len(teams)] = teams
+    return field, slots
+
+
+def _simulate_chunk(args):
+    probs, slots, n_sims, seed = args
+    rng = np.random.default_rng(seed)
+    n_teams = len(probs)
+    counts = np.zeros((len(ROUNDS), n_teams), dtype=np.int64)
+
+    # First Four: play-in slots resolve to one team per simulation
+    alive = np.broadcast_to(slots[:, 0], (n_sims, len(slots))).copy()
+    for slot in np.flatnonzero(slots[:, 1] >= 0):
+        a, b = slots[slot]
+        alive[:, slot] = np.where(rng.random(n_sims) < probs[a, b], a, b)
+
+    for r in range(len(ROUNDS)):
+        counts[r] = np.bincount(alive.ravel(), minlength=n_teams)
+        if alive.shape[1] == 1:
+            break
+        a, b = alive[:, 0::2], alive[:, 1::2]
+        alive = np.where(rng.random(a.shape) < probs[a, b], a, b)
+    return counts
+
+
+def simulate_tournament(field, region_order, n_sims=1_000_000, seed=None, workers=1, chunk_size=100_000,
+                        sigma=GAME_SIGMA):
+    """Run n_sims tournaments and return each team's advancement probabilities.
+
+    Simulations run in chunks (bounding memory to chunk_size x 64 slots) with
+    independent streams spawned from seed, so results are reproducible for a
+    given seed and chunk_size whatever the number of workers.
+    """
+    field, slots = build_bracket(field, region_order)
+    probs = win_probability_matrix(field["AdjEM"], field["AdjTempo"] if "AdjTempo" in field else
+                                   np.full(len(field), AVERAGE_TEMPO), sigma)
+
+    sizes = [min(chunk_size, n_sims - start) for start in range(0, n_sims, chunk_size)]
+    streams = np.random.SeedSequence(seed).spawn(len(sizes))
+    chunks = [(probs, slots, size, stream) for size, stream in zip(sizes, streams)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            counts = sum(pool.map(_simulate_chunk, chunks))
+    else:
+        counts = sum(_simulate_chunk(chunk) for chunk in chunks)
+
+    result = field[["School", "Seed", "Region", "AdjEM"]].copy()
+    for r, name in enumerate(ROUNDS):
+        result[name] = counts[r] / n_sims
+    return result.sort_values(["Champion", "Final", "F4"], ascending=False, ignore_index=True)
+
+
+def load_field(season=2025):
+    """Tournament field for one season from DEV _ March Madness.csv."""
+    df = load_table(MARCH_MADNESS_FILE, seasons=season)
+    df = df[df["Post-Season Tournament"] == "March Madness"]
+    df = df.rename(columns={"Mapped ESPN Team Name": "School"})
+    df["School"] = df["School"].astype(str)
+    for col in ["Seed", "AdjEM", "AdjTempo"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    return df
+
+
+if __name__ == "__main__":
+    season = 2025
+    field = load_field(season)
+
+    n_sims = 1_000_000
+    start = time.perf_counter()
+    odds = simulate_tournament(field, final_four_regions(season), n_sims=n_sims, seed=season, workers=os.cpu_count() or 1)
+    print(f"Simulated {n_sims:,} brackets in {time.perf_counter() - start:.1f}s")
+    print("\nTitle odds (top 16):")
+    print(odds.head(16).to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+    odds.to_csv("cbb_2025_bracket_simulation.csv", index=False)
+    print("Advancement probabilities saved to cbb_2025_bracket_simulation.csv")
@@ -0,0 +1,72 @@
+# Chart drawers for the CBB scripts, in chart_render's draw(fig, data, **options) form
+
+
+def potential_upsets(fig, upset_df, season=2025, bar_width=0.2):
+    """Higher vs. lower seed KenPom ranks per matchup, annotated with the matched criteria."""
+    ax = fig.add_subplot()
+    index = range(len(upset_df))
+
+    # Plot multiple metrics for higher and lower seeds
+    ax.bar([i - bar_width for i in index], upset_df["Higher_Seed_RankAdjOE"], bar_width, label="Higher Seed RankAdjOE", color="blue", alpha=0.7)
+    ax.bar(index, upset_df["Higher_Seed_RankAdjDE"], bar_width, label="Higher Seed RankAdjDE", color="green", alpha=0.7)
+    ax.bar([i + bar_width for i in index], upset_df["Higher_Seed_RankAdjEM"], bar_width, label="Higher Seed RankAdjEM", color="cyan", alpha=0.7)
+
+    ax.bar([i - bar_width for i in index], upset_df["Lower_Seed_RankAdjOE"], bar_width, label="Lower Seed RankAdjOE", color="red", alpha=0.7, hatch='/')
+    ax.bar(index, upset_df["Lower_Seed_RankAdjDE"], bar_width, label="Lower Seed RankAdjDE", color="orange", alpha=0.7, hatch='/')
+    ax.bar([i + bar_width for i in index], upset_df["Lower_Seed_RankAdjEM"], bar_width, label="Lower Seed RankAdjEM", color="magenta", alpha=0.7, hatch='/')
+
+    # Add criteria as annotations above each bar group
+    for i, row in enumerate(upset_df.itertuples(index=False)):
+        top = max(row.Higher_Seed_RankAdjOE, row.Higher_Seed_RankAdjDE, row.Higher_Seed_RankAdjEM,
+                  row.Lower_Seed_RankAdjOE, row.Lower_Seed_RankAdjDE, row.Lower_Seed_RankAdjEM)
+        ax.text(i, top + 5, row.Criteria, ha="center", va="bottom", rotation=90, fontsize=8, wrap=True)
+
+    ax.set_xlabel("Matchups")
+    ax.set_ylabel("Rankings (Lower is Better)")
+    ax.set_title(f"Potential Upsets in {season} NCAA Tournament Round of 64")
+    ax.set_xticks(list(index), upset_df["Matchup"], rotation=45, ha="right")
+    ax.legend()
+    fig.tight_layout()
+
+
+def eligible_teams(fig, teams, title, bar_width=0.35):
+    """AdjOE vs. AdjDE bars for each eligible team."""
+    ax = fig.add_subplot()
+    index = range(len(teams))
+
+    ax.bar(index, teams["AdjOE"], bar_width, label="Adjusted Offense (AdjOE)", color="blue")
+    ax.bar([i + bar_width for i in index], teams["AdjDE"], bar_width, label="Adjusted Defense (AdjDE)", color="red")
+
+    ax.set_xlabel("Teams")
+    ax.set_ylabel("KenPom Metrics")
+    ax.set_title(title)
+    ax.set_xticks([i + bar_width / 2 for i in index], teams["School"], rotation=45, ha="right")
+    ax.legend()
+    fig.tight_layout()
+
+
+def offensive_efficiency(fig, data, season_label="2024-25"):
+    """Side-by-side top-10 bars; data is {"efficiency": df, "low_turnover": df}."""
+    top_efficiency, top_low_turnover = data["efficiency"], data["low_turnover"]
+
+    # Offensive efficiency bar chart
+    ax = fig.add_subplot(1, 2, 1)
+    ax.bar(top_efficiency["School"], top_efficiency["O eFG%"], color="blue")
+    ax.set_title(f"Top {len(top_efficiency)} NCAA Teams by Offensive Efficiency (O eFG%, {season_label})")
+    ax.set_xlabel("Team")
+    ax.set_ylabel("Offensive eFG%")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+
+    # Lowest turnover % bar chart
+    ax = fig.add_subplot(1, 2, 2)
+    ax.bar(top_low_turnover["School"], top_low_turnover["O TO%"], color="green")
+    ax.set_title(f"Top {len(top_low_turnover)} NCAA Teams by Lowest Turnover % (O TO%, {season_label})")
+    ax.set_xlabel("Team")
+    ax.set_ylabel("Turnover %")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+
+    fig.tight_layout()
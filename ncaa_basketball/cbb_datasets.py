@@ -0,0 +1,193 @@
+import hashlib
+import json
+import numbers
+import os
+import shutil
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional, fall back to the cached CSV
+    pa = None
+
+# Local, offline cache for the Kaggle March Madness dataset.
+#
+#   <cache>/objects/<sha256>               raw files, content-addressed
+#   <cache>/datasets/<handle>.json         file name -> sha256 for a download
+#   <cache>/tables/<sha256>-v1/data/Season=YYYY/   typed Parquet, one partition per season
+#
+# kagglehub is only imported (and the network only touched) when a dataset
+# has never been downloaded or a refresh is requested.
+
+KAGGLE_DATASET = "jonathanpilafas/2024-march-madness-statistical-analysis"
+MARCH_MADNESS_FILE = "DEV _ March Madness.csv"
+KENPOM_SUMMARY_FILE = "INT _ KenPom _ Summary.csv"
+
+# Columns the analysis scripts rely on, checked before anything is cached
+REQUIRED_COLUMNS = {
+    MARCH_MADNESS_FILE: ["Season", "Mapped ESPN Team Name", "Post-Season Tournament", "Seed", "Region",
+                         "RankAdjOE", "RankAdjDE", "RankAdjEM", "RankAdjTempo"],
+    KENPOM_SUMMARY_FILE: ["Season", "TeamName", "AdjOE", "RankAdjOE", "AdjDE", "RankAdjDE", "AdjTempo"],
+}
+# School name column of each file, resolved to school ids by load_table(team_ids=True)
+TEAM_NAME_COLUMNS = {MARCH_MADNESS_FILE: "Mapped ESPN Team Name", KENPOM_SUMMARY_FILE: "TeamName"}
+NUMERIC_COLUMNS = ["Seed", "AdjOE", "AdjDE", "AdjEM", "AdjTempo",
+                   "RankAdjOE", "RankAdjDE", "RankAdjEM", "RankAdjTempo"]
+TABLE_VERSION = 1
+
+
+class SchemaError(ValueError):
+    """A dataset file is missing columns the analysis depends on."""
+
+
+def default_cache_dir():
+    return os.environ.get("CBB_DATA_CACHE",
+                          os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "kaggle"))
+
+
+def _sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _kaggle_download(handle):
+    import kagglehub
+
+    return kagglehub.dataset_download(handle)
+
+
+def _manifest_path(cache_dir, handle):
+    return os.path.join(cache_dir, "datasets", handle.replace("/", "__") + ".json")
+
+
+def find_file(files, name):
+    """Exact file name if present, else a case-insensitive match."""
+    if name in files:
+        return name
+    for candidate in files:
+        if candidate.lower() == name.lower():
+            return candidate
+    raise FileNotFoundError(f"Could not find {name} or a matching file in the dataset. Available files: {sorted(files)}")
+
+
+def validate_columns(columns, file_name):
+    required = REQUIRED_COLUMNS.get(file_name, [])
+    missing = [col for col in required if col not in columns]
+    if missing:
+        raise SchemaError(f"{file_name} is missing required columns: {missing}")
+
+
+def sync_dataset(handle=KAGGLE_DATASET, cache_dir=None, refresh=False, downloader=None):
+    """Make sure a dataset is in the local cache and return its manifest.
+
+    downloader(handle) -> directory is kagglehub.dataset_download by default;
+    any function returning a directory of files (e.g. a local fixture copy)
+    can stand in for it.
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    manifest_path = _manifest_path(cache_dir, handle)
+    if not refresh and os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    source = (downloader or _kaggle_download)(handle)
+    objects = os.path.join(cache_dir, "objects")
+    os.makedirs(objects, exist_ok=True)
+    files = {}
+    for name in sorted(os.listdir(source)):
+        path = os.path.join(source, name)
+        if not os.path.isfile(path):
+            continue
+        digest = _sha256(path)
+        target = os.path.join(objects, digest)
+        if not os.path.exists(target):
+            shutil.copyfile(path, target + ".tmp")
+            os.replace(target + ".tmp", target)
+        files[name] = digest
+
+    manifest = {"handle": handle, "files": files}
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    return manifest
+
+
+def read_typed_csv(path, file_name):
+    """Parse a dataset CSV, check its schema and tighten its dtypes."""
+    df = pd.read_csv(path)
+    validate_columns(df.columns, file_name)
+    for col in df.columns:
+        if col in NUMERIC_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        elif df[col].dtype == object or pd.api.types.is_string_dtype(df[col]):
+            # Repeated labels (regions, conferences, tournaments) become categoricals
+            if df[col].nunique() <= len(df) // 2:
+                df[col] = df[col].astype("category")
+    df["Season"] = df["Season"].astype("int16")
+    return df
+
+
+def _table_dir(cache_dir, digest):
+    return os.path.join(cache_dir, "tables", f"{digest}-v{TABLE_VERSION}")
+
+
+def _build_table(cache_dir, digest, file_name):
+    df = read_typed_csv(os.path.join(cache_dir, "objects", digest), file_name)
+    table_dir = _table_dir(cache_dir, digest)
+    tmp_dir = table_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    pq.write_to_dataset(pa.Table.from_pandas(df, preserve_index=False), os.path.join(tmp_dir, "data"),
+                       partition_cols=["Season"])
+    with open(os.path.join(tmp_dir, "columns.json"), "w") as f:
+        json.dump(list(df.columns), f)
+    os.replace(tmp_dir, table_dir)
+
+
+def load_table(file_name, seasons=None, columns=None, handle=KAGGLE_DATASET, cache_dir=None,
+               refresh=False, downloader=None, team_ids=False):
+    """Load one dataset file, reading only the requested Season partitions.
+
+    The first call downloads (or copies) the dataset and converts the file to
+    a Season-partitioned Parquet table keyed by the file's content hash; later
+    calls read that table directly and need no network. team_ids=True adds a
+    team_id column resolved through the persisted school index (cbb_teams.py).
+    """
+    if team_ids:
+        from cbb_teams import add_team_ids, school_index
+
+        name_column = TEAM_NAME_COLUMNS[file_name]
+        if columns is not None and name_column not in columns:
+            columns = list(columns) + [name_column]
+        df = load_table(file_name, seasons, columns, handle, cache_dir, refresh, downloader)
+        return add_team_ids(df, name_column, school_index(handle, cache_dir))
+
+    cache_dir = cache_dir or default_cache_dir()
+    manifest = sync_dataset(handle, cache_dir, refresh=refresh, downloader=downloader)
+    name = find_file(manifest["files"], file_name)
+    digest = manifest["files"][name]
+    if seasons is not None:
+        seasons = [int(s) for s in ([seasons] if isinstance(seasons, numbers.Integral) else seasons)]
+
+    if pa is None:
+        df = read_typed_csv(os.path.join(cache_dir, "objects", digest), file_name)
+        if seasons is not None:
+            df = df[df["Season"].isin(seasons)].reset_index(drop=True)
+        return df[columns] if columns is not None else df
+
+    table_dir = _table_dir(cache_dir, digest)
+    if not os.path.exists(table_dir):
+        _build_table(cache_dir, digest, file_name)
+    if columns is None:
+        with open(os.path.join(table_dir, "columns.json")) as f:
+            columns = json.load(f)
+    dataset = ds.dataset(os.path.join(table_dir, "data"), format="parquet",
+                         partitioning=ds.partitioning(pa.schema([("Season", pa.int16())]), flavor="hive"))
+    expr = ds.field("Season").isin(seasons) if seasons is not None else None
+    return dataset.to_table(columns=columns, filter=expr).unify_dictionaries().to_pandas()
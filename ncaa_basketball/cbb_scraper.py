@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+from cbb_stats_table import parse_stats_table
+
+# Multi-season sports-reference scraper: a bounded thread pool sharing one
+# pooled session, a per-host request spacing, and an on-disk conditional
+# request cache (ETag / Last-Modified) so unchanged pages are never
+# downloaded twice. Retries are made by fetch() rather than the transport, so
+# every attempt waits for its rate-limit slot and Retry-After holds back the
+# whole host.
+
+BASE_URL = "https://www.sports-reference.com"
+# Table type -> (page path, table id, column prefix in the combined dataset)
+TABLES = {
+    "advanced": ("/cbb/seasons/men/{season}-advanced-school-stats.html", "adv_school_stats", ""),
+    "opponent": ("/cbb/seasons/men/{season}-advanced-opponent-stats.html", "adv_opp_stats", "opp_"),
+}
+# sports-reference allows roughly 20 requests a minute
+DEFAULT_MIN_INTERVAL = 3.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Seconds before the first retry, doubled for each one after it
+RETRY_BACKOFF = 1.0
+
+
+class RateLimiter:
+    """Spaces requests to the same host at least min_interval seconds apart."""
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL):
+        self.min_interval = min_interval
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def defer(self, url, seconds):
+        """Hold back the next request to url's host for at least seconds."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            self._next[host] = max(self._next.get(host, 0.0), time.monotonic() + seconds)
+
+
+class PageCache:
+    """Response bodies and validators on disk, keyed by URL hash."""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".html"), os.path.join(self.cache_dir, key + ".json")
+
+    def get(self, url):
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None, None
+
+    def put(self, url, headers, body):
+        body_path, meta_path = self._paths(url)
+        meta = {"url": url, "etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+        with open(body_path + ".tmp", "wb") as f:
+            f.write(body)
+        os.replace(body_path + ".tmp", body_path)
+        with open(meta_path + ".tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
+
+def make_session(pool_size):
+    session = requests.Session()
+    # No transport retries: they would bypass the rate limiter (see fetch)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "SportsAndFinanceAnalytics/1.0"
+    return session
+
+
+def _retry_after(response):
+    """Seconds asked for by a Retry-After header (delay or HTTP date), or 0."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def fetch(session, url, cache, limiter, timeout=30, retries=3, backoff=RETRY_BACKOFF):
+    """GET url, revalidating a cached copy. Returns (body, from_cache).
+
+    Connection errors and RETRY_STATUSES responses are retried up to retries
+    times with exponential backoff (or the server's Retry-After if longer);
+    each attempt takes its own slot from limiter.
+    """
+    meta, body = cache.get(url)
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    for attempt in range(retries + 1):
+        limiter.wait(url)
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+            delay = backoff * 2 ** attempt
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                break
+            delay = max(backoff * 2 ** attempt, _retry_after(response))
+            response.close()
+        limiter.defer(url, delay)
+
+    if response.status_code == 304 and body is not None:
+        return body, True
+    response.raise_for_status()
+    cache.put(url, response.headers, response.content)
+    return response.content, False
+
+
+def _scrape_page(session, cache, limiter, base_url, season, table):
+    path, table_id, _ = TABLES[table]
+    url = base_url + path.format(season=season)
+    body, from_cache = fetch(session, url, cache, limiter)
+    columns = parse_stats_table(body, table_id=table_id)
+    if columns is None:
+        raise ValueError(f"Table {table_id} not found at {url}")
+    df = pd.DataFrame(columns)
+    df.insert(0, "Season", season)
+    return season, table, df, from_cache
+
+
+def scrape_seasons(seasons, tables=("advanced", "opponent"), base_url=BASE_URL, cache_dir=None,
+                   workers=4, min_interval=DEFAULT_MIN_INTERVAL, team_ids=False):
+    """Fetch every (season, table) page concurrently and combine them.
+
+    Returns one DataFrame with a row per (Season, school_name); columns from
+    every table but the first are prefixed (e.g. opp_) when they would clash.
+    team_ids=True adds the KenPom school id (cbb_teams.py) as team_id.
+    """
+    cache = PageCache(cache_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "pages"))
+    limiter = RateLimiter(min_interval)
+    jobs = [(season, table) for season in seasons for table in tables]
+    with make_session(workers) as session, ThreadPoolExecutor(workers) as pool:
+        results = list(pool.map(lambda job: _scrape_page(session, cache, limiter, base_url, *job), jobs))
+
+    fetched = sum(not from_cache for *_, from_cache in results)
+    print(f"Fetched {fetched} page(s), {len(results) - fetched} unchanged from cache")
+    combined = None
+    for table in tables:
+        frame = pd.concat([df for _, t, df, _ in results if t == table], ignore_index=True)
+        frame = frame.drop(columns=["ranker"], errors="ignore")
+        frame = frame[frame["school_name"] != ""]
+        if combined is None:
+            combined = frame
+            continue
+        prefix = TABLES[table][2]
+        frame = frame.rename(columns={col: prefix + col for col in frame.columns
+                                      if col not in ("Season", "school_name") and col in combined.columns})
+        combined = combined.merge(frame, on=["Season", "school_name"], how="outer")
+
+    for col in combined.columns:
+        if col not in ("Season", "school_name"):
+            cleaned = pd.to_numeric(combined[col].astype(str).str.replace("%", "").str.replace("+", ""),
+                                    errors="coerce")
+            # Keep text columns (e.g. conference) as they are
+            if cleaned.notna().any() or combined[col].isna().all():
+                combined[col] = cleaned
+    combined = combined.sort_values(["Season", "school_name"], ignore_index=True)
+    if team_ids:
+        from cbb_teams import add_team_ids
+
+        combined = add_team_ids(combined, "school_name")
+    return combined
+
+
+if __name__ == "__main__":
+    df = scrape_seasons(range(2015, 2026))
+    df.to_csv("cbb_advanced_stats_all_seasons.csv", index=False)
+    print(f"Saved {len(df)} team-seasons to cbb_advanced_stats_all_seasons.csv")
@@ -0,0 +1,105 @@
+import io
+import os
+
+import pandas as pd
+from lxml import etree
+
+# Streaming extractor for sports-reference stat tables. The page is read as a
+# stream of parser events: cells of the wanted table are appended straight to
+# per-stat column lists and every finished element is cleared, so the full
+# document tree is never held in memory.
+
+# Offensive columns of the advanced school stats table
+OFFENSIVE_STATS = {
+    "school_name": "School",
+    "efg_pct": "O eFG%",
+    "tov_pct": "O TO%",
+    "orb_pct": "O OR%",
+    "ft_rate": "O FT/FGA",
+}
+
+
+def _open_source(source):
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    if isinstance(source, str) and not os.path.exists(source) and "<" in source:
+        return io.BytesIO(source.encode("utf-8"))
+    return source
+
+
+def _is_header_row(row):
+    # Repeated column headers come back as <tr class="thead"> (or over_header)
+    classes = (row.get("class") or "").split()
+    return "thead" in classes or "over_header" in classes
+
+
+def parse_stats_table(source, table_id="adv_school_stats", stats=None):
+    """Extract one table as {data-stat: [cell text, ...]} in a single pass.
+
+    source is a file path, file object, or the HTML itself (str or bytes).
+    stats limits the columns kept (None keeps every data-stat). Header rows
+    and rows without any <td> cells are skipped; a stat missing from a row is
+    stored as "". Tables that sports-reference ships inside HTML comments are
+    found too. Returns None if the page has no table with that id.
+    """
+    wanted = set(stats) if stats is not None else None
+    columns = {stat: [] for stat in stats} if stats is not None else {}
+    n_rows = 0
+    depth = 0  # > 0 while inside the target table (nested tables are counted)
+    found = False
+    row, row_has_td = None, False
+
+    for event, elem in etree.iterparse(_open_source(source), events=("start", "end", "comment"),
+                                       html=True, recover=True, huge_tree=True):
+        if event == "comment":
+            if depth == 0 and f'id="{table_id}"' in (elem.text or ""):
+                # sports-reference hides some tables in comments until page load
+                return parse_stats_table(elem.text.encode("utf-8"), table_id, stats)
+            continue
+        tag = elem.tag
+        if event == "start":
+            if tag == "table" and (depth or elem.get("id") == table_id):
+                depth += 1
+                found = True
+            elif depth and tag == "tr":
+                row, row_has_td = {}, False
+            continue
+
+        # end events
+        if depth and row is not None and tag in ("td", "th"):
+            stat = elem.get("data-stat")
+            if tag == "td":
+                row_has_td = True
+            if stat and (wanted is None or stat in wanted):
+                row[stat] = "".join(text.strip() for text in elem.itertext())
+        elif depth and tag == "tr" and row is not None:
+            if row_has_td and not _is_header_row(elem) and any(row.values()):
+                for stat in row:
+                    if stat not in columns:
+                        columns[stat] = [""] * n_rows
+                for stat, values in columns.items():
+                    values.append(row.get(stat, ""))
+                n_rows += 1
+            row = None
+        elif tag == "table" and depth:
+            depth -= 1
+            if depth == 0:
+                break
+        if row is None:
+            # Drop everything already handled; cells stay until their row ends
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+    return columns if found else None
+
+
+def stats_frame(columns, rename=OFFENSIVE_STATS, text_columns=("school_name",)):
+    """Build a DataFrame from parsed columns, numeric except text_columns."""
+    df = pd.DataFrame({name: columns.get(stat, []) for stat, name in rename.items()})
+    text_names = {rename.get(stat, stat) for stat in text_columns}
+    for col in df.columns:
+        if col not in text_names:
+            df[col] = pd.to_numeric(df[col].str.replace("%", "").str.replace("+", ""), errors="coerce")
+    return df
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import sys
+import warnings
+
+from cbb_datasets import KAGGLE_DATASET, KENPOM_SUMMARY_FILE, default_cache_dir, find_file, load_table, sync_dataset
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from team_index import TeamIndex, cached_index
+
+# School index over every TeamName in the KenPom summary: one integer id per
+# school, so KenPom rows, the March Madness table ("Mapped ESPN Team Name") and
+# sports-reference pages (school_name) join on ids instead of spellings.
+# normalize_name() already equates "Iowa St."/"Iowa State", "N.C. State"/"NC State"
+# and "Miami FL"/"Miami (FL)"; the tables below cover what it cannot.
+
+# KenPom TeamName changes (old name -> current name); both names stay in the history
+RENAMES = {
+    "Southwest Missouri St.": "Missouri St.",
+    "Southwest Texas St.": "Texas St.",
+    "Texas Pan American": "UT Rio Grande Valley",
+    "Arkansas Little Rock": "Little Rock",
+    "Louisiana Lafayette": "Louisiana",
+    "IPFW": "Purdue Fort Wayne",
+    "Fort Wayne": "Purdue Fort Wayne",
+    "Detroit": "Detroit Mercy",
+    "Dixie St.": "Utah Tech",
+    "Houston Baptist": "Houston Christian",
+    "UMKC": "Kansas City",
+    "IUPUI": "IU Indy",
+    "College of Charleston": "Charleston",
+}
+
+# Other spellings (sports-reference, ESPN) -> KenPom TeamName
+ALIASES = {
+    "UConn": "Connecticut",
+    "Ole Miss": "Mississippi",
+    "Pitt": "Pittsburgh",
+    "Southern California": "USC",
+    "Louisiana State": "LSU",
+    "Central Florida": "UCF",
+    "Southern Methodist": "SMU",
+    "Virginia Commonwealth": "VCU",
+    "Brigham Young": "BYU",
+    "Texas Christian": "TCU",
+    "Nevada-Las Vegas": "UNLV",
+    "Texas-El Paso": "UTEP",
+    "Texas-San Antonio": "UTSA",
+    "Alabama-Birmingham": "UAB",
+    "Maryland-Baltimore County": "UMBC",
+    "Pennsylvania": "Penn",
+    "Southern Mississippi": "Southern Miss",
+    "St. John's (NY)": "St. John's",
+    "Saint Mary's (CA)": "Saint Mary's",
+    "Loyola (IL)": "Loyola Chicago",
+    "Loyola (MD)": "Loyola MD",
+    "Albany (NY)": "Albany",
+    "Texas A&M-Corpus Christi": "Texas A&M Corpus Chris",
+    "Long Island University": "LIU",
+    "Florida International": "FIU",
+    "Grambling": "Grambling St.",
+    "Omaha": "Nebraska Omaha",
+    "UMass": "Massachusetts",
+}
+
+
+def build_school_index(kenpom):
+    """TeamIndex from a KenPom summary frame (Season, TeamName), with per-name season spans."""
+    history = kenpom.dropna(subset=["TeamName"]).groupby("TeamName")["Season"].agg(
+        first_season="min", last_season="max").reset_index().rename(columns={"TeamName": "name"})
+    history["team"] = [RENAMES.get(name, name) for name in history["name"]]
+    return TeamIndex.from_history(history, {alias: RENAMES.get(name, name) for alias, name in ALIASES.items()})
+
+
+def school_index(handle=KAGGLE_DATASET, cache_dir=None):
+    """The persisted school index, rebuilt when the KenPom file or the name tables change."""
+    cache_dir = cache_dir or default_cache_dir()
+    manifest = sync_dataset(handle, cache_dir)
+    tables = hashlib.sha256(json.dumps([RENAMES, ALIASES], sort_keys=True).encode()).hexdigest()
+    source = {"kenpom": manifest["files"][find_file(manifest["files"], KENPOM_SUMMARY_FILE)], "names": tables}
+    return cached_index(os.path.join(cache_dir, "team_index.json"), source, lambda _: build_school_index(
+        load_table(KENPOM_SUMMARY_FILE, columns=["Season", "TeamName"], handle=handle, cache_dir=cache_dir)))
+
+
+def add_team_ids(df, name_column, index=None):
+    """df with a team_id categorical (KenPom names, codes = school ids) resolved from name_column."""
+    if index is None:
+        index = school_index()
+    df = df.copy()
+    df["team_id"] = index.categorical(df[name_column])
+    missing = index.unmatched(df[name_column])
+    if missing:
+        shown = ", ".join(missing[:10]) + (", ..." if len(missing) > 10 else "")
+        warnings.warn(f"{len(missing)} school name(s) not in the KenPom index: {shown}", stacklevel=2)
+    return df
+
+
+def join_kenpom(df, name_column="school_name", columns=None, index=None):
+    """Left-join KenPom summary metrics onto a per-(Season, school) frame
+    (e.g. scraped sports-reference stats) on Season and school id."""
+    if index is None:
+        index = school_index()
+    df = add_team_ids(df, name_column, index)
+    if columns is not None:
+        columns = ["Season", "TeamName"] + [col for col in columns if col not in ("Season", "TeamName")]
+    kenpom = load_table(KENPOM_SUMMARY_FILE, seasons=sorted(df["Season"].unique()), columns=columns)
+    kenpom = add_team_ids(kenpom, "TeamName", index).dropna(subset=["team_id"])
+    return df.merge(kenpom, on=["Season", "team_id"], how="left", suffixes=("", "_kenpom"))
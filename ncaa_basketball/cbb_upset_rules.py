@@ -0,0 +1,110 @@
+import pandas as pd
+
+# Round of 64 upset rules, one row per seed pairing. "when" is a pandas
+# expression over the higher seed's (hi_*) and lower seed's (lo_*) KenPom
+# ranks; "criteria" is filled in from the same columns for every match.
+# all_lower_seeds checks every team on the lower seed line (First Four
+# play-ins) instead of only the best one by RankAdjOE.
+UPSET_RULES = [
+    {
+        "higher": 2, "lower": 15,
+        "when": "hi_RankAdjOE > 50 or hi_RankAdjDE > 50",
+        "criteria": "2-seed RankAdjOE ({hi_RankAdjOE}) or RankAdjDE ({hi_RankAdjDE}) > 50",
+    },
+    {
+        "higher": 3, "lower": 14,
+        "when": "abs(lo_RankAdjOE - lo_RankAdjDE) <= 40",
+        "criteria": "14-seed RankAdjOE ({lo_RankAdjOE}) - RankAdjDE ({lo_RankAdjDE}) ≤ 40",
+    },
+    {
+        "higher": 4, "lower": 13,
+        "when": "(hi_RankAdjOE > 40 or hi_RankAdjDE > 40) and (lo_RankAdjOE <= 50 or lo_RankAdjDE <= 50)",
+        "criteria": "4-seed RankAdjOE ({hi_RankAdjOE}) or RankAdjDE ({hi_RankAdjDE}) > 40 AND "
+                    "13-seed RankAdjOE ({lo_RankAdjOE}) or RankAdjDE ({lo_RankAdjDE}) ≤ 50",
+    },
+    {
+        "higher": 5, "lower": 12,
+        "when": "(hi_RankAdjOE >= 60 or hi_RankAdjDE >= 60) or (lo_RankAdjEM <= 60 and hi_RankAdjEM <= 20)",
+        "criteria": "5-seed RankAdjOE ({hi_RankAdjOE}) or RankAdjDE ({hi_RankAdjDE}) ≥ 60 OR "
+                    "(12-seed RankAdjEM ({lo_RankAdjEM}) ≤ 60 AND 5-seed RankAdjEM ({hi_RankAdjEM}) ≤ 20)",
+    },
+    {
+        "higher": 6, "lower": 11, "all_lower_seeds": True,
+        "when": "lo_RankAdjEM < hi_RankAdjEM or abs(lo_RankAdjEM - hi_RankAdjEM) <= 5",
+        "criteria": "11-seed RankAdjEM ({lo_RankAdjEM}) < 6-seed RankAdjEM ({hi_RankAdjEM}) OR within 5 spots",
+    },
+    {
+        "higher": 7, "lower": 10,
+        "when": "lo_RankAdjEM < hi_RankAdjEM",
+        "criteria": "10-seed RankAdjEM ({lo_RankAdjEM}) < 7-seed RankAdjEM ({hi_RankAdjEM})",
+    },
+]
+
+METRICS = ["RankAdjOE", "RankAdjDE", "RankAdjEM"]
+UPSET_COLUMNS = ["Matchup", "Upset_Type", "Higher_Seed", "Lower_Seed", "Criteria",
+                 "Higher_Seed_RankAdjOE", "Higher_Seed_RankAdjDE", "Higher_Seed_RankAdjEM",
+                 "Lower_Seed_RankAdjOE", "Lower_Seed_RankAdjDE", "Lower_Seed_RankAdjEM"]
+
+
+def complete_regions(df, keys=("Season", "Region")):
+    """(Season, Region) groups that have exactly seeds 1-16."""
+    seeds = df.dropna(subset=["Seed"]).drop_duplicates(subset=[*keys, "Seed"])
+    seeds = seeds[seeds["Seed"].between(1, 16)]
+    counts = seeds.groupby(list(keys), sort=False)["Seed"].nunique()
+    return counts[counts == 16].index.to_frame(index=False)
+
+
+def evaluate_upsets(df, rules=UPSET_RULES, keys=("Season", "Region")):
+    """Evaluate every rule for every region of every season in one merge.
+
+    df holds School, Seed, RankAdjOE/DE/EM and the key columns (a single
+    season also works with keys=("Region",)). Only regions with all 16 seeds
+    are considered. Returns the matched upsets with the key columns first.
+    """
+    keys = list(keys)
+    teams = df.dropna(subset=["Seed", *METRICS])
+    teams = teams.merge(complete_regions(df, keys), on=keys)[[*keys, "School", "Seed", *METRICS]]
+    teams["School"] = teams["School"].astype(str)
+    # One representative per seed line (best RankAdjOE), as the bracket shows it
+    single = teams.sort_values("RankAdjOE", kind="stable").drop_duplicates(subset=[*keys, "Seed"])
+
+    table = pd.DataFrame(rules).reset_index(names="rule")
+    if "all_lower_seeds" not in table:
+        table["all_lower_seeds"] = False
+    table["all_lower_seeds"] = table["all_lower_seeds"].fillna(False).astype(bool)
+
+    hi = single.add_prefix("hi_").rename(columns={f"hi_{k}": k for k in keys})
+    pairs = table.merge(hi, left_on="higher", right_on="hi_Seed")
+    lower_single = single.add_prefix("lo_").rename(columns={f"lo_{k}": k for k in keys})
+    lower_all = teams.sort_values("RankAdjEM", kind="stable").add_prefix("lo_").rename(
+        columns={f"lo_{k}": k for k in keys})
+    pairs = pd.concat([
+        pairs[~pairs["all_lower_seeds"]].merge(lower_single, left_on=[*keys, "lower"], right_on=[*keys, "lo_Seed"]),
+        pairs[pairs["all_lower_seeds"]].merge(lower_all, left_on=[*keys, "lower"], right_on=[*keys, "lo_Seed"]),
+    ], ignore_index=True)
+
+    # One vectorized predicate per rule, each covering every season and region
+    hit = pd.Series(False, index=pairs.index)
+    for rule, group in pairs.groupby("rule", sort=False):
+        hit.loc[group.index] = group.eval(table.at[rule, "when"]).to_numpy(dtype=bool)
+    upsets = pairs[hit.to_numpy()]
+
+    region_order = {key: i for i, key in enumerate(map(tuple, teams[keys].drop_duplicates().to_numpy()))}
+    upsets = upsets.assign(_region=[region_order[tuple(k)] for k in upsets[keys].to_numpy()])
+    upsets = upsets.sort_values(["_region", "rule"], kind="stable")
+
+    result = pd.DataFrame({
+        "Matchup": upsets["hi_School"] + " (" + upsets["higher"].astype(str) + ") vs "
+                   + upsets["lo_School"] + " (" + upsets["lower"].astype(str) + ")",
+        "Upset_Type": upsets["higher"].astype(str) + " vs " + upsets["lower"].astype(str),
+        "Higher_Seed": upsets["hi_School"],
+        "Lower_Seed": upsets["lo_School"],
+        "Criteria": [table.at[rule, "criteria"].format(**row)
+                     for rule, row in zip(upsets["rule"], upsets.to_dict("records"))],
+    })
+    for side, prefix in [("Higher_Seed", "hi_"), ("Lower_Seed", "lo_")]:
+        for metric in METRICS:
+            result[f"{side}_{metric}"] = upsets[prefix + metric]
+    for k in reversed(keys):
+        result.insert(0, k, upsets[k])
+    return result.reset_index(drop=True)
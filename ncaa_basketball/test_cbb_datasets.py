@@ -0,0 +1,109 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cbb_datasets import (KENPOM_SUMMARY_FILE, MARCH_MADNESS_FILE, SchemaError, _table_dir, load_table,
+                          sync_dataset)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "kaggle")
+HANDLE = "fixtures/march-madness"
+
+
+class FixtureDownloader:
+    """Stands in for kagglehub: returns a copy of the fixture directory and counts calls."""
+
+    def __init__(self, tmp_path, source=FIXTURES):
+        self.tmp_path = tmp_path
+        self.source = source
+        self.calls = 0
+
+    def __call__(self, handle):
+        self.calls += 1
+        target = self.tmp_path / f"download-{self.calls}"
+        shutil.copytree(self.source, target)
+        return str(target)
+
+
+def offline(handle):
+    raise AssertionError("the network must not be touched")
+
+
+def test_sync_is_content_addressed_and_reuses_the_manifest(tmp_path):
+    cache = str(tmp_path / "cache")
+    download = FixtureDownloader(tmp_path)
+    manifest = sync_dataset(HANDLE, cache, downloader=download)
+
+    assert sorted(manifest["files"]) == [MARCH_MADNESS_FILE, KENPOM_SUMMARY_FILE]
+    for name, digest in manifest["files"].items():
+        with open(os.path.join(FIXTURES, name), "rb") as f, open(os.path.join(cache, "objects", digest), "rb") as g:
+            assert f.read() == g.read()
+
+    assert sync_dataset(HANDLE, cache, downloader=download) == manifest
+    assert download.calls == 1
+
+    # A refresh with identical content stores no new objects
+    assert sync_dataset(HANDLE, cache, refresh=True, downloader=download) == manifest
+    assert download.calls == 2
+    assert len(os.listdir(os.path.join(cache, "objects"))) == 2
+
+
+def test_parquet_table_reads_only_requested_seasons(tmp_path):
+    pytest.importorskip("pyarrow")
+    cache = str(tmp_path / "cache")
+    df = load_table(KENPOM_SUMMARY_FILE, seasons=[2024, 2025], columns=["Season", "TeamName", "RankAdjOE"],
+                    handle=HANDLE, cache_dir=cache, downloader=FixtureDownloader(tmp_path))
+
+    assert list(df.columns) == ["Season", "TeamName", "RankAdjOE"]
+    assert sorted(df["Season"].unique()) == [2024, 2025]
+    assert len(df) == 5
+
+    digest = sync_dataset(HANDLE, cache, downloader=offline)["files"][KENPOM_SUMMARY_FILE]
+    partitions = os.listdir(os.path.join(_table_dir(cache, digest), "data"))
+    assert sorted(partitions) == ["Season=2023", "Season=2024", "Season=2025"]
+
+    # numpy integers are single seasons too
+    one = load_table(KENPOM_SUMMARY_FILE, seasons=np.int64(2023), handle=HANDLE, cache_dir=cache, downloader=offline)
+    assert set(one["Season"]) == {2023}
+    assert len(one) == 3
+
+
+def test_missing_column_raises_schema_error(tmp_path):
+    broken = tmp_path / "broken"
+    shutil.copytree(FIXTURES, broken)
+    path = broken / MARCH_MADNESS_FILE
+    lines = path.read_text().splitlines()
+    header = lines[0].split(",")
+    drop = header.index("Region")
+    path.write_text("\n".join(",".join(v for i, v in enumerate(line.split(",")) if i != drop) for line in lines))
+
+    with pytest.raises(SchemaError, match="Region"):
+        load_table(MARCH_MADNESS_FILE, handle=HANDLE, cache_dir=str(tmp_path / "cache"),
+                   downloader=FixtureDownloader(tmp_path, str(broken)))
+
+
+def test_reload_is_offline(tmp_path):
+    cache = str(tmp_path / "cache")
+    first = load_table(MARCH_MADNESS_FILE, handle=HANDLE, cache_dir=cache, downloader=FixtureDownloader(tmp_path))
+    again = load_table(MARCH_MADNESS_FILE, handle=HANDLE, cache_dir=cache, downloader=offline)
+    assert again.equals(first)
+    assert set(again["Region"]) == {"West", "South", "East"}
+
+    with open(os.path.join(cache, "datasets", HANDLE.replace("/", "__") + ".json")) as f:
+        assert json.load(f)["handle"] == HANDLE
+
+
+def test_unknown_schools_warn(tmp_path):
+    from cbb_teams import add_team_ids, build_school_index
+
+    kenpom = load_table(KENPOM_SUMMARY_FILE, columns=["Season", "TeamName"], handle=HANDLE,
+                        cache_dir=str(tmp_path / "cache"), downloader=FixtureDownloader(tmp_path))
+    index = build_school_index(kenpom)
+    scraped = pd.DataFrame({"school_name": ["UConn", "Houston", "Springfield"]})
+    with pytest.warns(UserWarning, match="1 school name"):
+        df = add_team_ids(scraped, "school_name", index)
+    assert df["team_id"].astype(object).tolist()[:2] == ["Connecticut", "Houston"]
+    assert df["team_id"].isna().tolist() == [False, False, True]
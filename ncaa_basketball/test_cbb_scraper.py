@@ -0,0 +1,138 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from cbb_scraper import PageCache, RateLimiter, fetch, make_session, scrape_seasons
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sports_reference")
+LAST_MODIFIED = "Mon, 07 Apr 2025 12:00:00 GMT"
+PAGE = "/cbb/seasons/men/2025-advanced-school-stats.html"
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Local sports-reference stand-in. Serves the fixture pages for any season,
+    answers conditional requests with 304 and fails paths listed in failures
+    with their queued (status, headers) first."""
+
+    etag = True
+    failures = {}
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.requests.append((self.path, time.monotonic(), dict(self.headers)))
+            queued = self.failures.get(self.path)
+            failure = queued.pop(0) if queued else None
+        if failure:
+            status, headers = failure
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        page = self.path.rsplit("/", 1)[-1].split("-", 1)[-1]
+        path = os.path.join(FIXTURES, "2025-" + page)
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+        validators = {"Last-Modified": LAST_MODIFIED}
+        if self.etag:
+            validators["ETag"] = f'"{page}-v1"'
+        if (self.etag and self.headers.get("If-None-Match") == validators["ETag"]) or \
+                (not self.etag and self.headers.get("If-Modified-Since") == LAST_MODIFIED):
+            self.send_response(304)
+            for name, value in validators.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in validators.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    handler = type("Handler", (StandIn,), {"failures": {}, "requests": [], "lock": threading.Lock()})
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.mark.parametrize("etag", [True, False])
+def test_unchanged_page_is_revalidated_not_downloaded(tmp_path, server, etag):
+    handler, base_url = server
+    handler.etag = etag
+    cache, limiter = PageCache(str(tmp_path)), RateLimiter(0)
+    with make_session(1) as session:
+        body, from_cache = fetch(session, base_url + PAGE, cache, limiter)
+        assert not from_cache
+        again, from_cache = fetch(session, base_url + PAGE, cache, limiter)
+    assert from_cache
+    assert again == body
+    assert b'id="adv_school_stats"' in body
+
+    headers = handler.requests[1][2]
+    if etag:
+        assert headers["If-None-Match"] == '"advanced-school-stats.html-v1"'
+    assert headers["If-Modified-Since"] == LAST_MODIFIED
+
+
+def test_retries_wait_for_the_rate_limiter(tmp_path, server):
+    handler, base_url = server
+    handler.failures[PAGE] = [(503, {}), (502, {})]
+    with make_session(1) as session:
+        body, _ = fetch(session, base_url + PAGE, PageCache(str(tmp_path)), RateLimiter(0.2), backoff=0)
+    assert b'id="adv_school_stats"' in body
+    times = [t for _, t, _ in handler.requests]
+    assert len(times) == 3
+    assert min(b - a for a, b in zip(times, times[1:])) >= 0.15
+
+
+def test_retry_after_holds_back_the_host(tmp_path, server):
+    handler, base_url = server
+    handler.failures[PAGE] = [(429, {"Retry-After": "1"})]
+    with make_session(1) as session:
+        fetch(session, base_url + PAGE, PageCache(str(tmp_path)), RateLimiter(0), backoff=0)
+    (_, first, _), (_, second, _) = handler.requests
+    assert second - first >= 0.9
+
+
+def test_retries_give_up(tmp_path, server):
+    handler, base_url = server
+    handler.failures[PAGE] = [(500, {})] * 3
+    with make_session(1) as session, pytest.raises(requests.HTTPError):
+        fetch(session, base_url + PAGE, PageCache(str(tmp_path)), RateLimiter(0), retries=2, backoff=0)
+    assert len(handler.requests) == 3
+
+
+def test_concurrent_seasons_respect_the_per_host_rate_limit(tmp_path, server):
+    handler, base_url = server
+    df = scrape_seasons([2024, 2025], base_url=base_url, cache_dir=str(tmp_path), workers=4, min_interval=0.1)
+    times = sorted(t for _, t, _ in handler.requests)
+    assert len(times) == 4
+    assert min(b - a for a, b in zip(times, times[1:])) >= 0.08
+
+    assert df["Season"].tolist() == [2024, 2024, 2024, 2024, 2025, 2025, 2025, 2025]
+    auburn = df[df["school_name"] == "AuburnNCAA"].iloc[0]
+    assert auburn["efg_pct"] == pytest.approx(0.561)
+    assert auburn["opp_efg_pct"] == pytest.approx(0.462)
+    assert df["opp_efg_pct"].isna().sum() == 4
@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+
+from cbb_stats_table import OFFENSIVE_STATS, parse_stats_table, stats_frame
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "sports_reference")
+ADVANCED = os.path.join(FIXTURES, "2025-advanced-school-stats.html")
+OPPONENT = os.path.join(FIXTURES, "2025-advanced-opponent-stats.html")
+
+
+def test_repeated_header_rows_are_skipped():
+    columns = parse_stats_table(ADVANCED)
+    assert columns["ranker"] == ["1", "2", "3", "4"]
+    # The tournament tag is glued to the school name; team_index strips it
+    assert columns["school_name"] == ["AuburnNCAA", "North Dakota State", "St. Thomas", "MississippiNCAA"]
+    assert columns["efg_pct"] == [".561", ".592", ".595", ".522"]
+    # Empty and missing cells both come back as ""
+    assert columns["ft_rate"] == [".301", ".243", "", ""]
+    assert "header_tmp" not in columns
+
+
+def test_sources_and_column_selection():
+    with open(ADVANCED, "rb") as f:
+        html = f.read()
+    stats = list(OFFENSIVE_STATS)
+    expected = parse_stats_table(ADVANCED, stats=stats)
+    assert list(expected) == stats
+    assert parse_stats_table(html, stats=stats) == expected
+    assert parse_stats_table(html.decode("utf-8"), stats=stats) == expected
+    with open(ADVANCED, "rb") as f:
+        assert parse_stats_table(f, stats=stats) == expected
+
+
+def test_table_inside_html_comment():
+    columns = parse_stats_table(OPPONENT, table_id="adv_opp_stats")
+    assert columns["school_name"] == ["AuburnNCAA", "North Dakota State"]
+    assert columns["opp_efg_pct"] == [".462", ".531"]
+    assert columns["opp_tov_pct"] == ["15.5", "14.2"]
+
+
+def test_missing_table():
+    assert parse_stats_table(OPPONENT, table_id="adv_school_stats") is None
+    assert parse_stats_table(ADVANCED, table_id="adv_opp_stats") is None
+
+
+def test_stats_frame():
+    df = stats_frame(parse_stats_table(ADVANCED, stats=list(OFFENSIVE_STATS)))
+    assert list(df.columns) == list(OFFENSIVE_STATS.values())
+    assert df["School"].tolist()[1] == "North Dakota State"
+    np.testing.assert_allclose(df["O eFG%"], [0.561, 0.592, 0.595, 0.522])
+    assert df["O FT/FGA"].isna().tolist() == [False, False, True, True]
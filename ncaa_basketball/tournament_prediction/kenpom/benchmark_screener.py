@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "..", "..", "benchmarks"))
+import synthetic
+from cbb_kenpom_screener import RankIndex
+
+# Compare the cumulative-count RankIndex with re-filtering the KenPom table for
+# every (OE, DE) cutoff, as cbb_kenpom_prediction.py does for its single one,
+# on synthetic multi-season summaries; both must agree on every cell.
+SEASON_COUNTS = [int(s) for s in sys.argv[1:]] or [1, 24, 100]
+MAX_RANK = 60
+
+
+def refilter_sweep(df, champions, ranks):
+    seasons = sorted(champions)
+    hits = np.zeros((len(seasons), len(ranks), len(ranks)), dtype=np.int8)
+    eligible = np.zeros((len(seasons), len(ranks), len(ranks)), dtype=np.int64)
+    for i, oe in enumerate(ranks):
+        for j, de in enumerate(ranks):
+            inside = df[(df["RankAdjOE"] <= oe) & (df["RankAdjDE"] <= de)]
+            counts = inside.groupby("Season").size()
+            eligible[:, i, j] = counts.reindex(seasons, fill_value=0).to_numpy()
+            teams = set(zip(inside["Season"], inside["TeamName"]))
+            hits[:, i, j] = [(season, champions[season]) in teams for season in seasons]
+    return hits.reshape(len(seasons), -1), eligible.reshape(len(seasons), -1)
+
+
+def index_sweep(df, champions, ranks):
+    hits, eligible = RankIndex(df).sweep(champions, ranks, ranks)
+    return hits.to_numpy(), eligible.to_numpy()
+
+
+if __name__ == "__main__":
+    ranks = np.arange(1, MAX_RANK + 1)
+    print(f"{len(ranks) ** 2} cutoffs per season")
+    print(f"{'seasons':>8} {'re-filter (s)':>14} {'index (s)':>10} {'speedup':>8}")
+    for n_seasons in SEASON_COUNTS:
+        df = synthetic.kenpom_summary(n_seasons)
+        champions = df[df["RankAdjEM"] == 1].set_index("Season")["TeamName"].to_dict()
+
+        start = time.perf_counter()
+        expected = refilter_sweep(df, champions, ranks)
+        refilter = time.perf_counter() - start
+        start = time.perf_counter()
+        result = index_sweep(df, champions, ranks)
+        indexed = time.perf_counter() - start
+
+        assert all((a == b).all() for a, b in zip(expected, result)), "RankIndex disagrees with re-filtering"
+        print(f"{n_seasons:>8} {refilter:>14.3f} {indexed:>10.4f} {refilter / indexed:>7.0f}x")
@@ -0,0 +1,176 @@
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CBB_DIR = os.path.normpath(os.path.join(HERE, "..", ".."))
+ROOT = os.path.dirname(CBB_DIR)
+for path in (CBB_DIR, ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+from cbb_datasets import KENPOM_SUMMARY_FILE, load_table
+from cbb_teams import school_index
+from profiling import session, stage
+
+# Eligibility screener over every KenPom season. RankIndex counts, once per
+# season, the teams at each (RankAdjOE, RankAdjDE) cell and takes cumulative
+# sums along both axes, so counts[s, oe, de] is the number of teams with
+# RankAdjOE <= oe and RankAdjDE <= de. Any cutoff is then a single lookup and
+# a whole threshold sweep is one fancy-indexing call; a champion is inside a
+# cutoff exactly when both of its ranks are, which broadcasts over the grid.
+
+# National champions by season, spelled as KenPom's TeamName (2020 had no tournament)
+CHAMPIONS = {
+    2002: "Maryland", 2003: "Syracuse", 2004: "Connecticut", 2005: "North Carolina", 2006: "Florida",
+    2007: "Florida", 2008: "Kansas", 2009: "North Carolina", 2010: "Duke", 2011: "Connecticut",
+    2012: "Kentucky", 2013: "Louisville", 2014: "Connecticut", 2015: "Duke", 2016: "Villanova",
+    2017: "North Carolina", 2018: "Villanova", 2019: "Virginia", 2021: "Baylor", 2022: "Kansas",
+    2023: "Connecticut", 2024: "Connecticut", 2025: "Florida",
+}
+SWEEP_MAX_RANK = 60
+INDEX_COLUMNS = ["Season", "TeamName", "RankAdjOE", "RankAdjDE"]
+
+
+class RankIndex:
+    """Cumulative team counts for every (max OE rank, max DE rank) cutoff of every season."""
+
+    def __init__(self, df, max_rank=None, team_index=None):
+        # With a team_index (cbb_teams.school_index()) champions are matched by
+        # school id, so other spellings and renamed schools still find their row
+        self.team_index = team_index
+        df = df[INDEX_COLUMNS].copy()
+        for col in ["RankAdjOE", "RankAdjDE"]:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        df = df.dropna(subset=["Season", "RankAdjOE", "RankAdjDE"])
+        df["Season"] = df["Season"].astype(int)
+        df["TeamName"] = df["TeamName"].astype(str)
+        self.teams = df.reset_index(drop=True)
+
+        self.seasons = np.unique(df["Season"].to_numpy())
+        oe = df["RankAdjOE"].to_numpy().astype(np.int64).clip(1)
+        de = df["RankAdjDE"].to_numpy().astype(np.int64).clip(1)
+        # Cutoffs above max_rank are treated as max_rank; teams ranked below it still
+        # count there, so the last row and column hold the whole season
+        self.max_rank = int(max_rank or max(oe.max(initial=1), de.max(initial=1)))
+        oe, de = oe.clip(max=self.max_rank), de.clip(max=self.max_rank)
+
+        counts = np.zeros((len(self.seasons), self.max_rank + 1, self.max_rank + 1), dtype=np.int32)
+        np.add.at(counts, (np.searchsorted(self.seasons, df["Season"].to_numpy()), oe, de), 1)
+        counts.cumsum(axis=1, out=counts)
+        counts.cumsum(axis=2, out=counts)
+        self.counts = counts
+
+    def _positions(self, seasons):
+        seasons = np.atleast_1d(np.asarray(seasons, dtype=int))
+        pos = np.searchsorted(self.seasons, seasons).clip(max=len(self.seasons) - 1)
+        missing = seasons[self.seasons[pos] != seasons]
+        if len(missing):
+            raise KeyError(f"No KenPom ranks for season(s): {', '.join(map(str, missing))}")
+        return pos
+
+    def _cutoffs(self, ranks):
+        return np.asarray(ranks, dtype=np.int64).clip(0, self.max_rank)
+
+    def count(self, season, max_oe_rank, max_de_rank):
+        """Number of teams inside one cutoff in one season."""
+        return int(self.counts[self._positions(season)[0], self._cutoffs(max_oe_rank), self._cutoffs(max_de_rank)])
+
+    def counts_by_season(self, max_oe_rank, max_de_rank):
+        """Teams inside one cutoff, per season."""
+        return pd.Series(self.counts[:, self._cutoffs(max_oe_rank), self._cutoffs(max_de_rank)],
+                         index=pd.Index(self.seasons, name="Season"), name="eligible")
+
+    def team_ranks(self, champions=None):
+        """Season, TeamName and ranks of one team per season (default: CHAMPIONS).
+        Seasons without ranks for that team are left out with a warning."""
+        champions = CHAMPIONS if champions is None else champions
+        wanted = pd.DataFrame({"Season": list(champions), "TeamName": list(champions.values())})
+        if self.team_index is None:
+            found = wanted.merge(self.teams, on=["Season", "TeamName"], how="inner")
+        else:
+            teams = self.teams.assign(team_id=self.team_index.resolve(self.teams["TeamName"]))
+            found = wanted.assign(team_id=self.team_index.resolve(wanted["TeamName"])).drop(columns="TeamName").merge(
+                teams, on=["Season", "team_id"], how="inner").drop(columns="team_id")
+        found = found.drop_duplicates("Season").sort_values("Season", ignore_index=True)
+        missing = wanted.loc[~wanted["Season"].isin(found["Season"]) & wanted["Season"].isin(self.seasons)]
+        for season, team in missing.itertuples(index=False):
+            warnings.warn(f"No {season} KenPom ranks for champion {team!r}; season skipped", stacklevel=2)
+        return found
+
+    def sweep(self, champions=None, max_oe_ranks=None, max_de_ranks=None):
+        """Champion hits and eligible counts for every cutoff pair.
+
+        Returns (hits, eligible): DataFrames indexed by Season (the seasons with a
+        ranked champion) with (max_oe_rank, max_de_rank) columns; hits is 1 where
+        the cutoff contained that season's champion. Ranks default to
+        1..SWEEP_MAX_RANK (capped at max_rank).
+        """
+        default = np.arange(1, min(SWEEP_MAX_RANK, self.max_rank) + 1)
+        oe_cut = self._cutoffs(default if max_oe_ranks is None else max_oe_ranks)
+        de_cut = self._cutoffs(default if max_de_ranks is None else max_de_ranks)
+        champs = self.team_ranks(champions)
+        pos = self._positions(champs["Season"].to_numpy())
+
+        champ_oe = champs["RankAdjOE"].to_numpy()[:, None, None]
+        champ_de = champs["RankAdjDE"].to_numpy()[:, None, None]
+        hits = (oe_cut[None, :, None] >= champ_oe) & (de_cut[None, None, :] >= champ_de)
+        eligible = self.counts[pos[:, None, None], oe_cut[None, :, None], de_cut[None, None, :]]
+
+        index = pd.Index(champs["Season"].to_numpy(), name="Season")
+        columns = pd.MultiIndex.from_product([oe_cut, de_cut], names=["max_oe_rank", "max_de_rank"])
+        return (pd.DataFrame(hits.reshape(len(pos), -1).astype(np.int8), index=index, columns=columns),
+                pd.DataFrame(eligible.reshape(len(pos), -1), index=index, columns=columns))
+
+
+def summarize(hits, eligible):
+    """One row per cutoff: share of seasons whose champion it contained, mean
+    field size, and the per-season hits; most hits with fewest teams first."""
+    summary = pd.DataFrame({
+        "hit_rate": hits.mean(axis=0),
+        "hits": hits.sum(axis=0),
+        "mean_eligible": eligible.mean(axis=0),
+    })
+    per_season = hits.T
+    per_season.columns = [str(season) for season in per_season.columns]
+    summary = summary.join(per_season).reset_index()
+    return summary.sort_values(["hit_rate", "mean_eligible", "max_oe_rank", "max_de_rank"],
+                               ascending=[False, True, True, True], ignore_index=True)
+
+
+def load_index(seasons=None, max_rank=None):
+    """RankIndex over the KenPom summary (every season by default)."""
+    return RankIndex(load_table(KENPOM_SUMMARY_FILE, seasons=seasons, columns=INDEX_COLUMNS), max_rank=max_rank,
+                     team_index=school_index())
+
+
+def run(max_rank=SWEEP_MAX_RANK, champions=None, output_dir="."):
+    """Sweep every (OE, DE) rank cutoff up to max_rank over all seasons; returns the summary."""
+    with stage("load"):
+        index = load_index()
+    with stage("analyze"):
+        ranks = np.arange(1, max_rank + 1)
+        hits, eligible = index.sweep(champions, ranks, ranks)
+        summary = summarize(hits, eligible)
+
+    seasons = f"{hits.index.min()}-{hits.index.max()}" if len(hits) else "no seasons"
+    print(f"Champions inside each KenPom rank cutoff, {len(hits)} seasons ({seasons}):")
+    print(summary.head(10)[["max_oe_rank", "max_de_rank", "hits", "hit_rate", "mean_eligible"]]
+          .to_string(index=False, float_format=lambda x: f"{x:.2f}"))
+    if len(hits):
+        current = (min(21, max_rank), min(31, max_rank))
+        print(f"OE <= {current[0]}, DE <= {current[1]} contained {int(hits[current].sum())} of {len(hits)} champions "
+              f"with {eligible[current].mean():.1f} teams on average")
+
+    path = os.path.join(output_dir, "cbb_kenpom_threshold_sweep.csv")
+    with stage("save"):
+        summary.to_csv(path, index=False)
+    print(f"Threshold sweep saved to {path}")
+    return summary
+
+
+if __name__ == "__main__":
+    with session("cbb_kenpom_screener"):
+        run()
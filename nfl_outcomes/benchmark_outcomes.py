@@ -0,0 +1,41 @@
+import sys
+import time
+
+import pandas as pd
+
+from nfl_game_outcomes import compute_outcomes, team_win_table
+
+# Benchmark the vectorized outcome engine against the original row-wise apply
+# at 1x, 10x and 100x the size of spreadspoke_scores.csv
+SCALES = [int(s) for s in sys.argv[1:]] or [1, 10, 100]
+
+
+def apply_path(df):
+    df = df.dropna(subset=["score_home", "score_away"]).copy()
+    df["winner"] = df.apply(lambda row: row["team_home"] if row["score_home"] > row["score_away"] else row["team_away"], axis=1)
+    home_wins = df[df["score_home"] > df["score_away"]].shape[0]
+    return home_wins, df["winner"].value_counts()
+
+
+def vectorized_path(df):
+    df = compute_outcomes(df)
+    return int(df["home_win"].sum()), team_win_table(df)
+
+
+def best_of(fn, df, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(df)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+base = pd.read_csv("spreadspoke_scores.csv")
+print(f"{'scale':>6} {'rows':>10} {'apply (s)':>10} {'vectorized (s)':>15} {'speedup':>8}")
+for scale in SCALES:
+    df = pd.concat([base] * scale, ignore_index=True)
+    repeat = 3 if scale < 100 else 1
+    t_apply = best_of(apply_path, df, repeat)
+    t_vec = best_of(vectorized_path, df, repeat)
+    print(f"{scale:>5}x {len(df):>10} {t_apply:>10.3f} {t_vec:>15.4f} {t_apply / t_vec:>7.1f}x")
@@ -1,37 +1,60 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Load and clean dataset
-df = pd.read_csv("spreadspoke_scores.csv")
-df = df[df["schedule_season"] >= 2018]
-df.dropna(subset=["score_home", "score_away"], inplace=True)
-df["winner"] = df.apply(lambda row: row["team_home"] if row["score_home"] > row["score_away"] else row["team_away"], axis=1)
-
-# Home-field advantage
-home_wins = df[df["score_home"] > df["score_away"]].shape[0]
-total_games = df.shape[0]
-home_win_pct = (home_wins / total_games) * 100
-print(f"Games Analyzed (2018+): {total_games}")
-print(f"Home Win Percentage (2018+): {home_win_pct:.2f}%")
-
-# Top teams
-team_wins = df["winner"].value_counts().head(10)
-print("\nTop 10 Teams by Wins (2018+):")
-print(team_wins)
-
-# Visualize home vs. away
-outcomes = {"Home Wins": home_wins, "Away Wins": total_games - home_wins}
-plt.bar(outcomes.keys(), outcomes.values(), color=["blue", "orange"])
-plt.title("Home vs. Away Wins (NFL 2018+)")
-plt.ylabel("Number of Games")
-plt.savefig("home_away_wins.png")
-plt.show()
-
-# Visualize top teams
-plt.figure(figsize=(10, 6))
-sns.barplot(x=team_wins.values, y=team_wins.index, palette="viridis")
-plt.title("Top 10 NFL Teams by Wins (2018+)")
-plt.xlabel("Wins")
-plt.savefig("top_teams.png")
-plt.show()
\ No newline at end of file
+import os
+import sys
+from nfl_franchises import TEAMS_CSV, franchise_index
+from nfl_game_outcomes import compute_outcomes, home_field_summary, team_win_table
+from nfl_score_cache import load_scores
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from profiling import session, stage
+
+SCORES_CSV = os.path.join(HERE, "spreadspoke_scores.csv")
+
+
+def render_nfl_charts(summary, team_wins, since=2018, output_dir="."):
+    """Home vs. away and top-teams charts (headless; skipped when the data is unchanged)."""
+    from chart_render import Chart, render_charts
+    from nfl_charts import home_away_wins, top_teams
+
+    outcomes = {"Home Wins": int(summary["home_wins"]), "Away Wins": int(summary["away_wins"])}
+    return render_charts([
+        Chart(os.path.join(output_dir, "home_away_wins.png"), home_away_wins, outcomes, {"since": since}),
+        Chart(os.path.join(output_dir, "top_teams.png"), top_teams, team_wins, {"since": since}, (10, 6)),
+    ])
+
+
+def run(since=2018, top=10, charts=True, output_dir=".", csv_path=SCORES_CSV, teams_csv=TEAMS_CSV):
+    """Home-field advantage and top teams by wins from `since` on; returns (summary, team_wins)."""
+    # Load and clean dataset (only the season partitions from `since` on are read from the cache);
+    # teams are franchises, so e.g. the Oakland and Las Vegas Raiders count as one team
+    with stage("load"):
+        with stage("teams"):
+            teams = franchise_index(teams_csv, csv_path)
+        with stage("read"):
+            df = load_scores(csv_path, min_season=since, team_index=teams)
+    with stage("transform"):
+        df = compute_outcomes(df)
+
+    # Home-field advantage (ties are no longer counted as away wins) and top teams
+    with stage("analyze"):
+        summary = home_field_summary(df, include_neutral=True)
+        team_wins = team_win_table(df)["wins"].head(top)
+    print(f"Games Analyzed ({since}+): {summary['games']}")
+    print(f"Home Win Percentage ({since}+): {summary['home_win_pct']:.2f}%")
+    print(f"Ties ({since}+): {summary['ties']}")
+
+    # Top teams
+    print(f"\nTop {top} Teams by Wins ({since}+):")
+    print(team_wins)
+
+    if charts:
+        with stage("render"):
+            render_nfl_charts(summary, team_wins, since, output_dir)
+    return summary, team_wins
+
+
+if __name__ == "__main__":
+    with session("nfl_analysis"):
+        run()
@@ -0,0 +1,261 @@
+import itertools
+import os
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from nfl_franchises import SCORES_CSV, franchise_index
+
+# Against-the-spread and over/under settlement plus a rule backtester that
+# scores many betting rules at once as a (rules x games) matrix product.
+
+BETS = ["home_ats", "away_ats", "favorite_ats", "underdog_ats", "over", "under"]
+FEATURES = ["home_line", "spread", "total_line", "wind_mph", "temperature", "humidity",
+            "season", "week", "playoff", "neutral", "home_favorite"]
+
+# Standard -110 pricing: risk 110 to win 100
+WIN_UNITS = 100 / 110
+
+RuleSet = namedtuple("RuleSet", ["names", "bet", "lower", "upper", "active"])
+
+
+def settle_games(df, team_index=None):
+    """Settle ATS and over/under for every game with a score.
+
+    Adds favorite/underdog team names, the home line (positive when the home
+    team is getting points), cover margins and per-bet results coded as
+    1 win, -1 loss, 0 push and NaN when there was no line to bet. Team names
+    and favorite codes are matched through team_index (default: the persisted
+    franchise index); a game with a team it cannot resolve gets no ATS result,
+    with a warning.
+    """
+    df = df.dropna(subset=["score_home", "score_away"]).copy()
+    if team_index is None:
+        team_index = franchise_index()
+    home_id = team_index.resolve(df["team_home"].astype(str))
+    away_id = team_index.resolve(df["team_away"].astype(str))
+    fav = df["team_favorite_id"].astype(object)
+    pick = (fav == "PICK").to_numpy()
+    fav_id = team_index.resolve(fav.fillna("").astype(str))
+
+    unmatched = team_index.unmatched(pd.concat([df["team_home"].astype(str), df["team_away"].astype(str),
+                                                fav[fav.notna() & ~pick].astype(str)]))
+    if unmatched:
+        warnings.warn(f"{len(unmatched)} team name(s) or code(s) not in the franchise index, "
+                      f"their games are not settled against the spread: {', '.join(unmatched)}", stacklevel=2)
+    known = (home_id >= 0) & (away_id >= 0)
+
+    score_home = df["score_home"].to_numpy(dtype=float)
+    score_away = df["score_away"].to_numpy(dtype=float)
+    spread = pd.to_numeric(df["spread_favorite"], errors="coerce").to_numpy(dtype=float)
+    total_line = pd.to_numeric(df["over_under_line"], errors="coerce").to_numpy(dtype=float)
+
+    home_fav = known & (fav_id == home_id)
+    away_fav = known & (fav_id == away_id)
+    pick = known & pick
+    has_line = (home_fav | away_fav | pick) & ~np.isnan(spread)
+    spread = np.where(pick, 0.0, spread)
+
+    # Home line: points added to the home score, e.g. +3 for a home underdog
+    home_line = np.where(has_line, np.where(home_fav, spread, -spread), np.nan)
+    home_cover = np.sign(score_home - score_away + home_line)
+    fav_cover = np.where(home_fav, home_cover, np.where(away_fav, -home_cover, np.nan))
+    total_result = np.sign(score_home + score_away - total_line)
+
+    df["team_favorite"] = np.where(home_fav, df["team_home"].astype(object),
+                                   np.where(away_fav, df["team_away"].astype(object), None))
+    df["team_underdog"] = np.where(home_fav, df["team_away"].astype(object),
+                                   np.where(away_fav, df["team_home"].astype(object), None))
+    df["home_line"] = home_line
+    df["home_cover_margin"] = score_home - score_away + home_line
+    df["total_points"] = score_home + score_away
+    df["home_ats"] = home_cover
+    df["away_ats"] = -home_cover
+    df["favorite_ats"] = fav_cover
+    df["underdog_ats"] = -fav_cover
+    df["over"] = total_result
+    df["under"] = -total_result
+    return df
+
+
+def feature_matrix(settled):
+    """(games x FEATURES) float matrix that rules are evaluated against."""
+    week = pd.to_numeric(settled["schedule_week"].astype(str), errors="coerce")
+    columns = {
+        "home_line": settled["home_line"],
+        "spread": settled["home_line"].abs(),
+        "total_line": pd.to_numeric(settled["over_under_line"], errors="coerce"),
+        "wind_mph": settled["weather_wind_mph"],
+        "temperature": settled["weather_temperature"],
+        "humidity": settled["weather_humidity"],
+        "season": settled["schedule_season"],
+        "week": week,
+        "playoff": settled["schedule_playoff"].astype(float),
+        "neutral": settled["stadium_neutral"].astype(float),
+        "home_favorite": (settled["home_line"] < 0).astype(float).where(settled["home_line"].notna()),
+    }
+    return np.column_stack([np.asarray(columns[name], dtype=float) for name in FEATURES])
+
+
+def result_matrices(settled):
+    """Win/loss/push indicator matrices, each (games x BETS) float32."""
+    results = settled[BETS].to_numpy(dtype=float)
+    return ((results == 1).astype(np.float32),
+            (results == -1).astype(np.float32),
+            (results == 0).astype(np.float32))
+
+
+def _empty_bounds(n):
+    lower = np.full((n, len(FEATURES)), -np.inf)
+    upper = np.full((n, len(FEATURES)), np.inf)
+    return lower, upper, np.zeros((n, len(FEATURES)), dtype=bool)
+
+
+def make_rules(rules):
+    """Build a RuleSet from dicts like
+    {"name": "home dogs", "bet": "home_ats", "min": {"home_line": 0.5}, "max": {...}}.
+
+    Bounds are inclusive; a game with a missing value for a bounded feature
+    never matches.
+    """
+    lower, upper, active = _empty_bounds(len(rules))
+    for i, rule in enumerate(rules):
+        for name, value in rule.get("min", {}).items():
+            j = FEATURES.index(name)
+            lower[i, j] = value
+            active[i, j] = True
+        for name, value in rule.get("max", {}).items():
+            j = FEATURES.index(name)
+            upper[i, j] = value
+            active[i, j] = True
+    bet = np.array([BETS.index(rule["bet"]) for rule in rules], dtype=np.intp)
+    return RuleSet([rule["name"] for rule in rules], bet, lower, upper, active)
+
+
+def grid_rules(bets, mins=None, maxs=None):
+    """Cartesian sweep of bets x threshold values, e.g.
+    grid_rules(["under"], mins={"wind_mph": range(5, 30)}, maxs={"temperature": [20, 32, 50]}).
+    """
+    mins = {name: list(values) for name, values in (mins or {}).items()}
+    maxs = {name: list(values) for name, values in (maxs or {}).items()}
+    axes = [list(bets)] + list(mins.values()) + list(maxs.values())
+    combos = list(itertools.product(*axes))
+
+    lower, upper, active = _empty_bounds(len(combos))
+    grid = np.array([combo[1:] for combo in combos], dtype=float).reshape(len(combos), -1)
+    for k, name in enumerate(mins):
+        j = FEATURES.index(name)
+        lower[:, j] = grid[:, k]
+        active[:, j] = True
+    for k, name in enumerate(maxs, start=len(mins)):
+        j = FEATURES.index(name)
+        upper[:, j] = grid[:, k]
+        active[:, j] = True
+
+    labels = [f"{name}>={{}}" for name in mins] + [f"{name}<={{}}" for name in maxs]
+    names = [" & ".join([combo[0]] + [label.format(v) for label, v in zip(labels, combo[1:])]) for combo in combos]
+    bet = np.array([BETS.index(combo[0]) for combo in combos], dtype=np.intp)
+    return RuleSet(names, bet, lower, upper, active)
+
+
+def match_matrix(features, lower, upper, active):
+    """(rules x games) float32 mask of the games each rule bets on."""
+    mask = np.ones((len(lower), len(features)), dtype=bool)
+    # Only features that some rule in this chunk actually bounds are compared
+    for j in np.flatnonzero(active.any(axis=0)):
+        x = features[None, :, j]
+        ok = (x >= lower[:, j, None]) & (x <= upper[:, j, None])
+        mask &= ok | ~active[:, j, None]
+    return mask.astype(np.float32)
+
+
+def _score_chunk(features, wins, losses, pushes, bet, lower, upper, active):
+    mask = match_matrix(features, lower, upper, active)
+    rows = np.arange(len(bet))
+    # Every bet type is scored in one product; each rule keeps its own column
+    return ((mask @ wins)[rows, bet], (mask @ losses)[rows, bet], (mask @ pushes)[rows, bet])
+
+
+_worker_state = {}
+
+
+def _init_worker(features, wins, losses, pushes):
+    _worker_state.update(features=features, wins=wins, losses=losses, pushes=pushes)
+
+
+def _score_chunk_in_worker(args):
+    s = _worker_state
+    return _score_chunk(s["features"], s["wins"], s["losses"], s["pushes"], *args)
+
+
+def backtest(settled, rules, chunk_size=256, workers=None, parallel_threshold=4096):
+    """Score every rule against every settled game.
+
+    Rules are evaluated in chunks to bound the (rules x games x features)
+    comparison; sweeps larger than parallel_threshold are spread over a
+    process pool (workers defaults to os.cpu_count()).
+    """
+    features = feature_matrix(settled)
+    wins, losses, pushes = result_matrices(settled)
+    chunks = [(rules.bet[i:i + chunk_size], rules.lower[i:i + chunk_size],
+               rules.upper[i:i + chunk_size], rules.active[i:i + chunk_size])
+              for i in range(0, len(rules.names), chunk_size)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(rules.names) >= parallel_threshold:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(features, wins, losses, pushes)) as pool:
+            scored = list(pool.map(_score_chunk_in_worker, chunks))
+    else:
+        scored = [_score_chunk(features, wins, losses, pushes, *chunk) for chunk in chunks]
+
+    if scored:
+        w, l, p = (np.concatenate(parts) for parts in zip(*scored))
+    else:
+        w = l = p = np.zeros(0)
+    decided = w + l
+    with np.errstate(invalid="ignore", divide="ignore"):
+        win_pct = np.where(decided > 0, w / decided, np.nan)
+    units = w * WIN_UNITS - l
+    return pd.DataFrame({
+        "rule": rules.names,
+        "bet": [BETS[b] for b in rules.bet],
+        "bets": (w + l + p).astype(int),
+        "wins": w.astype(int),
+        "losses": l.astype(int),
+        "pushes": p.astype(int),
+        "win_pct": win_pct,
+        "units": units,
+        "roi": np.where(decided > 0, units / np.maximum(decided, 1), np.nan),
+    })
+
+
+if __name__ == "__main__":
+    from nfl_score_cache import load_scores
+
+    settled = settle_games(load_scores(SCORES_CSV))
+    print(f"Games with a spread: {settled['home_ats'].notna().sum()}")
+    for bet, label in [("favorite_ats", "Favorites cover"), ("home_ats", "Home teams cover"), ("over", "Overs hit")]:
+        settled_bets = settled[bet].dropna()
+        print(f"{label}: {(settled_bets == 1).mean() * 100:.2f}% ({(settled_bets == 0).sum()} pushes)")
+
+    named = make_rules([
+        {"name": "Home underdogs", "bet": "home_ats", "min": {"home_line": 0.5}},
+        {"name": "Road underdogs", "bet": "away_ats", "max": {"home_line": -0.5}},
+        {"name": "Big favorites (10+)", "bet": "favorite_ats", "min": {"spread": 10}},
+        {"name": "Windy unders (15+ mph)", "bet": "under", "min": {"wind_mph": 15}},
+        {"name": "Cold unders (<= 32F)", "bet": "under", "max": {"temperature": 32}},
+        {"name": "Playoff underdogs", "bet": "underdog_ats", "min": {"playoff": 1}},
+    ])
+    print("\nNamed rules (all seasons):")
+    print(backtest(settled, named).to_string(index=False))
+
+    sweep = grid_rules(["under", "over"], mins={"wind_mph": range(0, 30), "season": range(1979, 2024, 5)},
+                       maxs={"temperature": range(0, 100, 5)})
+    results = backtest(settled, sweep)
+    results = results[results["bets"] >= 100].sort_values("roi", ascending=False)
+    print(f"\nTop 10 of {len(sweep.names)} swept weather rules (100+ bets):")
+    print(results.head(10).to_string(index=False))
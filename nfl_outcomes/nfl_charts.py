@@ -0,0 +1,19 @@
+# Chart drawers for nfl_analysis.py, in chart_render's draw(fig, data, **options) form
+
+
+def home_away_wins(fig, outcomes, since=2018):
+    """Bar chart of {"Home Wins": n, "Away Wins": n}."""
+    ax = fig.add_subplot()
+    ax.bar(list(outcomes.keys()), list(outcomes.values()), color=["blue", "orange"])
+    ax.set_title(f"Home vs. Away Wins (NFL {since}+)")
+    ax.set_ylabel("Number of Games")
+
+
+def top_teams(fig, team_wins, since=2018):
+    """Horizontal bars of a team -> wins Series."""
+    import seaborn as sns
+
+    ax = fig.add_subplot()
+    sns.barplot(x=team_wins.values, y=team_wins.index, palette="viridis", ax=ax)
+    ax.set_title(f"Top {len(team_wins)} NFL Teams by Wins ({since}+)")
+    ax.set_xlabel("Wins")
@@ -0,0 +1,290 @@
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from nfl_franchises import SCORES_CSV, franchise_index
+
+# Elo power ratings over the spreadspoke game stream. Ratings live in a flat
+# array indexed by franchise (names resolved through the persisted franchise
+# index, labelled with its canonical name, so relocated teams keep their
+# rating) and are processed one week at a time: within a week every team
+# plays at most once, so a whole week is updated with array operations.
+
+MEAN_RATING = 1500.0
+DEFAULTS = {"k": 20.0, "hfa": 55.0, "revert": 1 / 3, "mov": True}
+# Checkpoints of another version (version 1 labelled teams by franchise code) are replayed
+STATE_VERSION = 2
+CHECKPOINT = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "nfl_elo_checkpoint.npz")
+
+
+def prepare_games(df, team_index=None):
+    """Scored games in play order with franchise names and week batch numbers.
+
+    Team names are resolved through team_index (default: the persisted franchise
+    index); a name it does not know raises ValueError rather than starting a
+    new team at the mean rating.
+    """
+    df = df.dropna(subset=["score_home", "score_away"])
+    date = df["schedule_date"]
+    if not pd.api.types.is_datetime64_any_dtype(date):
+        date = pd.to_datetime(date, format="%m/%d/%Y")
+    if team_index is None:
+        team_index = franchise_index()
+    names = pd.concat([df["team_home"].astype(str), df["team_away"].astype(str)])
+    unmatched = team_index.unmatched(names)
+    if unmatched:
+        raise ValueError(f"Team name(s) not in the franchise index: {', '.join(unmatched)}")
+    teams = np.array(team_index.teams, dtype=object)
+    ids = team_index.resolve(names)
+    home, away = teams[ids[:len(df)]], teams[ids[len(df):]]
+    games = pd.DataFrame({
+        "date": date.to_numpy(),
+        "season": df["schedule_season"].to_numpy(dtype=np.int64),
+        "week": df["schedule_week"].astype(str).to_numpy(),
+        "team_home": home,
+        "team_away": away,
+        "margin": (df["score_home"].to_numpy(dtype=float) - df["score_away"].to_numpy(dtype=float)),
+        "neutral": df["stadium_neutral"].to_numpy(dtype=bool),
+    }).sort_values("date", kind="stable").reset_index(drop=True)
+    games["result"] = np.sign(games["margin"]) * 0.5 + 0.5
+    games["batch"] = _week_batches(games)
+    return games
+
+
+def _week_batches(games):
+    """Number consecutive (season, week) groups, splitting any group in which a
+    team would appear twice so each batch can be updated simultaneously."""
+    batch = np.empty(len(games), dtype=np.int64)
+    current, seen, key = -1, set(), None
+    for i, (season, week, home, away) in enumerate(zip(games["season"], games["week"],
+                                                        games["team_home"], games["team_away"])):
+        if (season, week) != key or home in seen or away in seen:
+            current += 1
+            seen = set()
+            key = (season, week)
+        seen.update((home, away))
+        batch[i] = current
+    return batch
+
+
+def _mov_multiplier(margin, winner_diff):
+    # FiveThirtyEight-style: log margin, damped when the favorite wins big
+    return np.log(np.maximum(np.abs(margin), 1) + 1) * 2.2 / (winner_diff * 0.001 + 2.2)
+
+
+def _play_batch(ratings, home, away, margin, result, neutral, k, hfa, mov):
+    """Update ratings in place for one batch; ratings is (teams,) or (params, teams).
+
+    k and hfa are scalars or (params, 1) columns. Returns the pregame home
+    win probabilities.
+    """
+    diff = ratings[..., home] - ratings[..., away] + hfa * ~neutral
+    prob = 1 / (1 + 10 ** (-diff / 400))
+    shift = k * (result - prob)
+    if mov:
+        shift = shift * _mov_multiplier(margin, np.where(margin >= 0, diff, -diff))
+    ratings[..., home] += shift
+    ratings[..., away] -= shift
+    return prob
+
+
+def _revert(ratings, revert):
+    ratings -= (ratings - MEAN_RATING) * revert
+
+
+def new_state(params=None):
+    params = dict(DEFAULTS, **(params or {}))
+    return {
+        "version": STATE_VERSION,
+        "params": params,
+        "teams": [],
+        "ratings": np.zeros(0),
+        "history": np.zeros((0, 0)),
+        "week_season": np.zeros(0, dtype=np.int64),
+        "week_label": np.zeros(0, dtype=object),
+        "week_end": np.zeros(0, dtype="datetime64[ns]"),
+    }
+
+
+def _team_codes(state, names):
+    index = {team: i for i, team in enumerate(state["teams"])}
+    for team in pd.unique(names):
+        if team not in index:
+            index[team] = len(state["teams"])
+            state["teams"].append(team)
+    grow = len(state["teams"]) - len(state["ratings"])
+    if grow:
+        state["ratings"] = np.concatenate([state["ratings"], np.full(grow, MEAN_RATING)])
+        state["history"] = np.pad(state["history"], ((0, 0), (0, grow)), constant_values=MEAN_RATING)
+    return np.array([index[team] for team in names], dtype=np.intp)
+
+
+def run_elo(games, state=None):
+    """Play games (from prepare_games) forward from state, one week batch at a time.
+
+    Returns the pregame home win probability of every game and the updated
+    state, which holds a ratings snapshot after every processed week.
+    """
+    state = state or new_state()
+    p = state["params"]
+    home = _team_codes(state, games["team_home"].to_numpy())
+    away = _team_codes(state, games["team_away"].to_numpy())
+    margin = games["margin"].to_numpy()
+    result = games["result"].to_numpy()
+    neutral = games["neutral"].to_numpy()
+    season = games["season"].to_numpy()
+    ratings = state["ratings"]
+
+    probs = np.empty(len(games))
+    snapshots, week_season, week_label, week_end = [], [], [], []
+    last_season = state["week_season"][-1] if len(state["week_season"]) else None
+    bounds = np.flatnonzero(np.diff(games["batch"].to_numpy(), prepend=-1, append=-1))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if last_season is not None and season[start] != last_season:
+            _revert(ratings, p["revert"])
+        last_season = season[start]
+        s = slice(start, stop)
+        probs[s] = _play_batch(ratings, home[s], away[s], margin[s], result[s], neutral[s],
+                               p["k"], p["hfa"], p["mov"])
+        snapshots.append(ratings.copy())
+        week_season.append(season[start])
+        week_label.append(games["week"].iat[start])
+        week_end.append(games["date"].iat[stop - 1])
+
+    if snapshots:
+        state["history"] = np.vstack([state["history"], snapshots])
+        state["week_season"] = np.concatenate([state["week_season"], week_season])
+        state["week_label"] = np.concatenate([state["week_label"], np.array(week_label, dtype=object)])
+        state["week_end"] = np.concatenate([state["week_end"], np.array(week_end, dtype="datetime64[ns]")])
+    return probs, state
+
+
+def rollback(state, before):
+    """Drop every week checkpoint that ends on or after the given date."""
+    keep = int(np.searchsorted(state["week_end"], np.datetime64(before, "ns"), side="left"))
+    state["history"] = state["history"][:keep]
+    state["week_season"] = state["week_season"][:keep]
+    state["week_label"] = state["week_label"][:keep]
+    state["week_end"] = state["week_end"][:keep]
+    state["ratings"] = state["history"][-1].copy() if keep else np.full(len(state["teams"]), MEAN_RATING)
+    return state
+
+
+def save_state(state, path):
+    np.savez_compressed(path, version=state["version"], params=json.dumps(state["params"]),
+                        teams=np.array(state["teams"], dtype=str), ratings=state["ratings"], history=state["history"],
+                        week_season=state["week_season"], week_label=state["week_label"].astype(str),
+                        week_end=state["week_end"])
+
+
+def load_state(path):
+    with np.load(path) as data:
+        return {
+            "version": int(data["version"]) if "version" in data else 1,
+            "params": json.loads(str(data["params"])),
+            "teams": data["teams"].tolist(),
+            "ratings": data["ratings"].copy(),
+            "history": data["history"].copy(),
+            "week_season": data["week_season"].copy(),
+            "week_label": data["week_label"].astype(object),
+            "week_end": data["week_end"].copy(),
+        }
+
+
+def update_ratings(games, checkpoint_path, params=None):
+    """Bring the checkpointed ratings up to date with games.
+
+    Only games after the last checkpointed week are played; if the stored
+    parameters differ from params the history is replayed from scratch.
+    """
+    state = None
+    if os.path.exists(checkpoint_path):
+        state = load_state(checkpoint_path)
+        if state["version"] != STATE_VERSION or (params is not None and state["params"] != dict(DEFAULTS, **params)):
+            state = None
+    state = state or new_state(params)
+    if len(state["week_end"]):
+        games = games[games["date"] > state["week_end"][-1]]
+    probs, state = run_elo(games, state)
+    save_state(state, checkpoint_path)
+    return probs, state
+
+
+def ratings_table(state):
+    """Current ratings, best first."""
+    table = pd.DataFrame({"team": state["teams"], "rating": state["ratings"]})
+    return table.sort_values("rating", ascending=False, ignore_index=True)
+
+
+def _grid_log_loss(games, k, hfa, revert, mov):
+    """Log loss per parameter combo and season, all combos played in lockstep."""
+    codes, teams = pd.factorize(np.concatenate([games["team_home"], games["team_away"]]))
+    home, away = codes[:len(games)], codes[len(games):]
+    margin = games["margin"].to_numpy()
+    result = games["result"].to_numpy()
+    neutral = games["neutral"].to_numpy()
+    season = games["season"].to_numpy()
+    k = np.asarray(k, dtype=float)[:, None]
+    hfa = np.asarray(hfa, dtype=float)[:, None]
+    ratings = np.full((len(k), len(teams)), MEAN_RATING)
+
+    probs = np.empty((len(k), len(games)))
+    bounds = np.flatnonzero(np.diff(games["batch"].to_numpy(), prepend=-1, append=-1))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start and season[start] != season[start - 1]:
+            _revert(ratings, revert)
+        s = slice(start, stop)
+        probs[:, s] = _play_batch(ratings, home[s], away[s], margin[s], result[s], neutral[s], k, hfa, mov)
+
+    probs = np.clip(probs, 1e-12, 1 - 1e-12)
+    loss = -(result * np.log(probs) + (1 - result) * np.log(1 - probs))
+    seasons, season_codes = np.unique(season, return_inverse=True)
+    per_season = np.stack([np.bincount(season_codes, weights=row) for row in loss]) / np.bincount(season_codes)
+    return loss.mean(axis=1), per_season, seasons
+
+
+def _grid_chunk(args):
+    return _grid_log_loss(*args)
+
+
+def fit_grid(games, ks, hfas, revert=DEFAULTS["revert"], mov=True, workers=1, chunk_size=64):
+    """Score every (k, hfa) combination by log loss over all games.
+
+    Each chunk of combos replays the game stream once with ratings shaped
+    (combos x teams); chunks run on a process pool when workers > 1.
+    Returns (summary sorted by log loss, combos x seasons log-loss matrix).
+    """
+    combos = np.array(list(itertools.product(ks, hfas)), dtype=float)
+    chunks = [(games, combos[i:i + chunk_size, 0], combos[i:i + chunk_size, 1], revert, mov)
+              for i in range(0, len(combos), chunk_size)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            scored = list(pool.map(_grid_chunk, chunks))
+    else:
+        scored = [_grid_chunk(chunk) for chunk in chunks]
+
+    overall = np.concatenate([s[0] for s in scored])
+    per_season = np.vstack([s[1] for s in scored])
+    seasons = scored[0][2]
+    index = pd.MultiIndex.from_arrays([combos[:, 0], combos[:, 1]], names=["k", "hfa"])
+    summary = pd.DataFrame({"log_loss": overall}, index=index).sort_values("log_loss")
+    return summary, pd.DataFrame(per_season, index=index, columns=pd.Index(seasons, name="season"))
+
+
+if __name__ == "__main__":
+    from nfl_score_cache import load_scores
+
+    games = prepare_games(load_scores(SCORES_CSV))
+    os.makedirs(os.path.dirname(CHECKPOINT), exist_ok=True)
+    probs, state = update_ratings(games, CHECKPOINT)
+    print(f"Weeks checkpointed: {len(state['week_end'])}, games played this run: {len(probs)}")
+    print("\nTop 10 teams by Elo:")
+    print(ratings_table(state).head(10).to_string(index=False))
+
+    summary, _ = fit_grid(games, ks=range(10, 41, 2), hfas=range(0, 101, 5), workers=os.cpu_count() or 1)
+    print("\nBest (k, hfa) by log loss:")
+    print(summary.head(5))
@@ -0,0 +1,81 @@
+import json
+import os
+import sys
+
+import pandas as pd
+
+from nfl_score_cache import _read_manifest, default_cache_dir, fingerprint
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from team_index import TeamIndex, cached_index
+
+# Franchise index over nfl_teams.csv: every team_name a franchise has used
+# (e.g. Oakland, Los Angeles and Las Vegas Raiders) resolves to one integer id
+# keyed by its team_id, with the seasons each name appears in
+# spreadspoke_scores.csv. Franchise codes, PFR codes and short names resolve too.
+
+TEAMS_CSV = os.path.join(HERE, "nfl_teams.csv")
+SCORES_CSV = os.path.join(HERE, "spreadspoke_scores.csv")
+
+# mtime/size/sha256 of the files the persisted index was last checked against
+SOURCES_FILE = "team_index_sources.json"
+
+# Favorite ids in spreadspoke_scores.csv that don't match nfl_teams.csv
+CODE_ALIASES = {"LV": "LVR", "NJY": "NYJ"}
+
+
+def build_franchise_index(teams_csv=TEAMS_CSV, scores_csv=SCORES_CSV):
+    """TeamIndex of franchises (ids in team_id order) with per-name season spans."""
+    teams = pd.read_csv(teams_csv, dtype=str)
+    history = teams[["team_id", "team_name"]].rename(columns={"team_id": "team", "team_name": "name"})
+    if scores_csv is not None:
+        scores = pd.read_csv(scores_csv, usecols=["schedule_season", "team_home", "team_away"])
+        played = pd.concat([scores[["schedule_season", "team_home"]].set_axis(["season", "name"], axis=1),
+                            scores[["schedule_season", "team_away"]].set_axis(["season", "name"], axis=1)])
+        spans = played.groupby("name")["season"].agg(first_season="min", last_season="max").reset_index()
+        history = history.merge(spans, on="name", how="left")
+
+    aliases = dict(zip(teams["team_id"], teams["team_id"]))
+    aliases.update(zip(teams["team_id_pfr"], teams["team_id"]))
+    aliases.update(CODE_ALIASES)
+    # Short names ("Raiders") only where they belong to a single franchise
+    short = teams.drop_duplicates(["team_name_short", "team_id"])
+    short = short[~short["team_name_short"].duplicated(keep=False)]
+    aliases.update(zip(short["team_name_short"], short["team_id"]))
+    return TeamIndex.from_history(history, aliases)
+
+
+def _source_fingerprints(cache_dir, paths):
+    """Fingerprints of the index's source files, keyed by absolute path.
+
+    A file is hashed only when its mtime or size differs from the last check;
+    the score cache's manifest (nfl_score_cache) seeds the scores CSV's.
+    """
+    record = os.path.join(cache_dir, SOURCES_FILE)
+    try:
+        with open(record) as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+    current = {}
+    for path in map(os.path.abspath, paths):
+        current[path] = fingerprint(path, previous.get(path) or _read_manifest(default_cache_dir(path)))
+    if current != previous:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(record + ".tmp", "w") as f:
+            json.dump(current, f, indent=1)
+        os.replace(record + ".tmp", record)
+    return current
+
+
+def franchise_index(teams_csv=TEAMS_CSV, scores_csv=SCORES_CSV, cache_dir=None):
+    """The persisted franchise index, rebuilt only when either CSV's contents change."""
+    cache_dir = cache_dir or default_cache_dir(teams_csv)
+    files = _source_fingerprints(cache_dir, [path for path in (teams_csv, scores_csv) if path])
+    source = {"teams": files[os.path.abspath(teams_csv)]["sha256"],
+              "scores": files[os.path.abspath(scores_csv)]["sha256"] if scores_csv else None}
+    return cached_index(os.path.join(cache_dir, "team_index.json"), source,
+                        lambda _: build_franchise_index(teams_csv, scores_csv))
@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+
+OUTCOME_HOME = 1
+OUTCOME_AWAY = -1
+OUTCOME_TIE = 0
+
+
+def team_categories(df):
+    """Shared categorical dtype covering every home and away team in df."""
+    teams = pd.unique(np.concatenate([df["team_home"].to_numpy(dtype=object),
+                                      df["team_away"].to_numpy(dtype=object)]))
+    return pd.CategoricalDtype(sorted(t for t in teams if isinstance(t, str)))
+
+
+def compute_outcomes(df, teams=None):
+    """Add winner/loser/tie/margin and home/away/neutral flags to a scores table.
+
+    Games without both scores are dropped. Ties get no winner or loser
+    (instead of being counted as away wins). Team columns come back as
+    categoricals sharing one set of codes, so later groupbys run on ints;
+    columns that already share one categorical dtype (e.g. franchise ids from
+    load_scores(team_index=...)) keep it.
+    """
+    df = df.dropna(subset=["score_home", "score_away"]).copy()
+    if teams is None:
+        home = df["team_home"].dtype
+        shared = isinstance(home, pd.CategoricalDtype) and home == df["team_away"].dtype
+        teams = home if shared else team_categories(df)
+
+    df["team_home"] = df["team_home"].astype(teams)
+    df["team_away"] = df["team_away"].astype(teams)
+    home_codes = df["team_home"].cat.codes.to_numpy()
+    away_codes = df["team_away"].cat.codes.to_numpy()
+
+    score_home = df["score_home"].to_numpy(dtype=np.int64)
+    score_away = df["score_away"].to_numpy(dtype=np.int64)
+    margin = score_home - score_away
+    outcome = np.sign(margin).astype(np.int8)
+
+    winner_codes = np.where(outcome == OUTCOME_HOME, home_codes,
+                            np.where(outcome == OUTCOME_AWAY, away_codes, -1))
+    loser_codes = np.where(outcome == OUTCOME_HOME, away_codes,
+                           np.where(outcome == OUTCOME_AWAY, home_codes, -1))
+
+    df["margin"] = margin
+    df["outcome"] = outcome
+    df["home_win"] = outcome == OUTCOME_HOME
+    df["away_win"] = outcome == OUTCOME_AWAY
+    df["tie"] = outcome == OUTCOME_TIE
+    if "stadium_neutral" in df.columns:
+        df["neutral_site"] = df["stadium_neutral"].fillna(False).astype(bool)
+    else:
+        df["neutral_site"] = False
+    df["winner"] = pd.Categorical.from_codes(winner_codes, dtype=teams)
+    df["loser"] = pd.Categorical.from_codes(loser_codes, dtype=teams)
+    return df
+
+
+def home_field_summary(outcomes, include_neutral=False):
+    """Home/away/tie counts and home win percentage for an outcomes table."""
+    if not include_neutral:
+        outcomes = outcomes[~outcomes["neutral_site"].to_numpy()]
+    counts = np.bincount(outcomes["outcome"].to_numpy() + 1, minlength=3)
+    games = int(counts.sum())
+    return {
+        "games": games,
+        "home_wins": int(counts[2]),
+        "away_wins": int(counts[0]),
+        "ties": int(counts[1]),
+        "home_win_pct": float(counts[2] / games * 100) if games else float("nan"),
+    }
+
+
+def team_win_table(outcomes):
+    """Wins, losses and ties per team, sorted by wins."""
+    teams = outcomes["team_home"].cat.categories
+    n = len(teams)
+    home_codes = outcomes["team_home"].cat.codes.to_numpy()
+    away_codes = outcomes["team_away"].cat.codes.to_numpy()
+    winner_codes = outcomes["winner"].cat.codes.to_numpy()
+    loser_codes = outcomes["loser"].cat.codes.to_numpy()
+    tie = outcomes["tie"].to_numpy()
+
+    wins = np.bincount(winner_codes[winner_codes >= 0], minlength=n)
+    losses = np.bincount(loser_codes[loser_codes >= 0], minlength=n)
+    ties = (np.bincount(home_codes[tie], minlength=n)
+            + np.bincount(away_codes[tie], minlength=n))
+    games = wins + losses + ties
+
+    table = pd.DataFrame({"wins": wins, "losses": losses, "ties": ties, "games": games},
+                         index=pd.Index(teams, name="team"))
+    table = table[table["games"] > 0]
+    table["win_pct"] = (table["wins"] + 0.5 * table["ties"]) / table["games"]
+    return table.sort_values(["wins", "win_pct"], ascending=False)
+
+
+def season_win_table(outcomes):
+    """Wins, losses and ties per (season, team)."""
+    seasons = outcomes["schedule_season"].to_numpy()
+    # Stack each game once from the home side and once from the away side
+    team = np.concatenate([outcomes["team_home"].cat.codes.to_numpy(),
+                           outcomes["team_away"].cat.codes.to_numpy()])
+    outcome = outcomes["outcome"].to_numpy()
+    result = np.concatenate([outcome, -outcome])
+    long = pd.DataFrame({
+        "schedule_season": np.concatenate([seasons, seasons]),
+        "team": pd.Categorical.from_codes(team, dtype=outcomes["team_home"].dtype),
+        "wins": result == OUTCOME_HOME,
+        "losses": result == OUTCOME_AWAY,
+        "ties": result == OUTCOME_TIE,
+    })
+    table = long.groupby(["schedule_season", "team"], observed=True).sum()
+    table["games"] = table["wins"] + table["losses"] + table["ties"]
+    table["win_pct"] = (table["wins"] + 0.5 * table["ties"]) / table["games"]
+    return table
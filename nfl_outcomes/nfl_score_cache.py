@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import shutil
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional, fall back to the CSV
+    pa = None
+
+# Columnar cache for spreadspoke_scores.csv: one Parquet partition per
+# schedule_season, teams/stadiums as dictionary (categorical) columns and
+# parsed dates. Rebuilt only when the CSV's mtime/size and hash change.
+CACHE_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+CATEGORY_COLUMNS = ["schedule_week", "team_home", "team_away", "team_favorite_id", "stadium", "weather_detail"]
+FLOAT_COLUMNS = ["spread_favorite", "over_under_line", "weather_temperature", "weather_wind_mph", "weather_humidity"]
+
+
+def default_cache_dir(csv_path):
+    """Cache directory that sits next to the CSV: .cache/<csv name>/."""
+    folder, name = os.path.split(os.path.abspath(csv_path))
+    return os.path.join(folder, ".cache", os.path.splitext(name)[0])
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_scores_csv(csv_path):
+    """Parse the raw CSV with explicit dtypes and parsed dates."""
+    # Read labels as str and categorize afterwards: categories inferred per parser
+    # chunk (e.g. weeks "1".."17" as ints, then "Wildcard") fail to combine on large files
+    df = pd.read_csv(csv_path, dtype={col: str for col in CATEGORY_COLUMNS})
+    for col in CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    df["schedule_date"] = pd.to_datetime(df["schedule_date"], format="%m/%d/%Y")
+    df["schedule_season"] = df["schedule_season"].astype("int16")
+    for col in FLOAT_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in ["score_home", "score_away"]:
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int16")
+    for col in ["schedule_playoff", "stadium_neutral"]:
+        df[col] = df[col].astype(bool)
+    return df
+
+
+def _read_manifest(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, MANIFEST_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(cache_dir, manifest):
+    with open(os.path.join(cache_dir, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def fingerprint(path, previous=None):
+    """mtime_ns, size and sha256 of a file. The sha256 of previous (e.g. a cache
+    manifest) is reused when mtime and size still match, so only changed files are hashed."""
+    stat = os.stat(path)
+    if previous and previous.get("mtime_ns") == stat.st_mtime_ns and previous.get("size") == stat.st_size:
+        sha256 = previous["sha256"]
+    else:
+        sha256 = file_sha256(path)
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+
+
+def cache_is_fresh(csv_path, cache_dir):
+    """True if the cache was built from the current contents of csv_path.
+
+    A matching mtime and size is trusted as-is; otherwise the file is hashed,
+    so touching the CSV without changing it does not force a rebuild.
+    """
+    manifest = _read_manifest(cache_dir)
+    if not manifest or manifest.get("version") != CACHE_VERSION:
+        return False
+    current = fingerprint(csv_path, manifest)
+    if manifest["sha256"] != current["sha256"]:
+        return False
+    if (manifest["mtime_ns"], manifest["size"]) != (current["mtime_ns"], current["size"]):
+        manifest.update(current)
+        _write_manifest(cache_dir, manifest)
+    return True
+
+
+def build_cache(csv_path, cache_dir=None):
+    """Convert the CSV into a season-partitioned Parquet dataset."""
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    source = fingerprint(csv_path)
+    df = read_scores_csv(csv_path)
+
+    # Write into a scratch directory and swap it in so readers never see a half-built cache
+    tmp_dir = cache_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(table, os.path.join(tmp_dir, "data"), partition_cols=["schedule_season"])
+    _write_manifest(tmp_dir, {
+        "version": CACHE_VERSION,
+        "source": os.path.abspath(csv_path),
+        **source,
+        "rows": len(df),
+        "columns": list(df.columns),
+        "seasons": sorted(int(s) for s in df["schedule_season"].unique()),
+    })
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+    return cache_dir
+
+
+def ensure_cache(csv_path, cache_dir=None):
+    cache_dir = cache_dir or default_cache_dir(csv_path)
+    if not cache_is_fresh(csv_path, cache_dir):
+        build_cache(csv_path, cache_dir)
+    return cache_dir
+
+
+def _filter_frame(df, seasons, min_season, max_season, teams):
+    mask = pd.Series(True, index=df.index)
+    if seasons is not None:
+        mask &= df["schedule_season"].isin(list(seasons))
+    if min_season is not None:
+        mask &= df["schedule_season"] >= min_season
+    if max_season is not None:
+        mask &= df["schedule_season"] <= max_season
+    if teams is not None:
+        teams = list(teams)
+        mask &= df["team_home"].isin(teams) | df["team_away"].isin(teams)
+    return df[mask]
+
+
+def _franchise_columns(df, team_index):
+    # Team names -> franchise categoricals whose codes are the index's team ids
+    if team_index is not None:
+        for col in ["team_home", "team_away"]:
+            if col in df.columns:
+                df[col] = team_index.categorical(df[col])
+    return df
+
+
+def load_scores(csv_path="spreadspoke_scores.csv", seasons=None, min_season=None, max_season=None,
+                teams=None, columns=None, cache_dir=None, team_index=None):
+    """Load spreadspoke scores through the columnar cache.
+
+    Season bounds prune whole partitions before any file is opened; a team
+    filter (home or away) is pushed down to the Parquet row groups. Without
+    pyarrow the typed CSV parse is used and the filters are applied in memory.
+    With a team_index (nfl_franchises.franchise_index()) a team filter matches
+    every name of the franchise, and team_home/team_away come back as franchise
+    categoricals, so relocated teams are one team.
+    """
+    if team_index is not None and teams is not None:
+        teams = team_index.names_of(teams)
+    if pa is None:
+        df = _filter_frame(read_scores_csv(csv_path), seasons, min_season, max_season, teams)
+        df = df[columns] if columns is not None else df.reset_index(drop=True)
+        return _franchise_columns(df, team_index)
+
+    cache_dir = ensure_cache(csv_path, cache_dir)
+    dataset = ds.dataset(os.path.join(cache_dir, "data"), format="parquet",
+                         partitioning=ds.partitioning(pa.schema([("schedule_season", pa.int16())]), flavor="hive"))
+
+    season = ds.field("schedule_season")
+    parts = []
+    if seasons is not None:
+        parts.append(season.isin([int(s) for s in seasons]))
+    if min_season is not None:
+        parts.append(season >= min_season)
+    if max_season is not None:
+        parts.append(season <= max_season)
+    if teams is not None:
+        # Dictionary columns are compared as strings
+        teams = pa.array(list(teams), type=pa.string())
+        parts.append(ds.field("team_home").cast(pa.string()).isin(teams)
+                     | ds.field("team_away").cast(pa.string()).isin(teams))
+    expr = None
+    for part in parts:
+        expr = part if expr is None else expr & part
+
+    if columns is None:
+        # Keep the CSV's column order (the partition column is otherwise appended last)
+        columns = _read_manifest(cache_dir)["columns"]
+    table = dataset.to_table(columns=columns, filter=expr).unify_dictionaries()
+    df = table.to_pandas()
+    if "schedule_date" in df.columns:
+        df = df.sort_values("schedule_date", kind="stable").reset_index(drop=True)
+    return _franchise_columns(df, team_index)
@@ -0,0 +1,199 @@
+import functools
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# Stage timing for the analysis scripts. Code marks its stages with
+#
+#   with stage("load"):            or        @stage("analyze")
+#       ...                                  def analyze(...): ...
+#
+# and a run is recorded only inside session(). A session collects wall and
+# CPU time per stage (nested stages get "load/read"-style paths, repeated ones
+# are aggregated), optionally tracemalloc peaks and one cProfile dump per
+# top-level stage, and writes a JSON run report. Outside a session stage()
+# returns a shared no-op, so instrumented code costs one global lookup.
+#
+# Every command of the CLI runs in a session:
+#   python -m sfanalytics --report run.json --trace-memory --cprofile profiles/ nfl
+#
+# session() reads its defaults from the environment, so scripts run directly
+# can be profiled too (report path, tracemalloc peaks, cProfile dump directory):
+#   SFA_PROFILE_REPORT=run.json  SFA_PROFILE_MEMORY=1  SFA_PROFILE_DIR=profiles/
+
+ENV_REPORT = "SFA_PROFILE_REPORT"
+ENV_MEMORY = "SFA_PROFILE_MEMORY"
+ENV_PROFILE_DIR = "SFA_PROFILE_DIR"
+
+_active = None
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class RunReport:
+    """Per-stage timings of one run."""
+
+    def __init__(self, name, memory=False, profile_dir=None):
+        self.name = name
+        self.memory = memory
+        self.profile_dir = profile_dir
+        self.stages = {}
+        self._stack = []
+        self._profiler = None
+        self.started = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        if memory:
+            import tracemalloc
+
+            self._tracemalloc = tracemalloc
+            self._own_tracing = not tracemalloc.is_tracing()
+            if self._own_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name):
+        path = "/".join([frame["path"] for frame in self._stack[-1:]] + [name])
+        frame = {"path": path, "peak": 0}
+        if self.memory:
+            # Fold the parent's peak so far into it before the child resets the counter
+            if self._stack:
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], self._tracemalloc.get_traced_memory()[1])
+            self._tracemalloc.reset_peak()
+        if self.profile_dir and not self._stack:
+            import cProfile
+
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._stack.append(frame)
+        start, cpu = time.perf_counter(), time.process_time()
+        entry = self.stages.setdefault(path, {"stage": path, "calls": 0, "start_s": start - self._t0,
+                                              "wall_s": 0.0, "cpu_s": 0.0})
+        try:
+            yield self
+        finally:
+            wall, cpu = time.perf_counter() - start, time.process_time() - cpu
+            self._stack.pop()
+            entry["calls"] += 1
+            entry["wall_s"] += wall
+            entry["cpu_s"] += cpu
+            if self.memory:
+                peak = max(frame["peak"], self._tracemalloc.get_traced_memory()[1])
+                entry["peak_mb"] = max(entry.get("peak_mb", 0.0), peak / 1e6)
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            if self._profiler is not None and not self._stack:
+                self._profiler.disable()
+                os.makedirs(self.profile_dir, exist_ok=True)
+                dump = os.path.join(self.profile_dir, f"{self.name}-{path}.prof")
+                self._profiler.dump_stats(dump)
+                entry["profile"] = dump
+                self._profiler = None
+
+    def to_dict(self):
+        report = {
+            "run": self.name,
+            "started": self.started.isoformat(timespec="seconds"),
+            "argv": sys.argv,
+            "python": platform.python_version(),
+            "wall_s": time.perf_counter() - self._t0,
+            "cpu_s": time.process_time() - self._cpu0,
+            "stages": list(self.stages.values()),
+        }
+        if self.memory:
+            report["peak_mb"] = max([s["peak_mb"] for s in self.stages.values()]
+                                    + [self._tracemalloc.get_traced_memory()[1] / 1e6])
+        return report
+
+    def close(self):
+        if self.memory and self._own_tracing:
+            self._tracemalloc.stop()
+
+
+class stage:
+    """Time a block (with stage("load"):) or every call of a function (@stage("analyze"))."""
+
+    def __init__(self, name):
+        self.name = name
+        self._context = None
+
+    def __enter__(self):
+        if _active is None:
+            return _NULL_STAGE
+        self._context = _active.stage(self.name)
+        return self._context.__enter__()
+
+    def __exit__(self, *exc):
+        context, self._context = self._context, None
+        return context.__exit__(*exc) if context is not None else False
+
+    def __call__(self, func):
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with _active.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+@contextmanager
+def session(name, report_path=None, memory=None, profile_dir=None):
+    """Record the stages run inside the block and write the JSON report.
+
+    Arguments left as None come from SFA_PROFILE_REPORT, SFA_PROFILE_MEMORY
+    and SFA_PROFILE_DIR. With none of them set (or inside another session)
+    nothing is recorded and the block runs as is; yields the RunReport or None.
+    """
+    global _active
+    report_path = report_path or os.environ.get(ENV_REPORT)
+    memory = memory if memory is not None else os.environ.get(ENV_MEMORY, "") not in ("", "0")
+    profile_dir = profile_dir or os.environ.get(ENV_PROFILE_DIR)
+    if _active is not None or not (report_path or memory or profile_dir):
+        yield None
+        return
+
+    report = _active = RunReport(name, memory=memory, profile_dir=profile_dir)
+    try:
+        yield report
+    finally:
+        _active = None
+        result = report.to_dict()
+        report.close()
+        if report_path:
+            with open(report_path + ".tmp", "w") as f:
+                json.dump(result, f, indent=2)
+            os.replace(report_path + ".tmp", report_path)
+        print_report(result, file=sys.stderr)
+
+
+def print_report(report, file=None):
+    """Stage table of a run report."""
+    memory = "peak_mb" in report
+    print(f"{report['run']}: {report['wall_s']:.2f} s wall, {report['cpu_s']:.2f} s CPU"
+          + (f", peak {report['peak_mb']:.1f} MB" if memory else ""), file=file)
+    for entry in report["stages"]:
+        depth = entry["stage"].count("/")
+        label = "  " * depth + entry["stage"].rsplit("/", 1)[-1]
+        calls = f"x{entry['calls']}" if entry["calls"] > 1 else ""
+        line = f"  {label:<24} {entry['wall_s']:>8.3f} s {entry['cpu_s']:>8.3f} s cpu {calls:>6}"
+        if memory:
+            line += f"  {entry['peak_mb']:>8.1f} MB"
+        print(line, file=file)
@@ -0,0 +1,3 @@
+from sfanalytics.commands import cbb_eligible, cbb_scrape, cbb_screen, cbb_upsets, nfl, stocks
+
+__all__ = ["stocks", "nfl", "cbb_upsets", "cbb_eligible", "cbb_screen", "cbb_scrape"]
@@ -0,0 +1,5 @@
+import sys
+
+from sfanalytics.cli import main
+
+sys.exit(main())
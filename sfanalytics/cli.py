@@ -0,0 +1,79 @@
+import argparse
+
+from sfanalytics import commands
+
+# python -m sfanalytics <command> [options]; run from the repository root.
+# Only argparse is imported up front; each command loads its own dependencies.
+
+
+def _output_args(parser, charts=True):
+    parser.add_argument("--output-dir", default=".", help="where CSVs and charts are written (default: .)")
+    if charts:
+        parser.add_argument("--no-charts", dest="charts", action="store_false",
+                            help="skip chart rendering (matplotlib is not imported)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="sfanalytics", description="Sports and finance analytics.")
+    parser.add_argument("--report", metavar="PATH", help="write a JSON report of per-stage timings")
+    parser.add_argument("--trace-memory", action="store_true", help="track per-stage peak memory (tracemalloc)")
+    parser.add_argument("--cprofile", metavar="DIR", help="dump a cProfile file per top-level stage")
+    sub = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    p = sub.add_parser("stocks", help="returns, moving average and volatility for tickers")
+    p.add_argument("tickers", nargs="*", default=["AAPL"], help="ticker symbols (default: AAPL)")
+    p.add_argument("--start", default="2023-01-01")
+    p.add_argument("--end", default="2025-02-23")
+    p.add_argument("--ma-window", type=int, default=50)
+    _output_args(p)
+    p.set_defaults(run=lambda a: commands.stocks(tickers=a.tickers, start=a.start, end=a.end, ma_window=a.ma_window,
+                                                 charts=a.charts, output_dir=a.output_dir))
+
+    p = sub.add_parser("nfl", help="home-field advantage and top teams by wins")
+    p.add_argument("--since", type=int, default=2018, help="first season (default: 2018)")
+    p.add_argument("--top", type=int, default=10)
+    _output_args(p)
+    p.set_defaults(run=lambda a: commands.nfl(since=a.since, top=a.top, charts=a.charts, output_dir=a.output_dir))
+
+    p = sub.add_parser("cbb-upsets", help="Round of 64 upset candidates from KenPom ranks")
+    p.add_argument("--season", type=int, default=2025)
+    _output_args(p)
+    p.set_defaults(run=lambda a: commands.cbb_upsets(season=a.season, charts=a.charts, output_dir=a.output_dir))
+
+    p = sub.add_parser("cbb-eligible", help="teams inside KenPom offense/defense rank cutoffs")
+    p.add_argument("--season", type=int, default=2025)
+    p.add_argument("--max-oe-rank", type=int, default=21)
+    p.add_argument("--max-de-rank", type=int, default=31)
+    _output_args(p)
+    p.set_defaults(run=lambda a: commands.cbb_eligible(season=a.season, max_oe_rank=a.max_oe_rank,
+                                                       max_de_rank=a.max_de_rank, charts=a.charts,
+                                                       output_dir=a.output_dir))
+
+    p = sub.add_parser("cbb-screen", help="champion hit rates of every KenPom rank cutoff over all seasons")
+    p.add_argument("--max-rank", type=int, default=60, help="sweep OE and DE cutoffs 1..N (default: 60)")
+    _output_args(p, charts=False)
+    p.set_defaults(run=lambda a: commands.cbb_screen(max_rank=a.max_rank, output_dir=a.output_dir))
+
+    p = sub.add_parser("cbb-scrape", help="sports-reference advanced stats for one season or a range")
+    p.add_argument("--season", type=int, default=2025)
+    p.add_argument("--through", type=int, help="scrape every season from --season to this one into one CSV")
+    p.add_argument("--workers", type=int, default=4, help="concurrent requests for a season range")
+    _output_args(p)
+    p.set_defaults(run=_scrape)
+    return parser
+
+
+def _scrape(args):
+    if args.through is None:
+        return commands.cbb_scrape(season=args.season, charts=args.charts, output_dir=args.output_dir)
+    return commands.cbb_scrape(season=args.season, through=args.through, workers=args.workers,
+                               output_dir=args.output_dir)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Stage timing is recorded only when asked for (or via the SFA_PROFILE_* variables)
+    profiling = commands._load("profiling")
+    with profiling.session(args.command, args.report, args.trace_memory or None, args.cprofile):
+        args.run(args)
+    return 0
@@ -0,0 +1,57 @@
+import importlib
+import os
+import sys
+
+# Library entry points for every analysis. Each one puts its project folder on
+# sys.path and imports the analysis module only when called, so importing this
+# package (or running --help) loads none of pandas, matplotlib, seaborn,
+# yfinance, kagglehub or requests; charts=False skips matplotlib entirely.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load(module, *folder):
+    # folder is relative to the repository root (the root itself when omitted)
+    directory = os.path.join(ROOT, *folder)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return importlib.import_module(module)
+
+
+def stocks(**kwargs):
+    """Price analysis of one or more tickers; arguments as stock_trends/stock_analysis.run()."""
+    return _load("stock_analysis", "stock_trends").run(**kwargs)
+
+
+def nfl(**kwargs):
+    """Home-field advantage and top teams; arguments as nfl_outcomes/nfl_analysis.run()."""
+    return _load("nfl_analysis", "nfl_outcomes").run(**kwargs)
+
+
+def cbb_upsets(**kwargs):
+    """Round of 64 upset candidates; arguments as ncaa_basketball/cbb_2025_kenpom_upsets.run()."""
+    return _load("cbb_2025_kenpom_upsets", "ncaa_basketball").run(**kwargs)
+
+
+def cbb_eligible(**kwargs):
+    """KenPom rank-cutoff contenders; arguments as tournament_prediction/kenpom/cbb_kenpom_prediction.run()."""
+    return _load("cbb_kenpom_prediction", "ncaa_basketball", "tournament_prediction", "kenpom").run(**kwargs)
+
+
+def cbb_screen(**kwargs):
+    """Champion hit rates of every KenPom rank cutoff pair over all seasons;
+    arguments as tournament_prediction/kenpom/cbb_kenpom_screener.run()."""
+    return _load("cbb_kenpom_screener", "ncaa_basketball", "tournament_prediction", "kenpom").run(**kwargs)
+
+
+def cbb_scrape(season=2025, through=None, output_dir=".", **kwargs):
+    """One season's offensive stats report (cbb_advanced_stats.run()), or with
+    through, every season from season to through via cbb_scraper.scrape_seasons()."""
+    if through is None:
+        return _load("cbb_advanced_stats", "ncaa_basketball").run(season=season, output_dir=output_dir, **kwargs)
+    scraper = _load("cbb_scraper", "ncaa_basketball")
+    df = scraper.scrape_seasons(range(season, through + 1), **kwargs)
+    path = os.path.join(output_dir, f"cbb_advanced_stats_{season}_{through}.csv")
+    df.to_csv(path, index=False)
+    print(f"Saved {len(df)} team-seasons to {path}")
+    return df
@@ -0,0 +1,23 @@
+import sys
+import time
+import tracemalloc
+
+from stock_engine import analyze, synthetic_prices
+
+# Time and peak memory of the batched engine on synthetic panels of
+# 10 years of daily prices (python benchmark_engine.py 500 5000)
+TICKER_COUNTS = [int(s) for s in sys.argv[1:]] or [500, 5000]
+N_DAYS = 10 * 252
+
+print(f"{'tickers':>8} {'days':>6} {'time (s)':>9} {'peak MB':>9} {'panel MB':>9}")
+for n_tickers in TICKER_COUNTS:
+    prices = synthetic_prices(n_tickers, N_DAYS, seed=n_tickers)
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = analyze(prices)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(result["summary"]) == n_tickers
+    print(f"{n_tickers:>8} {N_DAYS:>6} {elapsed:>9.2f} {peak / 1e6:>9.1f} {prices.memory_usage().sum() / 1e6:>9.1f}")
+    del result
@@ -0,0 +1,62 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from stock_engine import synthetic_prices
+from stock_streaming import OnlineIndicators
+
+# Throughput of the online indicators in ticks per second, replaying a
+# synthetic (days x symbols) panel as tick batches, and a check that every
+# replay ends in the same state as the batch pandas path
+# (python benchmark_streaming.py 1000). "bursty" replays each symbol's whole
+# history in turn, so a batch is long runs of one symbol.
+N_SYMBOLS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+N_DAYS = 2 * 252
+BATCH_SIZE = 5000
+
+prices = synthetic_prices(N_SYMBOLS, N_DAYS, seed=1)
+values = prices.to_numpy()
+# Day-major tick stream, shuffled within each day so batches mix symbols
+rng = np.random.default_rng(1)
+order = np.concatenate([rng.permutation(N_SYMBOLS) for _ in range(N_DAYS)])
+tick_prices = values[np.repeat(np.arange(N_DAYS), N_SYMBOLS), order]
+# Symbol-major stream: every tick of symbol 0, then symbol 1, ...
+bursty = np.repeat(np.arange(N_SYMBOLS), N_DAYS)
+bursty_prices = values.T.ravel()
+
+daily_return = prices.pct_change() * 100
+expected = pd.DataFrame({
+    "last_price": prices.iloc[-1],
+    "running_mean_return_pct": daily_return.mean(),
+    "running_std_return_pct": daily_return.std(),
+    "ma": prices.rolling(50).mean().iloc[-1],
+    "rolling_std_return_pct": daily_return.rolling(20).std().iloc[-1],
+    "ema": prices.ewm(span=20, adjust=False).mean().iloc[-1],
+    "drawdown_pct": (prices.iloc[-1] / prices.cummax().iloc[-1] - 1) * 100,
+})
+
+print(f"{'mode':>12} {'ticks':>9} {'time (s)':>9} {'ticks/s':>12}")
+for mode, codes, ticks, batch in [("batched", order, tick_prices, BATCH_SIZE),
+                                  ("one per day", order, tick_prices, N_SYMBOLS),
+                                  ("bursty", bursty, bursty_prices, BATCH_SIZE)]:
+    online = OnlineIndicators(prices.columns)
+    start = time.perf_counter()
+    for i in range(0, len(codes), batch):
+        online.update(codes[i:i + batch], ticks[i:i + batch])
+    elapsed = time.perf_counter() - start
+    print(f"{mode:>12} {len(codes):>9} {elapsed:>9.2f} {len(codes) / elapsed:>12,.0f}")
+    # Same values as the batch pandas path
+    pd.testing.assert_frame_equal(online.snapshot(), expected, check_names=False, rtol=1e-8)
+
+# One symbol, 10,000 ticks in a single batch
+single = synthetic_prices(1, 10_000, seed=2)
+online = OnlineIndicators(single.columns)
+start = time.perf_counter()
+online.update(np.zeros(len(single), dtype=np.intp), single.iloc[:, 0].to_numpy())
+elapsed = time.perf_counter() - start
+print(f"{'one symbol':>12} {len(single):>9} {elapsed:>9.2f} {len(single) / elapsed:>12,.0f}")
+np.testing.assert_allclose(online.snapshot()["ema"].iloc[0],
+                           single.iloc[:, 0].ewm(span=20, adjust=False).mean().iloc[-1], rtol=1e-8)
+print("Final state matches pandas pct_change / rolling / ewm / cummax")
@@ -0,0 +1,169 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# Local OHLCV store. One float64 .npy file per field, shaped (dates x tickers)
+# and saved column-major so each ticker's history is contiguous on disk; all
+# fields share dates.npy. Files are opened with mmap_mode="r", so opening a
+# store of thousands of tickers reads only the headers, and a slice reads
+# only the pages it touches.
+#
+#   <store>/meta.json      tickers (column order) and the [from, until) date range fetched for each
+#   <store>/dates.npy      datetime64[D], sorted
+#   <store>/<field>.npy    float64, (dates x tickers), Fortran order
+
+FIELDS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
+
+def yfinance_downloader(tickers, start, end):
+    """Fetch a batch from yfinance as a (field, ticker) column frame."""
+    import yfinance as yf
+
+    data = yf.download(list(tickers), start=start, end=end, progress=False, auto_adjust=False,
+                       group_by="column", threads=True)
+    if not isinstance(data.columns, pd.MultiIndex):
+        data.columns = pd.MultiIndex.from_product([data.columns, list(tickers)])
+    return data
+
+
+def _fetch_end(end):
+    # Never mark days that haven't closed yet as fetched
+    return str(min(np.datetime64(end, "D"), np.datetime64("today", "D")))
+
+
+def _tickers_with_data(data, tickers):
+    """Tickers with at least one value in a downloaded (field, ticker) frame."""
+    if data is None or not len(data) or not isinstance(data.columns, pd.MultiIndex):
+        return []
+    present = data.notna().any(axis=0).groupby(level=1).any()
+    return [t for t in tickers if present.get(t, False)]
+
+
+class PriceStore:
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        self._load()
+
+    def _path(self, name):
+        return os.path.join(self.store_dir, name)
+
+    def _load(self):
+        try:
+            with open(self._path("meta.json")) as f:
+                meta = json.load(f)
+        except OSError:
+            meta = {"tickers": [], "fetched_until": {}}
+        self.tickers = meta["tickers"]
+        self.fetched_until = meta["fetched_until"]
+        self._columns = {ticker: i for i, ticker in enumerate(self.tickers)}
+        if self.tickers:
+            self.dates = np.load(self._path("dates.npy"))
+        else:
+            self.dates = np.zeros(0, dtype="datetime64[D]")
+        # Stores written before start dates were tracked: assume coverage from the first stored date
+        first = str(self.dates[0]) if len(self.dates) else None
+        self.fetched_from = meta.get("fetched_from") or {ticker: first for ticker in self.fetched_until}
+
+    def field(self, name):
+        """Memory-mapped (dates x tickers) array of one field."""
+        return np.load(self._path(f"{name}.npy"), mmap_mode="r")
+
+    def frame(self, name="Close", tickers=None, start=None, end=None):
+        """One field as a DataFrame for a ticker subset and [start, end) date range."""
+        tickers = list(tickers) if tickers is not None else self.tickers
+        lo = np.searchsorted(self.dates, np.datetime64(start, "D")) if start is not None else 0
+        hi = np.searchsorted(self.dates, np.datetime64(end, "D")) if end is not None else len(self.dates)
+        cols = [self._columns[t] for t in tickers]
+        data = self.field(name)
+        # Copy contiguous per-ticker slices out of the memory map
+        values = np.column_stack([data[lo:hi, c] for c in cols]) if cols else np.zeros((hi - lo, 0))
+        return pd.DataFrame(values, index=pd.DatetimeIndex(self.dates[lo:hi], name="Date"), columns=tickers)
+
+    def stale_tickers(self, tickers, start, end):
+        """{(fetch start, fetch end): [tickers]} for every date range in [start, end)
+        not fetched yet: the whole range for new tickers, otherwise the leading
+        days before and the trailing days after what is already stored."""
+        start, end = str(np.datetime64(start, "D")), _fetch_end(end)
+        pending = {}
+        for ticker in tickers:
+            since, until = self.fetched_from.get(ticker), self.fetched_until.get(ticker)
+            if since is None or until is None:
+                windows = [(start, end)]
+            else:
+                windows = [(start, min(since, end)), (max(until, start), end)]
+            for window in windows:
+                if window[0] < window[1]:
+                    pending.setdefault(window, []).append(ticker)
+        return pending
+
+    def refresh(self, tickers, start, end, downloader=yfinance_downloader, batch_size=200):
+        """Fetch only the dates of each ticker that are not stored yet, in batches.
+
+        New tickers are fetched over [start, end); known ones only before the
+        first and after the last date they were fetched for. Tickers sharing a
+        fetch window are downloaded together, batch_size at a time. A ticker's
+        coverage grows only when the download returned data for it, so failed
+        or empty downloads are retried next time. Returns the number of tickers
+        that came back with data.
+        """
+        pending = self.stale_tickers(tickers, start, end)
+        if not pending:
+            return 0
+        frames, returned = [], set()
+        for (since, until), group in sorted(pending.items()):
+            for i in range(0, len(group), batch_size):
+                batch = group[i:i + batch_size]
+                data = downloader(batch, since, until)
+                got = _tickers_with_data(data, batch)
+                if got:
+                    frames.append(data)
+                for ticker in got:
+                    returned.add(ticker)
+                    self.fetched_from[ticker] = min(self.fetched_from.get(ticker, since), since)
+                    self.fetched_until[ticker] = max(self.fetched_until.get(ticker, until), until)
+        self._merge(frames, [t for group in pending.values() for t in group])
+        return len(returned)
+
+    def _merge(self, frames, fetched):
+        new_tickers = [t for t in dict.fromkeys(fetched) if t not in self._columns]
+        tickers = self.tickers + new_tickers
+        columns = {ticker: i for i, ticker in enumerate(tickers)}
+        new_dates = [pd.DatetimeIndex(f.index).values.astype("datetime64[D]") for f in frames]
+        dates = np.unique(np.concatenate([self.dates] + new_dates)) if new_dates else self.dates
+
+        tmp_dir = self.store_dir + ".tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        old_rows = np.searchsorted(dates, self.dates)
+        for name in FIELDS:
+            values = np.full((len(dates), len(tickers)), np.nan, order="F")
+            if self.tickers and os.path.exists(self._path(f"{name}.npy")):
+                values[old_rows, :len(self.tickers)] = self.field(name)
+            for frame in frames:
+                if name not in frame.columns.get_level_values(0):
+                    continue
+                block = frame[name]
+                rows = np.searchsorted(dates, pd.DatetimeIndex(block.index).values.astype("datetime64[D]"))
+                cols = [columns[t] for t in block.columns]
+                block_values = block.to_numpy(dtype=float)
+                # Keep stored values where the new download has gaps
+                present = ~np.isnan(block_values)
+                target = values[np.ix_(rows, cols)]
+                values[np.ix_(rows, cols)] = np.where(present, block_values, target)
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), values)
+        np.save(os.path.join(tmp_dir, "dates.npy"), dates)
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump({"tickers": tickers, "fetched_from": self.fetched_from, "fetched_until": self.fetched_until},
+                      f, indent=1)
+
+        # Swap the rebuilt store in, then reopen it
+        old_dir = self.store_dir + ".old"
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if os.path.exists(self.store_dir):
+            os.replace(self.store_dir, old_dir)
+        os.replace(tmp_dir, self.store_dir)
+        shutil.rmtree(old_dir, ignore_errors=True)
+        self._load()
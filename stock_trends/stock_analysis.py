@@ -1,41 +1,73 @@
-import yfinance as yf
-import pandas as pd
-import matplotlib.pyplot as plt
-
-# Fetch AAPL data explicitly
-stock = yf.download("AAPL", start="2023-01-01", end="2025-02-23", progress=False)
-
-# Debug: Confirm columns
-print("Columns:", stock.columns.tolist())
-print("First 5 rows:")
-print(stock.head())
-
-# Use 'Close' (confirmed present)
-stock["Daily_Return"] = stock["Close"].pct_change() * 100
-stock["MA50"] = stock["Close"].rolling(window=50).mean()
-
-# Stats
-avg_return = stock["Daily_Return"].mean()
-volatility = stock["Daily_Return"].std()
-print(f"Average Daily Return: {avg_return:.2f}%")
-print(f"Volatility (Std Dev): {volatility:.2f}%")
-
-# Plot price trend
-plt.figure(figsize=(12, 6))
-plt.plot(stock["Close"], label="Close Price", color="blue")
-plt.plot(stock["MA50"], label="50-Day MA", color="orange")
-plt.title("AAPL Stock Price Trend (2023-2025)")
-plt.xlabel("Date")
-plt.ylabel("Price (USD)")
-plt.legend()
-plt.savefig("aapl_price_trend.png")
-plt.show()
-
-# Plot returns histogram
-plt.figure(figsize=(10, 6))
-stock["Daily_Return"].hist(bins=50, color="green", alpha=0.7)
-plt.title("AAPL Daily Returns Distribution (2023-2025)")
-plt.xlabel("Daily Return (%)")
-plt.ylabel("Frequency")
-plt.savefig("aapl_returns_hist.png")
-plt.show()
\ No newline at end of file
+import os
+import sys
+from price_store import PriceStore
+from stock_engine import analyze
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+from profiling import session, stage
+
+# Tickers to analyze; charts are drawn for every one
+TICKERS = ["AAPL"]
+START, END = "2023-01-01", "2025-02-23"
+
+
+def render_stock_charts(prices, result, ma_window=50, output_dir="."):
+    """Price trend with MA and returns histogram for every ticker, rendered
+    headlessly (across worker processes for large batches; unchanged charts are skipped)."""
+    from chart_render import Chart, render_charts
+    from stock_charts import price_trend, returns_hist
+
+    period = f"{prices.index[0].year}-{prices.index[-1].year}" if len(prices) else ""
+    charts = []
+    for ticker in prices.columns:
+        trend = prices[[ticker]].set_axis(["Close"], axis=1).assign(MA=result["moving_average"][ticker])
+        options = {"ticker": ticker, "period": period}
+        charts.append(Chart(os.path.join(output_dir, f"{ticker.lower()}_price_trend.png"), price_trend, trend,
+                            dict(options, ma_window=ma_window), (12, 6)))
+        charts.append(Chart(os.path.join(output_dir, f"{ticker.lower()}_returns_hist.png"), returns_hist,
+                            result["returns"][ticker], options, (10, 6)))
+    return render_charts(charts)
+
+
+def run(tickers=TICKERS, start=START, end=END, ma_window=50, charts=True, output_dir=".", store_dir=None):
+    """Refresh the price store, analyze the Close panel and draw the charts; returns analyze()'s dict."""
+    tickers = list(tickers)
+
+    # Bring the local price store up to date (only missing trailing dates are downloaded),
+    # then read one (dates x tickers) Close panel from it
+    with stage("load"):
+        store = PriceStore(store_dir or os.path.join(HERE, ".cache", "prices"))
+        with stage("refresh"):
+            store.refresh(tickers, start, end)
+        with stage("read"):
+            prices = store.frame("Close", tickers, start, end)
+
+    # Debug: Confirm columns
+    print("Tickers:", prices.columns.tolist())
+    print("First 5 rows:")
+    print(prices.head())
+
+    # Returns (%), moving average, rolling volatility and drawdowns for every ticker at once
+    with stage("analyze"):
+        result = analyze(prices, ma_window=ma_window)
+        summary = result["summary"].set_index("ticker")
+
+    # Stats
+    for ticker in tickers:
+        print(f"{ticker} Average Daily Return: {summary.at[ticker, 'avg_daily_return_pct']:.2f}%")
+        print(f"{ticker} Volatility (Std Dev): {summary.at[ticker, 'volatility_pct']:.2f}%")
+    if len(tickers) > 1:
+        print(summary)
+
+    if charts:
+        with stage("render"):
+            render_stock_charts(prices, result, ma_window, output_dir)
+    return result
+
+
+if __name__ == "__main__":
+    with session("stock_analysis"):
+        run()
@@ -0,0 +1,22 @@
+# Chart drawers for stock_analysis.py, in chart_render's draw(fig, data, **options) form
+
+
+def price_trend(fig, data, ticker, period="2023-2025", ma_window=50):
+    """Close price with its moving average; data has Close and MA columns."""
+    ax = fig.add_subplot()
+    ax.plot(data["Close"], label="Close Price", color="blue")
+    ax.plot(data["MA"], label=f"{ma_window}-Day MA", color="orange")
+    ax.set_title(f"{ticker} Stock Price Trend ({period})")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price (USD)")
+    ax.legend()
+
+
+def returns_hist(fig, daily_return, ticker, period="2023-2025"):
+    """Histogram of daily returns (%)."""
+    ax = fig.add_subplot()
+    ax.hist(daily_return.dropna(), bins=50, color="green", alpha=0.7)
+    ax.grid(True)
+    ax.set_title(f"{ticker} Daily Returns Distribution ({period})")
+    ax.set_xlabel("Daily Return (%)")
+    ax.set_ylabel("Frequency")
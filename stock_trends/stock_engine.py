@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+# Batched analytics over a wide (dates x tickers) price panel. Every kernel
+# works on the whole 2-D array at once along the date axis, so the cost of a
+# run grows with the panel size rather than with a Python loop per ticker.
+
+TRADING_DAYS = 252
+
+
+def daily_returns(prices):
+    """Simple returns r[t] = p[t] / p[t-1] - 1; the first row is NaN."""
+    prices = np.asarray(prices, dtype=float)
+    returns = np.full(prices.shape, np.nan)
+    returns[1:] = prices[1:] / prices[:-1] - 1
+    return returns
+
+
+def _window_sums(values, window):
+    # Sum and count of valid values over each trailing window, via cumulative sums
+    valid = ~np.isnan(values)
+    csum = np.where(valid, values, 0.0)
+    np.cumsum(csum, axis=0, out=csum)
+    ccount = np.cumsum(valid, axis=0, dtype=np.int32)
+    sums = np.full(values.shape, np.nan)
+    counts = np.zeros(values.shape, dtype=np.int32)
+    if window <= len(values):
+        sums[window - 1] = csum[window - 1]
+        sums[window:] = csum[window:] - csum[:-window]
+        counts[window - 1] = ccount[window - 1]
+        counts[window:] = ccount[window:] - ccount[:-window]
+    return sums, counts
+
+
+def rolling_mean(values, window):
+    """Trailing mean over window rows; NaN unless the whole window is present
+    (matches pandas rolling(window).mean())."""
+    values = np.asarray(values, dtype=float)
+    sums, counts = _window_sums(values, window)
+    return np.where(counts == window, sums / window, np.nan)
+
+
+def rolling_std(values, window, ddof=1):
+    """Trailing sample standard deviation over window rows (pandas rolling().std())."""
+    values = np.asarray(values, dtype=float)
+    # Center on each column's mean first to keep the sum-of-squares form stable
+    valid = ~np.isnan(values)
+    center = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+    centered = values - center
+    sums, counts = _window_sums(centered, window)
+    squares, _ = _window_sums(centered ** 2, window)
+    var = (squares - sums ** 2 / window) / (window - ddof)
+    return np.where(counts == window, np.sqrt(np.maximum(var, 0.0)), np.nan)
+
+
+def drawdowns(prices):
+    """Drawdown from the running peak at every date (0 at a new high, negative below it)."""
+    prices = np.asarray(prices, dtype=float)
+    peaks = np.fmax.accumulate(prices, axis=0)
+    return prices / peaks - 1
+
+
+def correlation_matrix(returns, min_periods=20, dtype=np.float32):
+    """Correlation of returns between every pair of tickers.
+
+    Each column is standardized over its own valid days and missing days are
+    zero-filled, so the matrix is one (tickers x dates) @ (dates x tickers)
+    product divided by the pairwise overlap counts. Pairs overlapping on fewer
+    than min_periods days are NaN.
+    """
+    returns = np.asarray(returns, dtype=float)
+    valid = ~np.isnan(returns)
+    mean = np.nanmean(returns, axis=0)
+    std = np.nanstd(returns, axis=0)
+    z = np.where(valid, (returns - mean) / np.where(std > 0, std, 1.0), 0.0).astype(dtype)
+    v = valid.astype(dtype)
+    overlap = v.T @ v
+    with np.errstate(invalid="ignore", divide="ignore"):
+        corr = (z.T @ z) / overlap
+    corr[overlap < min_periods] = np.nan
+    np.clip(corr, -1, 1, out=corr)
+    return corr
+
+
+def analyze(prices, ma_window=50, vol_window=20, with_correlations=True):
+    """Run every indicator over a (dates x tickers) price DataFrame.
+
+    Returns a dict with the per-date panels (returns, moving average, rolling
+    volatility, drawdown) as DataFrames, the correlation matrix, and a tidy
+    one-row-per-ticker summary. Returns are in percent, like stock_analysis.py.
+    """
+    values = prices.to_numpy(dtype=float)
+    returns = daily_returns(values) * 100
+    ma = rolling_mean(values, ma_window)
+    vol = rolling_std(returns, vol_window)
+    dd = drawdowns(values)
+
+    last = np.arange(values.shape[1])
+    last_row = np.where(~np.isnan(values), np.arange(len(values))[:, None], -1).max(axis=0)
+    has_data = last_row >= 0
+    last_row = np.maximum(last_row, 0)
+    with np.errstate(invalid="ignore"):
+        summary = pd.DataFrame({
+            "ticker": prices.columns,
+            "last_close": np.where(has_data, values[last_row, last], np.nan),
+            "avg_daily_return_pct": np.nanmean(returns, axis=0),
+            "volatility_pct": np.nanstd(returns, axis=0, ddof=1),
+            f"ma{ma_window}": ma[last_row, last],
+            f"rolling_vol{vol_window}_pct": vol[last_row, last],
+            "max_drawdown_pct": np.nanmin(dd, axis=0) * 100,
+            "current_drawdown_pct": dd[last_row, last] * 100,
+        })
+    summary["annualized_volatility_pct"] = summary["volatility_pct"] * np.sqrt(TRADING_DAYS)
+    summary[f"close_vs_ma{ma_window}_pct"] = (summary["last_close"] / summary[f"ma{ma_window}"] - 1) * 100
+
+    result = {
+        "returns": pd.DataFrame(returns, index=prices.index, columns=prices.columns, copy=False),
+        "moving_average": pd.DataFrame(ma, index=prices.index, columns=prices.columns, copy=False),
+        "rolling_volatility": pd.DataFrame(vol, index=prices.index, columns=prices.columns, copy=False),
+        "drawdown": pd.DataFrame(dd, index=prices.index, columns=prices.columns, copy=False),
+        "summary": summary,
+    }
+    if with_correlations:
+        corr = correlation_matrix(returns)
+        if len(corr) > 1:
+            # Average correlation to the rest of the universe (diagonal excluded)
+            diagonal = np.nan_to_num(np.diag(corr))
+            pairs = (~np.isnan(corr)).sum(axis=1) - (~np.isnan(np.diag(corr)))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                summary["mean_correlation"] = (np.nansum(corr, axis=1) - diagonal) / pairs
+        result["correlation"] = pd.DataFrame(corr, index=prices.columns, columns=prices.columns, copy=False)
+    return result
+
+
+def synthetic_prices(n_tickers, n_days, seed=0, start="2015-01-01"):
+    """Geometric Brownian motion panel with a shared market factor, for benchmarks."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, size=(n_days, 1))
+    beta = rng.uniform(0.5, 1.5, size=(1, n_tickers))
+    noise = rng.normal(0.0, 0.015, size=(n_days, n_tickers))
+    log_returns = market * beta + noise
+    prices = 100 * np.exp(np.cumsum(log_returns, axis=0))
+    dates = pd.bdate_range(start, periods=n_days)
+    return pd.DataFrame(prices, index=dates, columns=[f"T{i:05d}" for i in range(n_tickers)])
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+# Online (streaming) versions of the stock_analysis.py indicators for many
+# symbols at once. State is a set of flat arrays indexed by symbol plus ring
+# buffers for the windowed statistics; each tick costs O(1) regardless of how
+# much history has been seen. Results match the batch pandas path:
+#
+#   running_mean/std     stock["Daily_Return"].mean() / .std()       (Welford)
+#   ma                   stock["Close"].rolling(ma_window).mean()    (ring buffer)
+#   rolling_std          stock["Daily_Return"].rolling(vol_window).std()
+#   ema                  stock["Close"].ewm(span=ema_span, adjust=False).mean()
+#   drawdown             stock["Close"] / stock["Close"].cummax() - 1
+
+
+def _segments(sorted_idx):
+    """Run starts and lengths of a grouped index array, plus each element's run number and position in it."""
+    starts = np.flatnonzero(np.r_[True, sorted_idx[1:] != sorted_idx[:-1]])
+    lengths = np.diff(np.r_[starts, len(sorted_idx)])
+    seg = np.repeat(np.arange(len(starts)), lengths)
+    return starts, lengths, seg, np.arange(len(sorted_idx)) - starts[seg]
+
+
+class _WindowStats:
+    """Sliding-window mean and variance per symbol (Welford over a ring buffer)."""
+
+    def __init__(self, n_symbols, window):
+        self.window = window
+        self.buffer = np.zeros((n_symbols, window))
+        self.count = np.zeros(n_symbols, dtype=np.int64)
+        self.mean = np.zeros(n_symbols)
+        self.m2 = np.zeros(n_symbols)
+
+    def push(self, idx, x):
+        # idx holds each symbol at most once
+        slot = self.count[idx] % self.window
+        full = self.count[idx] >= self.window
+        old = self.buffer[idx, slot]
+        mean = self.mean[idx]
+        n = np.minimum(self.count[idx] + 1, self.window)
+
+        # Growing phase: plain Welford; full window: replace the oldest value
+        grow_mean = mean + (x - mean) / n
+        slide_mean = mean + (x - old) / self.window
+        new_mean = np.where(full, slide_mean, grow_mean)
+        self.m2[idx] += np.where(full, (x - old) * (x - new_mean + old - mean), (x - mean) * (x - new_mean))
+        self.mean[idx] = new_mean
+        self.buffer[idx, slot] = x
+        self.count[idx] += 1
+
+    def extend(self, idx, x):
+        # idx is grouped by symbol (stable-sorted), so each symbol's values are
+        # contiguous and in order; only the last `window` of them reach the buffer
+        starts, lengths, seg, pos = _segments(idx)
+        symbols = idx[starts]
+        keep = pos >= (lengths - self.window)[seg]
+        slot = (self.count[symbols][seg] + pos) % self.window
+        self.buffer[idx[keep], slot[keep]] = x[keep]
+        self.count[symbols] += lengths
+
+        # Recompute mean and m2 of each touched window (the first n slots while filling)
+        n = np.minimum(self.count[symbols], self.window)
+        buffer = self.buffer[symbols]
+        valid = np.arange(self.window) < n[:, None]
+        mean = np.where(valid, buffer, 0).sum(axis=1) / n
+        self.mean[symbols] = mean
+        self.m2[symbols] = (np.where(valid, buffer - mean[:, None], 0) ** 2).sum(axis=1)
+
+    def values(self, ddof=1):
+        full = self.count >= self.window
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.sqrt(np.maximum(self.m2, 0) / (self.window - ddof))
+        return np.where(full, self.mean, np.nan), np.where(full, std, np.nan)
+
+
+class OnlineIndicators:
+    """Running indicators for a fixed symbol universe, updated tick by tick."""
+
+    def __init__(self, symbols, ma_window=50, vol_window=20, ema_span=20):
+        self.symbols = list(symbols)
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        n = len(self.symbols)
+        self.ema_alpha = 2 / (ema_span + 1)
+        self.last_price = np.full(n, np.nan)
+        self.peak = np.full(n, np.nan)
+        self.ema = np.full(n, np.nan)
+        # Welford over every return seen
+        self.n_returns = np.zeros(n, dtype=np.int64)
+        self.return_mean = np.zeros(n)
+        self.return_m2 = np.zeros(n)
+        self._ma = _WindowStats(n, ma_window)
+        self._vol = _WindowStats(n, vol_window)
+
+    def codes(self, symbols):
+        """Symbol names -> state indices."""
+        return np.array([self._index[s] for s in symbols], dtype=np.intp)
+
+    def update(self, idx, prices):
+        """Apply a batch of ticks (state indices, prices) in order.
+
+        Non-finite prices (feeds send NaN for missing quotes) are skipped. A
+        symbol may appear any number of times in a batch: repeated symbols are
+        grouped and each group is folded into the state with segmented sums,
+        so a burst of ticks for one symbol costs the same as a mixed batch.
+        """
+        idx = np.asarray(idx, dtype=np.intp)
+        prices = np.asarray(prices, dtype=float)
+        valid = np.isfinite(prices)
+        if not valid.all():
+            idx, prices = idx[valid], prices[valid]
+        if len(idx) == 0:
+            return
+        if len(np.unique(idx)) == len(idx):
+            self._apply(idx, prices)
+        else:
+            order = np.argsort(idx, kind="stable")
+            self._apply_grouped(idx[order], prices[order])
+
+    def _apply(self, idx, price):
+        last = self.last_price[idx]
+        has_last = ~np.isnan(last)
+
+        # Daily return (%) from the previous tick of the same symbol
+        ret_idx = idx[has_last]
+        if len(ret_idx):
+            r = (price[has_last] / last[has_last] - 1) * 100
+            self.n_returns[ret_idx] += 1
+            delta = r - self.return_mean[ret_idx]
+            self.return_mean[ret_idx] += delta / self.n_returns[ret_idx]
+            self.return_m2[ret_idx] += delta * (r - self.return_mean[ret_idx])
+            self._vol.push(ret_idx, r)
+
+        self._ma.push(idx, price)
+        ema = self.ema[idx]
+        self.ema[idx] = np.where(np.isnan(ema), price, ema + self.ema_alpha * (price - ema))
+        self.peak[idx] = np.fmax(self.peak[idx], price)
+        self.last_price[idx] = price
+
+    def _apply_grouped(self, idx, price):
+        # idx is stable-sorted: every symbol's ticks are one contiguous run, in order
+        starts, lengths, seg, pos = _segments(idx)
+        symbols = idx[starts]
+        n_seg = len(starts)
+
+        # Returns from the previous tick of the same symbol (the stored last price for a run's first tick)
+        prev = np.empty_like(price)
+        prev[1:] = price[:-1]
+        prev[starts] = self.last_price[symbols]
+        has_prev = ~np.isnan(prev)
+        r = (price[has_prev] / prev[has_prev] - 1) * 100
+        r_seg = seg[has_prev]
+        if len(r):
+            # Chan et al. merge of each run's mean/m2 into the running Welford state
+            nb = np.bincount(r_seg, minlength=n_seg)
+            has = nb > 0
+            mb = np.bincount(r_seg, r, minlength=n_seg)[has] / nb[has]
+            m2b = np.bincount(r_seg, (r - np.repeat(mb, nb[has])) ** 2, minlength=n_seg)[has]
+            sym, nb = symbols[has], nb[has]
+            na, ma = self.n_returns[sym], self.return_mean[sym]
+            n = na + nb
+            delta = mb - ma
+            self.return_mean[sym] = ma + delta * nb / n
+            self.return_m2[sym] += m2b + delta ** 2 * na * nb / n
+            self.n_returns[sym] = n
+            self._vol.extend(idx[has_prev], r)
+
+        self._ma.extend(idx, price)
+
+        # EMA after a run of n ticks: b^n * ema0 + a * sum(b^(n-1-j) * p_j), b = 1 - alpha;
+        # a symbol without an EMA yet starts from its first price
+        a, b = self.ema_alpha, 1 - self.ema_alpha
+        ema0 = self.ema[symbols]
+        fresh = np.isnan(ema0)
+        weight = a * b ** (lengths[seg] - 1 - pos)
+        first = fresh[seg] & (pos == 0)
+        weight[first] = b ** (lengths[seg][first] - 1)
+        self.ema[symbols] = np.bincount(seg, weight * price, minlength=n_seg) + np.where(fresh, 0, b ** lengths * ema0)
+
+        self.peak[symbols] = np.fmax(self.peak[symbols], np.maximum.reduceat(price, starts))
+        self.last_price[symbols] = price[starts + lengths - 1]
+
+    def snapshot(self):
+        """Current value of every indicator, one row per symbol."""
+        ma, _ = self._ma.values()
+        _, rolling_std = self._vol.values()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            running_std = np.sqrt(self.return_m2 / (self.n_returns - 1))
+        return pd.DataFrame({
+            "last_price": self.last_price,
+            "running_mean_return_pct": np.where(self.n_returns > 0, self.return_mean, np.nan),
+            "running_std_return_pct": np.where(self.n_returns > 1, running_std, np.nan),
+            "ma": ma,
+            "rolling_std_return_pct": rolling_std,
+            "ema": self.ema,
+            "drawdown_pct": (self.last_price / self.peak - 1) * 100,
+        }, index=pd.Index(self.symbols, name="symbol"))
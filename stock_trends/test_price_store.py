@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from price_store import FIELDS, PriceStore
+
+TICKERS = ["AAA", "BBB"]
+
+
+def make_prices(start="2022-01-03", end="2023-12-29"):
+    dates = pd.bdate_range(start, end, name="Date")
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (len(dates), len(TICKERS))), axis=0))
+    # Every field carries the close, field-major like a yfinance download
+    return pd.DataFrame(np.tile(close, len(FIELDS)), index=dates,
+                        columns=pd.MultiIndex.from_product([FIELDS, TICKERS]))
+
+
+class StubDownloader:
+    """Serves slices of a prepared frame and records every call."""
+
+    def __init__(self, prices, missing=()):
+        self.prices = prices
+        self.missing = set(missing)
+        self.calls = []
+
+    def __call__(self, tickers, start, end):
+        self.calls.append((sorted(tickers), start, end))
+        data = self.prices.loc[start:end, (slice(None), list(tickers))]
+        data = data.loc[data.index < pd.Timestamp(end)].copy()
+        for ticker in self.missing & set(tickers):
+            data.loc[:, (slice(None), ticker)] = np.nan
+        return data
+
+
+@pytest.fixture
+def prices():
+    return make_prices()
+
+
+def test_first_fetch(tmp_path, prices):
+    store = PriceStore(str(tmp_path / "prices"))
+    download = StubDownloader(prices)
+    assert store.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=download) == 2
+    assert download.calls == [(TICKERS, "2023-01-01", "2023-07-01")]
+
+    reopened = PriceStore(str(tmp_path / "prices"))
+    expected = prices["Close"].loc["2023-01-01":"2023-06-30"]
+    pd.testing.assert_frame_equal(reopened.frame("Close"), expected, check_names=False, check_freq=False,
+                                  check_index_type=False)
+    assert reopened.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=download) == 0
+    assert len(download.calls) == 1
+
+
+def test_incremental_refresh_downloads_only_new_days(tmp_path, prices):
+    store = PriceStore(str(tmp_path / "prices"))
+    download = StubDownloader(prices)
+    store.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=download)
+    store.refresh(TICKERS, "2023-01-01", "2023-10-01", downloader=download)
+    assert download.calls[1] == (TICKERS, "2023-07-01", "2023-10-01")
+    frame = store.frame("Close", start="2023-01-01", end="2023-10-01")
+    pd.testing.assert_frame_equal(frame, prices["Close"].loc["2023-01-01":"2023-09-30"], check_names=False,
+                                  check_freq=False, check_index_type=False)
+
+
+def test_backfill_when_start_moves_earlier(tmp_path, prices):
+    store = PriceStore(str(tmp_path / "prices"))
+    download = StubDownloader(prices)
+    store.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=download)
+    store.refresh(["AAA"], "2022-01-01", "2023-07-01", downloader=download)
+    assert download.calls[1] == (["AAA"], "2022-01-01", "2023-01-01")
+    assert store.frame("Close", ["AAA"]).index[0] == pd.Timestamp("2022-01-03")
+    pd.testing.assert_series_equal(store.frame("Close", ["AAA"])["AAA"], prices["Close"]["AAA"].loc[:"2023-06-30"],
+                                   check_names=False, check_freq=False, check_index_type=False)
+    assert PriceStore(str(tmp_path / "prices")).fetched_from["AAA"] == "2022-01-01"
+
+
+def test_empty_download_is_not_marked_fetched(tmp_path, prices):
+    store = PriceStore(str(tmp_path / "prices"))
+    failing = StubDownloader(prices, missing=["BBB"])
+    assert store.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=failing) == 1
+    assert "BBB" not in store.fetched_until
+    assert store.frame("Close", ["BBB"])["BBB"].isna().all()
+
+    # Nothing at all comes back either
+    assert store.refresh(["BBB"], "2023-01-01", "2023-07-01", downloader=lambda *args: pd.DataFrame()) == 0
+    assert "BBB" not in store.fetched_until
+
+    download = StubDownloader(prices)
+    assert store.refresh(TICKERS, "2023-01-01", "2023-07-01", downloader=download) == 1
+    assert download.calls == [(["BBB"], "2023-01-01", "2023-07-01")]
+    assert store.frame("Close", ["BBB"])["BBB"].notna().all()
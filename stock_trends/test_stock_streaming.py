@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+from stock_streaming import OnlineIndicators
+
+
+def test_nan_tick_is_skipped():
+    online = OnlineIndicators(["A"], ma_window=5, vol_window=5, ema_span=5)
+    online.update([0, 0, 0], [1.0, np.nan, 2.0])
+    for price in np.linspace(2, 3, 100):
+        online.update([0], [price])
+    assert np.isfinite(online.snapshot().to_numpy()).all()
+
+
+def test_nan_ticks_match_pandas_without_them():
+    prices = pd.Series(np.linspace(10, 20, 60) + np.sin(np.arange(60)))
+    ticks = prices.copy()
+    ticks[[3, 17, 40]] = np.nan
+    online = OnlineIndicators(["A"], ma_window=10, vol_window=5, ema_span=8)
+    online.update(np.zeros(len(ticks), dtype=np.intp), ticks.to_numpy())
+
+    clean = ticks.dropna()
+    snapshot = online.snapshot().iloc[0]
+    assert np.isclose(snapshot["ma"], clean.rolling(10).mean().iloc[-1])
+    assert np.isclose(snapshot["ema"], clean.ewm(span=8, adjust=False).mean().iloc[-1])
+    assert np.isclose(snapshot["running_std_return_pct"], (clean.pct_change() * 100).std())
+
+
+def test_grouped_batch_matches_tick_by_tick():
+    rng = np.random.default_rng(0)
+    idx = rng.integers(0, 4, 500)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 500)))
+    batched = OnlineIndicators(list("ABCD"), ma_window=7, vol_window=3, ema_span=4)
+    single = OnlineIndicators(list("ABCD"), ma_window=7, vol_window=3, ema_span=4)
+    for start in range(0, 500, 97):
+        batched.update(idx[start:start + 97], prices[start:start + 97])
+    for i, price in zip(idx, prices):
+        single.update([i], [price])
+    pd.testing.assert_frame_equal(batched.snapshot(), single.snapshot(), rtol=1e-9)
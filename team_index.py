@@ -0,0 +1,141 @@
+import json
+import os
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+# Team identity shared by the NFL and CBB loaders. A TeamIndex maps every
+# normalized name a team has gone by (plus codes and known alternate spellings)
+# to one integer team id and keeps the name history. Loaders turn name columns
+# into categoricals whose categories are the canonical names in id order, so
+# the codes are the team ids: joins and groupbys across datasets run on those
+# ints, and a relocated franchise or renamed school stays one team.
+#
+# Indexes are built once from their source files and persisted as JSON next to
+# the data; cached_index() rebuilds one only when its source key changes.
+
+INDEX_VERSION = 1
+
+# sports-reference marks tournament teams with an "NCAA" tag that the stats
+# table parser glues onto the school name ("AuburnNCAA")
+_TOURNAMENT_TAG = re.compile(r"(?<=\S)NCAA$")
+_DROPPED = re.compile(r"['’.&]")
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_name(name):
+    """Lowercase ASCII words of a team name, e.g. "St. John's (NY)" -> "saint johns ny".
+
+    Periods, apostrophes and ampersands are dropped ("N.C. State" == "NC State"),
+    other punctuation separates words, and "St" is "saint" as the first word and
+    "state" anywhere else ("Iowa St." == "Iowa State").
+    """
+    name = _TOURNAMENT_TAG.sub("", str(name).strip())
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    words = _SEPARATORS.sub(" ", _DROPPED.sub("", name)).split()
+    words = [("saint" if i == 0 else "state") if word == "st" else word for i, word in enumerate(words)]
+    return " ".join(words)
+
+
+class TeamIndex:
+    """Normalized team name -> integer team id, with every name each team has used."""
+
+    def __init__(self, teams, history, aliases=None, source=None):
+        # teams[i] is the canonical (most recent) name of team id i; history has
+        # one row per name: team_id, name, first_season, last_season
+        self.teams = list(teams)
+        self.history = history.reset_index(drop=True)
+        self.aliases = dict(aliases or {})
+        self.source = source
+        self.dtype = pd.CategoricalDtype(self.teams)
+        self.keys = {}
+        for alias, team_id in self.aliases.items():
+            self.keys[normalize_name(alias)] = int(team_id)
+        # Real names win over aliases that normalize the same way
+        for name, team_id in zip(self.history["name"], self.history["team_id"]):
+            self.keys[normalize_name(name)] = int(team_id)
+
+    @classmethod
+    def from_history(cls, history, aliases=None, source=None):
+        """Build from rows of (team, name, first_season, last_season), where team
+        is any key shared by all names of one team (e.g. a franchise code);
+        aliases maps extra spellings or codes to those keys. Ids follow the
+        sorted team keys; a team's canonical name is its most recently used one."""
+        history = history.copy()
+        for col in ["first_season", "last_season"]:
+            history[col] = history[col].astype("Int64") if col in history.columns else pd.NA
+        groups = sorted(history["team"].unique())
+        ids = {team: i for i, team in enumerate(groups)}
+        history["team_id"] = history["team"].map(ids).astype(np.int32)
+        latest = history.sort_values(["team_id", "last_season"], ascending=[True, False], na_position="last",
+                                     kind="stable").drop_duplicates("team_id")
+        history = history.sort_values(["team_id", "first_season", "name"], na_position="last", ignore_index=True)
+        aliases = {alias: ids[team] for alias, team in (aliases or {}).items() if team in ids}
+        return cls(latest["name"].tolist(), history[["team_id", "name", "first_season", "last_season"]],
+                   aliases, source)
+
+    def __len__(self):
+        return len(self.teams)
+
+    def resolve(self, names):
+        """Team id for each name (-1 where unknown). Each distinct name is normalized once."""
+        codes, uniques = pd.factorize(pd.Series(names, copy=False))
+        lookup = np.array([self.keys.get(normalize_name(name), -1) for name in uniques] + [-1], dtype=np.int32)
+        return lookup[codes]
+
+    def team_id(self, name):
+        team_id = self.keys.get(normalize_name(name), -1)
+        if team_id < 0:
+            raise KeyError(f"Unknown team: {name!r}")
+        return team_id
+
+    def categorical(self, names):
+        """Names as a categorical of canonical names whose codes are the team ids (NaN where unknown)."""
+        return pd.Categorical.from_codes(self.resolve(names), dtype=self.dtype)
+
+    def unmatched(self, names):
+        """Distinct names the index cannot resolve."""
+        names = pd.Series(pd.unique(pd.Series(names, copy=False).dropna()))
+        return sorted(names[self.resolve(names) < 0].astype(str))
+
+    def names_of(self, teams):
+        """Every name the given teams have played under."""
+        ids = self.resolve(list(teams))
+        return self.history.loc[self.history["team_id"].isin(ids[ids >= 0]), "name"].tolist()
+
+    def to_dict(self):
+        history = self.history.astype(object).where(self.history.notna(), None)
+        return {"version": INDEX_VERSION, "source": self.source, "teams": self.teams,
+                "history": history.to_dict("records"), "aliases": self.aliases}
+
+    @classmethod
+    def from_dict(cls, data):
+        history = pd.DataFrame(data["history"], columns=["team_id", "name", "first_season", "last_season"])
+        history["team_id"] = history["team_id"].astype(np.int32)
+        for col in ["first_season", "last_season"]:
+            history[col] = history[col].astype("Int64")
+        return cls(data["teams"], history, data["aliases"], data["source"])
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.to_dict(), f, indent=1)
+        os.replace(path + ".tmp", path)
+        return path
+
+
+def cached_index(path, source, build):
+    """The index persisted at path if it was built from source, else build(source), saved."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("version") == INDEX_VERSION and data.get("source") == source:
+            return TeamIndex.from_dict(data)
+    except (OSError, ValueError, KeyError):
+        pass
+    index = build(source)
+    index.source = source
+    index.save(path)
+    return index